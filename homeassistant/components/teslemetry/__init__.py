@@ -1,9 +1,10 @@
 """Teslemetry integration."""
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from functools import partial
-from typing import Any, Final, cast
+import time
+from typing import Any, Final
 
 from aiohttp import ClientError
 from tesla_fleet_api.const import Scope
@@ -14,22 +15,18 @@ from tesla_fleet_api.exceptions import (
     SubscriptionRequired,
     TeslaFleetError,
 )
-from tesla_fleet_api.teslemetry import Teslemetry
+from tesla_fleet_api.teslemetry import EnergySite, Teslemetry
 from teslemetry_stream import TeslemetryStream
+from teslemetry_stream.const import SSE_ACCOUNT_TOPICS
 
 from homeassistant.components.application_credentials import (
     ClientCredential,
     async_import_client_credential,
 )
-from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ACCESS_TOKEN, Platform
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.exceptions import (
-    ConfigEntryAuthFailed,
-    ConfigEntryNotReady,
-    OAuth2TokenRequestError,
-    OAuth2TokenRequestReauthError,
-)
+from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import (
     config_validation as cv,
     device_registry as dr,
@@ -45,18 +42,28 @@ from homeassistant.helpers.config_entry_oauth2_flow import (
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.typing import ConfigType
 
+from .cache import TeslemetrySetupCache, live_status_snapshot
 from .const import CLIENT_ID, DOMAIN, LOGGER, VEHICLE_ISSUE_LEARN_MORE
 from .coordinator import (
     TeslemetryEnergyHistoryCoordinator,
     TeslemetryEnergySiteInfoCoordinator,
     TeslemetryEnergySiteLiveCoordinator,
+    TeslemetryKeyedCoordinator,
     TeslemetryMetadataCoordinator,
     TeslemetryVehicleDataCoordinator,
 )
-from .helpers import async_update_device_sw_version, flatten
+from .governor import TeslemetryCreditGovernor
+from .helpers import async_update_device_sw_version
 from .logship import CONF_SHIP_LOGS_TO_CLICKSTACK, async_get_or_create_logship
-from .models import TeslemetryData, TeslemetryEnergyData, TeslemetryVehicleData
+from .models import (
+    TeslemetryData,
+    TeslemetryEnergyData,
+    TeslemetryProducts,
+    TeslemetryVehicleData,
+)
+from .oauth import TeslemetryAccessToken
 from .services import async_setup_services
+from .stream import TeslemetryDispatchStream, TeslemetryStreamWriter
 
 PLATFORMS: Final = [
     Platform.BINARY_SENSOR,
@@ -74,7 +81,12 @@ PLATFORMS: Final = [
     Platform.UPDATE,
 ]
 
+# Maximum number of energy site live status requests in flight during setup
+ENERGY_SITE_SETUP_CONCURRENCY: Final = 4
+
 type TeslemetryConfigEntry = ConfigEntry[TeslemetryData]
+# What an energy site is created from: its API, product, Powerwall and device
+type EnergySiteSetup = tuple[EnergySite, dict[str, Any], bool, DeviceInfo]
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
@@ -90,50 +102,38 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
-async def _get_access_token(oauth_session: OAuth2Session) -> str:
-    """Get a valid access token, refreshing if necessary."""
-    LOGGER.debug(
-        "Token valid: %s, expires_at: %s",
-        oauth_session.valid_token,
-        oauth_session.token.get("expires_at"),
-    )
-    setup_in_progress = (
-        oauth_session.config_entry.state is ConfigEntryState.SETUP_IN_PROGRESS
-    )
+async def _async_get_initial_live_status(
+    energy_site: EnergySite, semaphore: asyncio.Semaphore
+) -> Any:
+    """Fetch an energy site's live status during setup, raising auth errors properly."""
     try:
-        await oauth_session.async_ensure_token_valid()
-    except OAuth2TokenRequestReauthError as err:
-        if setup_in_progress:
-            raise ConfigEntryAuthFailed(
-                translation_domain=DOMAIN,
-                translation_key="auth_failed",
-            ) from err
-        # Not in setup: let the coordinator's own OAuth2TokenRequestError
-        # handling stop polling and (re)start reauth without tearing
-        # down the already-loaded entry.
-        oauth_session.config_entry.async_start_reauth(oauth_session.hass)
-        raise
-    except OAuth2TokenRequestError as err:
-        # Recoverable (e.g. 429/5xx). During setup this backs off via the
-        # normal ConfigEntryNotReady retry; once loaded, let it propagate so
-        # the coordinator treats it as a transient failed update instead.
-        if setup_in_progress:
-            raise ConfigEntryNotReady(
-                translation_domain=DOMAIN,
-                translation_key="not_ready_connection_error",
-            ) from err
-        raise
-    except (KeyError, TypeError) as err:
+        async with semaphore:
+            return (await energy_site.live_status())["response"]
+    except InvalidToken as e:
         raise ConfigEntryAuthFailed(
             translation_domain=DOMAIN,
-            translation_key="token_data_malformed",
-        ) from err
-    except ClientError as err:
+            translation_key="auth_failed_invalid_token",
+        ) from e
+    except LoginRequired as e:
+        raise ConfigEntryAuthFailed(
+            translation_domain=DOMAIN,
+            translation_key="auth_failed_login_required",
+        ) from e
+    except SubscriptionRequired as e:
+        raise ConfigEntryAuthFailed(
+            translation_domain=DOMAIN,
+            translation_key="auth_failed_subscription_required",
+        ) from e
+    except Forbidden as e:
+        raise ConfigEntryAuthFailed(
+            translation_domain=DOMAIN,
+            translation_key="auth_failed_invalid_token",
+        ) from e
+    except TeslaFleetError as e:
         raise ConfigEntryNotReady(
             translation_domain=DOMAIN,
-            translation_key="not_ready_connection_error",
-        ) from err
-    return cast(str, oauth_session.token[CONF_ACCESS_TOKEN])
+            translation_key="not_ready_api_error",
+        ) from e
 
 
 def _get_subscribed_ids_from_metadata(
@@ -153,17 +153,40 @@ def _get_subscribed_ids_from_metadata(
 def _setup_dynamic_discovery(
     hass: HomeAssistant,
     entry: TeslemetryConfigEntry,
+    teslemetry: Teslemetry,
     metadata_coordinator: TeslemetryMetadataCoordinator,
     known_vins: set[str],
     known_site_ids: set[str],
 ) -> None:
-    """Set up dynamic device discovery via reload when subscriptions change."""
+    """Add and remove products when their subscriptions change."""
+    updating = False
+
+    async def _async_update(current_vins: set[str], current_site_ids: set[str]) -> None:
+        """Update the products, and remember the subscriptions once done."""
+        nonlocal updating
+        try:
+            if await _async_update_products(
+                hass,
+                entry,
+                teslemetry,
+                added_vins=current_vins - known_vins,
+                removed_vins=known_vins - current_vins,
+                added_site_ids=current_site_ids - known_site_ids,
+                removed_site_ids=known_site_ids - current_site_ids,
+            ):
+                known_vins.clear()
+                known_vins.update(current_vins)
+                known_site_ids.clear()
+                known_site_ids.update(current_site_ids)
+        finally:
+            updating = False
 
     @callback
     def _handle_metadata_update() -> None:
         """Handle metadata coordinator update - detect subscription changes."""
+        nonlocal updating
         data = metadata_coordinator.data
-        if not data:
+        if not data or updating:
             return
 
         current_vins, current_site_ids = _get_subscribed_ids_from_metadata(data)
@@ -178,13 +201,18 @@ def _setup_dynamic_discovery(
                 "Tesla subscription changes detected "
                 "(added vehicles: %s, removed vehicles: %s, "
                 "added energy sites: %s, removed energy sites: %s), "
-                "reloading integration",
+                "updating products",
                 added_vins or "none",
                 removed_vins or "none",
                 added_sites or "none",
                 removed_sites or "none",
             )
-            hass.config_entries.async_schedule_reload(entry.entry_id)
+            updating = True
+            entry.async_create_background_task(
+                hass,
+                _async_update(current_vins, current_site_ids),
+                "Teslemetry update products",
+            )
 
     entry.async_on_unload(
         metadata_coordinator.async_add_listener(_handle_metadata_update)
@@ -228,12 +256,13 @@ def _setup_vehicle_repairs(
     hass: HomeAssistant,
     entry: TeslemetryConfigEntry,
     metadata_coordinator: TeslemetryMetadataCoordinator,
-    vins: set[str],
     vehicle_metadata: dict[str, Any],
 ) -> None:
     """Track vehicle metadata issues and keep repair issues in sync."""
 
-    _async_update_vehicle_repairs(hass, entry, vins, vehicle_metadata)
+    _async_update_vehicle_repairs(
+        hass, entry, _vins(entry.runtime_data.vehicles), vehicle_metadata
+    )
 
     @callback
     def _handle_metadata_update() -> None:
@@ -241,7 +270,9 @@ def _setup_vehicle_repairs(
         data = metadata_coordinator.data
         if not data:
             return
-        _async_update_vehicle_repairs(hass, entry, vins, data["vehicles"])
+        _async_update_vehicle_repairs(
+            hass, entry, _vins(entry.runtime_data.vehicles), data["vehicles"]
+        )
 
     entry.async_on_unload(
         metadata_coordinator.async_add_listener(_handle_metadata_update)
@@ -446,55 +477,84 @@ async def async_setup_entry(hass: HomeAssistant, entry: TeslemetryConfigEntry) -
     session = async_get_clientsession(hass)
 
     # Create API connection
-    access_token = partial(_get_access_token, oauth_session)
+    access_token = TeslemetryAccessToken(hass, oauth_session)
+    entry.async_on_unload(access_token.async_start())
     teslemetry = Teslemetry(
         session=session,
         access_token=access_token,
     )
     # Fetch metadata through the coordinator so it owns the data the platforms
     # read at setup (e.g. per-vehicle config for seat heaters).
-    metadata_coordinator = TeslemetryMetadataCoordinator(hass, entry, teslemetry)
-    try:
-        products_call, _ = await asyncio.gather(
-            teslemetry.products(),
-            metadata_coordinator.async_config_entry_first_refresh(),
-        )
-    except InvalidToken as e:
-        raise ConfigEntryAuthFailed(
-            translation_domain=DOMAIN,
-            translation_key="auth_failed_invalid_token",
-        ) from e
-    except LoginRequired as e:
-        raise ConfigEntryAuthFailed(
-            translation_domain=DOMAIN,
-            translation_key="auth_failed_login_required",
-        ) from e
-    except SubscriptionRequired as e:
-        raise ConfigEntryAuthFailed(
-            translation_domain=DOMAIN,
-            translation_key="auth_failed_subscription_required",
-        ) from e
-    except TeslaFleetError as e:
-        raise ConfigEntryNotReady(
-            translation_domain=DOMAIN,
-            translation_key="not_ready_api_error",
-        ) from e
+    governor = TeslemetryCreditGovernor()
+    metadata_coordinator = TeslemetryMetadataCoordinator(
+        hass, entry, teslemetry, governor, access_token
+    )
+    # While Home Assistant starts, set up from the last good data and fetch it
+    # again in the background, so a slow or failing API does not hold up the
+    # start. Setups and reloads while running always fetch first.
+    cache = TeslemetrySetupCache(hass, entry.entry_id)
+    cached = None
+    if hass.state is not CoreState.running:
+        cached = await cache.async_load()
+
+    if cached is not None:
+        products: list[dict[str, Any]] = cached["products"]
+        metadata_coordinator.async_set_updated_data(cached["metadata"])
+    else:
+        try:
+            products_call, _ = await asyncio.gather(
+                teslemetry.products(),
+                metadata_coordinator.async_config_entry_first_refresh(),
+            )
+        except InvalidToken as e:
+            raise ConfigEntryAuthFailed(
+                translation_domain=DOMAIN,
+                translation_key="auth_failed_invalid_token",
+            ) from e
+        except LoginRequired as e:
+            raise ConfigEntryAuthFailed(
+                translation_domain=DOMAIN,
+                translation_key="auth_failed_login_required",
+            ) from e
+        except SubscriptionRequired as e:
+            raise ConfigEntryAuthFailed(
+                translation_domain=DOMAIN,
+                translation_key="auth_failed_subscription_required",
+            ) from e
+        except TeslaFleetError as e:
+            raise ConfigEntryNotReady(
+                translation_domain=DOMAIN,
+                translation_key="not_ready_api_error",
+            ) from e
+        products = products_call["response"]
+
+    cached_sites: dict[str, dict[str, Any]] = {
+        site_id: site
+        for site_id, site in (cached["energy_sites"] if cached else {}).items()
+        if isinstance(site.get("site_info"), dict)
+    }
+    cached_vehicles: dict[str, dict[str, Any]] = (
+        cached.get("vehicles", {}) if cached else {}
+    )
 
     metadata = metadata_coordinator.data
     scopes = metadata["scopes"]
     region = metadata["region"]
     vehicle_metadata = metadata["vehicles"]
     energy_site_metadata = metadata["energy_sites"]
-    products = products_call["response"]
 
     device_registry = dr.async_get(hass)
 
     # Create array of classes
     vehicles: list[TeslemetryVehicleData] = []
     energysites: list[TeslemetryEnergyData] = []
+    entry.async_on_unload(partial(_async_remove_products, vehicles, energysites))
+
+    # Energy sites are classified first and their live status fetched after
+    energy_site_setups: list[EnergySiteSetup] = []
 
     # Create the stream (created lazily when first vehicle is found)
-    stream: TeslemetryStream | None = None
+    stream: TeslemetryDispatchStream | None = None
 
     # Remember each device identifier we create
     current_devices: set[tuple[str, str]] = set()
@@ -513,7 +573,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: TeslemetryConfigEntry) -
 
             # Create stream if required (for first vehicle)
             if not stream:
-                stream = TeslemetryStream(
+                stream = TeslemetryDispatchStream(
+                    hass,
+                    entry,
                     session,
                     access_token,
                     server=f"{region.lower()}.teslemetry.com",
@@ -521,45 +583,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: TeslemetryConfigEntry) -
                     manual=True,
                 )
 
-            # Remove the protobuff 'cached_data' that we do not use to save memory
-            product.pop("cached_data", None)
-            vehicle = teslemetry.vehicles.create(vin)
-            coordinator = TeslemetryVehicleDataCoordinator(
-                hass, entry, vehicle, product
-            )
-            firmware = vehicle_metadata[vin].get("firmware")
-            device = DeviceInfo(
-                identifiers={(DOMAIN, vin)},
-                manufacturer="Tesla",
-                configuration_url=f"https://teslemetry.com/console/vehicle/{vin}",
-                name=product["display_name"],
-                model=vehicle.model,
-                model_id=vin[3],
-                serial_number=vin,
-                sw_version=firmware,
-            )
-
-            poll = vehicle_metadata[vin].get("polling", False)
-
-            entry.async_on_unload(
-                stream.async_add_listener(
-                    create_handle_vehicle_stream(vin, coordinator),
-                    {"vin": vin},
-                )
-            )
-            stream_vehicle = stream.get_vehicle(vin)
-
             vehicles.append(
-                TeslemetryVehicleData(
-                    api=vehicle,
-                    config_entry=entry,
-                    coordinator=coordinator,
-                    poll=poll,
-                    stream=stream,
-                    stream_vehicle=stream_vehicle,
-                    vin=vin,
-                    firmware=firmware or "Unknown",
-                    device=device,
+                _create_vehicle(
+                    hass,
+                    entry,
+                    teslemetry,
+                    governor,
+                    access_token,
+                    stream,
+                    product,
+                    vehicle_metadata,
                 )
             )
 
@@ -570,103 +603,52 @@ async def async_setup_entry(hass: HomeAssistant, entry: TeslemetryConfigEntry) -
                 "access"
             )
         ):
-            site_id = product["energy_site_id"]
-
-            powerwall = (
-                product["components"]["battery"] or product["components"]["solar"]
-            )
-            wall_connector = "wall_connectors" in product["components"]
-            if not powerwall and not wall_connector:
-                LOGGER.debug(
-                    "Skipping Energy Site %s as it has no components",
-                    site_id,
-                )
+            if (setup := _energy_site_setup(teslemetry, product)) is None:
                 continue
+            current_devices.add((DOMAIN, str(product["energy_site_id"])))
+            current_devices |= {
+                (DOMAIN, c["din"])
+                for c in product["components"].get("wall_connectors", [])
+            }
+            energy_site_setups.append(setup)
+
+    # Fetch every site's live status concurrently so setup latency follows the
+    # slowest site rather than the sum, bounded to avoid bursting the API.
+    semaphore = asyncio.Semaphore(ENERGY_SITE_SETUP_CONCURRENCY)
+
+    async def _async_live_status(energy_site: EnergySite) -> Any:
+        """Return the cached live status of a site, or fetch it."""
+        if (site := cached_sites.get(str(energy_site.energy_site_id))) is not None:
+            return site.get("live_status")
+        return await _async_get_initial_live_status(energy_site, semaphore)
+
+    live_statuses = await asyncio.gather(
+        *(_async_live_status(energy_site) for energy_site, *_ in energy_site_setups)
+    )
 
-            current_devices.add((DOMAIN, str(site_id)))
-            if wall_connector:
-                current_devices |= {
-                    (DOMAIN, c["din"]) for c in product["components"]["wall_connectors"]
-                }
-
-            energy_site = teslemetry.energySites.create(site_id)
-            device = DeviceInfo(
-                identifiers={(DOMAIN, str(site_id))},
-                manufacturer="Tesla",
-                configuration_url=f"https://teslemetry.com/console/energy/{site_id}",
-                name=product.get("site_name", "Energy Site"),
-                serial_number=str(site_id),
-            )
+    energysites.extend(
+        _create_energy_site(hass, entry, governor, access_token, setup, live_status)
+        for setup, live_status in zip(energy_site_setups, live_statuses, strict=True)
+    )
 
-            # For initial setup, raise auth errors properly
-            try:
-                live_status = (await energy_site.live_status())["response"]
-            except InvalidToken as e:
-                raise ConfigEntryAuthFailed(
-                    translation_domain=DOMAIN,
-                    translation_key="auth_failed_invalid_token",
-                ) from e
-            except LoginRequired as e:
-                raise ConfigEntryAuthFailed(
-                    translation_domain=DOMAIN,
-                    translation_key="auth_failed_login_required",
-                ) from e
-            except SubscriptionRequired as e:
-                raise ConfigEntryAuthFailed(
-                    translation_domain=DOMAIN,
-                    translation_key="auth_failed_subscription_required",
-                ) from e
-            except Forbidden as e:
-                raise ConfigEntryAuthFailed(
-                    translation_domain=DOMAIN,
-                    translation_key="auth_failed_invalid_token",
-                ) from e
-            except TeslaFleetError as e:
-                raise ConfigEntryNotReady(
-                    translation_domain=DOMAIN,
-                    translation_key="not_ready_api_error",
-                ) from e
-
-            energysites.append(
-                TeslemetryEnergyData(
-                    api=energy_site,
-                    live_coordinator=(
-                        TeslemetryEnergySiteLiveCoordinator(
-                            hass, entry, energy_site, live_status
-                        )
-                        if isinstance(live_status, dict)
-                        else None
-                    ),
-                    info_coordinator=TeslemetryEnergySiteInfoCoordinator(
-                        hass, entry, energy_site, product
-                    ),
-                    history_coordinator=(
-                        TeslemetryEnergyHistoryCoordinator(hass, entry, energy_site)
-                        if powerwall
-                        else None
-                    ),
-                    id=site_id,
-                    device=device,
-                )
-            )
+    _async_set_cached_data(vehicles, energysites, cached_vehicles, cached_sites)
 
-    # Run all first refreshes
-    await asyncio.gather(
-        *(async_setup_stream(hass, entry, vehicle) for vehicle in vehicles),
-        *(
-            vehicle.coordinator.async_config_entry_first_refresh()
-            for vehicle in vehicles
-            if vehicle.poll
-        ),
-        *(
-            energysite.info_coordinator.async_config_entry_first_refresh()
-            for energysite in energysites
-        ),
-    )
+    # Products whose entities depend on a first refresh are added once it is done
+    pending_vehicles = [
+        vehicle
+        for vehicle in vehicles
+        if vehicle.poll and vehicle.vin not in cached_vehicles
+    ]
+    pending_sites = [
+        energysite
+        for energysite in energysites
+        if str(energysite.id) not in cached_sites
+    ]
 
     # Setup energy devices with models, versions, and listeners
     for energysite in energysites:
-        async_setup_energy_device(hass, entry, energysite, device_registry)
+        if energysite not in pending_sites:
+            async_setup_energy_device(hass, entry, energysite, device_registry)
 
     # Remove devices that are no longer present
     for device_entry in dr.async_entries_for_config_entry(
@@ -679,42 +661,573 @@ async def async_setup_entry(hass: HomeAssistant, entry: TeslemetryConfigEntry) -
             device_registry.async_remove_device(device_entry.id)
 
     entry.runtime_data = TeslemetryData(
-        vehicles=vehicles,
-        energysites=energysites,
+        vehicles=[vehicle for vehicle in vehicles if vehicle not in pending_vehicles],
+        energysites=[
+            energysite for energysite in energysites if energysite not in pending_sites
+        ],
         scopes=scopes,
         stream=stream,
         metadata_coordinator=metadata_coordinator,
+        governor=governor,
+        access_token=access_token,
+    )
+    # Products added after setup are only in the runtime data
+    entry.async_on_unload(
+        partial(
+            _async_remove_products,
+            entry.runtime_data.vehicles,
+            entry.runtime_data.energysites,
+        )
     )
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    for vehicle in pending_vehicles:
+        _async_add_on_first_refresh(
+            hass,
+            entry,
+            vehicle.coordinator,
+            TeslemetryProducts([vehicle], [], scopes),
+        )
+    for energysite in pending_sites:
+        _async_add_on_first_refresh(
+            hass,
+            entry,
+            energysite.info_coordinator,
+            TeslemetryProducts([], [energysite], scopes),
+        )
+
     _setup_dynamic_discovery(
         hass,
         entry,
+        teslemetry,
         metadata_coordinator,
         known_vins,
         known_site_ids,
     )
 
-    _setup_vehicle_repairs(
+    _setup_vehicle_repairs(hass, entry, metadata_coordinator, vehicle_metadata)
+
+    if stream:
+        stream.async_start()
+        _async_listen_stream(hass, entry, governor, stream)
+    elif energysites:
+        # Without vehicles the stream is only opened for its credit events
+        _async_listen_stream(
+            hass,
+            entry,
+            governor,
+            TeslemetryStream(
+                session,
+                access_token,
+                server=f"{region.lower()}.teslemetry.com",
+                manual=True,
+                topics=SSE_ACCOUNT_TOPICS,
+            ),
+        )
+
+    entry.async_create_task(
         hass,
-        entry,
-        metadata_coordinator,
-        {vehicle.vin for vehicle in vehicles},
-        vehicle_metadata,
+        _async_first_refresh(
+            entry,
+            cache if cached is None else None,
+            products,
+            pending_vehicles,
+            pending_sites,
+        ),
+        "Teslemetry first refresh",
     )
+    if cached is not None:
+        entry.async_create_background_task(
+            hass,
+            _async_revalidate_setup(hass, entry, teslemetry, cache, products, scopes),
+            "Teslemetry revalidate setup",
+        )
 
-    if stream:
-        entry.async_on_unload(stream.close)
-        entry.async_create_background_task(hass, stream.listen(), "Teslemetry Stream")
+    return True
+
+
+@callback
+def _async_add_on_first_refresh(
+    hass: HomeAssistant,
+    entry: TeslemetryConfigEntry,
+    coordinator: TeslemetryKeyedCoordinator,
+    products: TeslemetryProducts,
+) -> None:
+    """Add products once the coordinator that decides their entities refreshes.
+
+    Listening also keeps the coordinator polling, so a failed first refresh is
+    retried on its own schedule.
+    """
+    remove_listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def _async_remove_listener() -> None:
+        nonlocal remove_listener
+        if remove_listener is not None:
+            remove_listener()
+            remove_listener = None
+
+    @callback
+    def _async_refreshed() -> None:
+        if not coordinator.last_update_success:
+            return
+        _async_remove_listener()
+        device_registry = dr.async_get(hass)
+        for energysite in products.energysites:
+            async_setup_energy_device(hass, entry, energysite, device_registry)
+        data = entry.runtime_data
+        data.async_add_products(products)
+        if products.vehicles:
+            _async_update_vehicle_repairs(
+                hass,
+                entry,
+                _vins(data.vehicles),
+                data.metadata_coordinator.data["vehicles"],
+            )
+
+    remove_listener = coordinator.async_add_listener(_async_refreshed)
+    entry.async_on_unload(_async_remove_listener)
+
+
+async def _async_first_refresh(
+    entry: TeslemetryConfigEntry,
+    cache: TeslemetrySetupCache | None,
+    products: list[dict[str, Any]],
+    vehicles: list[TeslemetryVehicleData],
+    energysites: list[TeslemetryEnergyData],
+) -> None:
+    """Run the first refreshes that decide which entities are created.
 
+    A cold start saves the setup cache once they are done.
+    """
+    await asyncio.gather(
+        *(
+            _async_timed(
+                f"first refresh of {vehicle.vin}", vehicle.coordinator.async_refresh()
+            )
+            for vehicle in vehicles
+        ),
+        *(
+            _async_timed(
+                f"site info of {energysite.id}",
+                energysite.info_coordinator.async_refresh(),
+            )
+            for energysite in energysites
+        ),
+    )
+    if cache is not None:
+        data = entry.runtime_data
+        await cache.async_save(
+            products,
+            data.metadata_coordinator.data,
+            _energy_site_cache(data.energysites),
+            _vehicle_cache(data.vehicles),
+        )
+
+
+@callback
+def _async_listen_stream(
+    hass: HomeAssistant,
+    entry: TeslemetryConfigEntry,
+    governor: TeslemetryCreditGovernor,
+    stream: TeslemetryStream,
+) -> None:
+    """Listen to the stream and feed its credit events to the governor."""
+    entry.async_on_unload(stream.listen_Credits(governor.async_update_credits))
+    entry.async_on_unload(stream.close)
+    entry.async_create_background_task(hass, stream.listen(), "Teslemetry Stream")
+
+
+@callback
+def _async_set_cached_data(
+    vehicles: list[TeslemetryVehicleData],
+    energysites: list[TeslemetryEnergyData],
+    cached_vehicles: dict[str, dict[str, Any]],
+    cached_sites: dict[str, dict[str, Any]],
+) -> None:
+    """Seed the coordinators of a warm start with the cached setup data."""
+    for vehicle in vehicles:
+        if vehicle.poll and (data := cached_vehicles.get(vehicle.vin)) is not None:
+            vehicle.coordinator.async_set_updated_data(data)
+    for energysite in energysites:
+        if (site := cached_sites.get(str(energysite.id))) is not None:
+            energysite.info_coordinator.async_set_cached_site_info(site["site_info"])
+
+
+def _create_vehicle(
+    hass: HomeAssistant,
+    entry: TeslemetryConfigEntry,
+    teslemetry: Teslemetry,
+    governor: TeslemetryCreditGovernor,
+    access_token: TeslemetryAccessToken,
+    stream: TeslemetryDispatchStream,
+    product: dict[str, Any],
+    vehicle_metadata: dict[str, Any],
+) -> TeslemetryVehicleData:
+    """Create the data of a vehicle and set up its stream."""
+    vin = product["vin"]
+    # Remove the protobuff 'cached_data' that we do not use to save memory
+    product.pop("cached_data", None)
+    vehicle = teslemetry.vehicles.create(vin)
+    coordinator = TeslemetryVehicleDataCoordinator(
+        hass, entry, vehicle, product, governor, access_token
+    )
+    firmware = vehicle_metadata[vin].get("firmware")
+    device = DeviceInfo(
+        identifiers={(DOMAIN, vin)},
+        manufacturer="Tesla",
+        configuration_url=f"https://teslemetry.com/console/vehicle/{vin}",
+        name=product["display_name"],
+        model=vehicle.model,
+        model_id=vin[3],
+        serial_number=vin,
+        sw_version=firmware,
+    )
+
+    stream_writer = TeslemetryStreamWriter(hass)
+    data = TeslemetryVehicleData(
+        api=vehicle,
+        config_entry=entry,
+        coordinator=coordinator,
+        poll=vehicle_metadata[vin].get("polling", False),
+        stream=stream,
+        stream_vehicle=stream.get_vehicle(vin),
+        vin=vin,
+        firmware=firmware or "Unknown",
+        device=device,
+        stream_writer=stream_writer,
+    )
+    data.async_on_remove(stream_writer.async_cancel)
+    # The stream config only decides which fields still need enabling,
+    # so it loads on its own and never holds up the other devices.
+    async_setup_stream(hass, entry, data)
+    return data
+
+
+def _energy_site_setup(
+    teslemetry: Teslemetry, product: dict[str, Any]
+) -> EnergySiteSetup | None:
+    """Return what an energy site is created from, or None without components."""
+    site_id = product["energy_site_id"]
+
+    powerwall = product["components"]["battery"] or product["components"]["solar"]
+    wall_connector = "wall_connectors" in product["components"]
+    if not powerwall and not wall_connector:
+        LOGGER.debug(
+            "Skipping Energy Site %s as it has no components",
+            site_id,
+        )
+        return None
+
+    energy_site = teslemetry.energySites.create(site_id)
+    device = DeviceInfo(
+        identifiers={(DOMAIN, str(site_id))},
+        manufacturer="Tesla",
+        configuration_url=f"https://teslemetry.com/console/energy/{site_id}",
+        name=product.get("site_name", "Energy Site"),
+        serial_number=str(site_id),
+    )
+    return energy_site, product, powerwall, device
+
+
+def _create_energy_site(
+    hass: HomeAssistant,
+    entry: TeslemetryConfigEntry,
+    governor: TeslemetryCreditGovernor,
+    access_token: TeslemetryAccessToken,
+    setup: EnergySiteSetup,
+    live_status: Any,
+) -> TeslemetryEnergyData:
+    """Create the data of an energy site."""
+    energy_site, product, powerwall, device = setup
+    return TeslemetryEnergyData(
+        api=energy_site,
+        live_coordinator=(
+            TeslemetryEnergySiteLiveCoordinator(
+                hass, entry, energy_site, live_status, governor, access_token
+            )
+            if isinstance(live_status, dict)
+            else None
+        ),
+        info_coordinator=TeslemetryEnergySiteInfoCoordinator(
+            hass, entry, energy_site, product, governor, access_token
+        ),
+        history_coordinator=(
+            TeslemetryEnergyHistoryCoordinator(
+                hass, entry, energy_site, governor, access_token
+            )
+            if powerwall
+            else None
+        ),
+        id=product["energy_site_id"],
+        device=device,
+    )
+
+
+@callback
+def _async_remove_products(
+    vehicles: list[TeslemetryVehicleData], energysites: list[TeslemetryEnergyData]
+) -> None:
+    """Stop everything set up for each product."""
+    for product in (*vehicles, *energysites):
+        product.async_remove()
+
+
+def _vins(vehicles: list[TeslemetryVehicleData]) -> set[str]:
+    """Return the VINs of the vehicles."""
+    return {vehicle.vin for vehicle in vehicles}
+
+
+async def _async_update_products(
+    hass: HomeAssistant,
+    entry: TeslemetryConfigEntry,
+    teslemetry: Teslemetry,
+    *,
+    added_vins: set[str],
+    removed_vins: set[str],
+    added_site_ids: set[str],
+    removed_site_ids: set[str],
+) -> bool:
+    """Set up added products and remove removed ones, without a reload.
+
+    Products that stay are left alone, so their streams, coordinators and
+    entities keep running. Returns False when the update should be retried
+    on the next metadata refresh.
+    """
+    data = entry.runtime_data
+    if added_vins and data.stream is None and Scope.VEHICLE_DEVICE_DATA in data.scopes:
+        # The stream and the entities that depend on it come with the first vehicle
+        LOGGER.info("First vehicle added, reloading integration")
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return True
+
+    # Fetch first, so a failed fetch leaves every product in place for the retry
+    try:
+        products = (await teslemetry.products())["response"]
+    except TeslaFleetError as e:
+        LOGGER.warning("Could not fetch the changed products: %s", e.message)
+        return False
+    _async_remove_changed_products(hass, entry, removed_vins, removed_site_ids)
+
+    metadata = data.metadata_coordinator.data
+    governor = data.governor
+    vehicles: list[TeslemetryVehicleData] = []
+    energy_site_setups: list[EnergySiteSetup] = []
+    for product in products:
+        if (
+            product.get("vin") in added_vins
+            and Scope.VEHICLE_DEVICE_DATA in data.scopes
+            and data.stream is not None
+        ):
+            vehicles.append(
+                _create_vehicle(
+                    hass,
+                    entry,
+                    teslemetry,
+                    governor,
+                    data.access_token,
+                    data.stream,
+                    product,
+                    metadata["vehicles"],
+                )
+            )
+        elif (
+            str(product.get("energy_site_id")) in added_site_ids
+            and Scope.ENERGY_DEVICE_DATA in data.scopes
+            and (setup := _energy_site_setup(teslemetry, product)) is not None
+        ):
+            energy_site_setups.append(setup)
+
+    semaphore = asyncio.Semaphore(ENERGY_SITE_SETUP_CONCURRENCY)
+    try:
+        live_statuses = await asyncio.gather(
+            *(
+                _async_get_initial_live_status(energy_site, semaphore)
+                for energy_site, *_ in energy_site_setups
+            )
+        )
+    except (ConfigEntryAuthFailed, ConfigEntryNotReady) as e:
+        _async_remove_products(vehicles, [])
+        if isinstance(e, ConfigEntryAuthFailed):
+            entry.async_start_reauth(hass)
+        LOGGER.warning("Could not fetch the added energy sites: %s", e)
+        return False
+    energysites = [
+        _create_energy_site(
+            hass, entry, governor, data.access_token, setup, live_status
+        )
+        for setup, live_status in zip(energy_site_setups, live_statuses, strict=True)
+    ]
+
+    # Refresh what decides which entities are created
+    coordinators = [
+        *(vehicle.coordinator for vehicle in vehicles if vehicle.poll),
+        *(energysite.info_coordinator for energysite in energysites),
+    ]
+    await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+    if not all(coordinator.last_update_success for coordinator in coordinators):
+        _async_remove_products(vehicles, energysites)
+        LOGGER.warning("Could not refresh the added products")
+        return False
+
+    device_registry = dr.async_get(hass)
+    for energysite in energysites:
+        async_setup_energy_device(hass, entry, energysite, device_registry)
+    data.async_add_products(TeslemetryProducts(vehicles, energysites, data.scopes))
+
+    _async_update_vehicle_repairs(
+        hass, entry, _vins(data.vehicles), metadata["vehicles"]
+    )
+    await TeslemetrySetupCache(hass, entry.entry_id).async_save(
+        products,
+        metadata,
+        _energy_site_cache(data.energysites),
+        _vehicle_cache(data.vehicles),
+    )
     return True
 
 
+@callback
+def _async_remove_changed_products(
+    hass: HomeAssistant,
+    entry: TeslemetryConfigEntry,
+    removed_vins: set[str],
+    removed_site_ids: set[str],
+) -> None:
+    """Remove products and their devices, which removes their entities."""
+    data = entry.runtime_data
+    vehicles = [vehicle for vehicle in data.vehicles if vehicle.vin in removed_vins]
+    energysites = [
+        energysite
+        for energysite in data.energysites
+        if str(energysite.id) in removed_site_ids
+    ]
+    identifiers = {(DOMAIN, vehicle.vin) for vehicle in vehicles}
+    for energysite in energysites:
+        identifiers.add((DOMAIN, str(energysite.id)))
+        if energysite.live_coordinator is not None:
+            identifiers |= {
+                (DOMAIN, din)
+                for din in energysite.live_coordinator.data.get("wall_connectors", {})
+            }
+    _async_remove_products(vehicles, energysites)
+    for vehicle in vehicles:
+        data.vehicles.remove(vehicle)
+    for energysite in energysites:
+        data.energysites.remove(energysite)
+
+    device_registry = dr.async_get(hass)
+    for device_entry in dr.async_entries_for_config_entry(
+        device_registry, entry.entry_id
+    ):
+        if device_entry.identifiers & identifiers:
+            LOGGER.debug("Removing device %s", device_entry.id)
+            device_registry.async_remove_device(device_entry.id)
+
+
+def _energy_site_cache(
+    energysites: list[TeslemetryEnergyData],
+) -> dict[str, dict[str, Any]]:
+    """Return the site info and live status of each energy site to cache."""
+    return {
+        str(energysite.id): {
+            "site_info": energysite.info_coordinator.site_info,
+            "live_status": (
+                live_status_snapshot(energysite.live_coordinator.data)
+                if energysite.live_coordinator
+                else None
+            ),
+        }
+        for energysite in energysites
+        if energysite.info_coordinator.site_info is not None
+    }
+
+
+def _vehicle_cache(
+    vehicles: list[TeslemetryVehicleData],
+) -> dict[str, dict[str, Any]]:
+    """Return the coordinator data of each polled vehicle to cache."""
+    return {
+        vehicle.vin: vehicle.coordinator.data
+        for vehicle in vehicles
+        if vehicle.poll and vehicle.coordinator.last_update_success
+    }
+
+
+def _product_ids(products: list[dict[str, Any]]) -> set[str]:
+    """Return the VINs and energy site IDs of a product list."""
+    return {
+        str(product.get("vin") or product.get("energy_site_id")) for product in products
+    }
+
+
+async def _async_revalidate_setup(
+    hass: HomeAssistant,
+    entry: TeslemetryConfigEntry,
+    teslemetry: Teslemetry,
+    cache: TeslemetrySetupCache,
+    products: list[dict[str, Any]],
+    scopes: list[str],
+) -> None:
+    """Fetch the data a warm start was set up from and reconcile it.
+
+    The coordinators take the fresh metadata, vehicle data, site info and
+    live status as a normal update, and dynamic discovery applies subscription
+    changes in the metadata. Products or scopes that differ from the cache
+    reload the entry.
+    """
+    data = entry.runtime_data
+    try:
+        products_call, *_ = await asyncio.gather(
+            teslemetry.products(),
+            data.metadata_coordinator.async_refresh(),
+            *(
+                vehicle.coordinator.async_refresh()
+                for vehicle in data.vehicles
+                if vehicle.poll
+            ),
+            *(
+                energysite.info_coordinator.async_refresh()
+                for energysite in data.energysites
+            ),
+            *(
+                energysite.live_coordinator.async_refresh()
+                for energysite in data.energysites
+                if energysite.live_coordinator
+            ),
+        )
+    except InvalidToken, LoginRequired, SubscriptionRequired:
+        entry.async_start_reauth(hass)
+        return
+    except TeslaFleetError as e:
+        LOGGER.debug("Could not revalidate the cached setup data: %s", e.message)
+        return
+
+    metadata = data.metadata_coordinator.data
+    fresh_products = products_call["response"]
+    await cache.async_save(
+        fresh_products,
+        metadata,
+        _energy_site_cache(data.energysites),
+        _vehicle_cache(data.vehicles),
+    )
+    if _product_ids(fresh_products) != _product_ids(products) or set(
+        metadata["scopes"]
+    ) != set(scopes):
+        LOGGER.info("Products changed since the cached setup data, reloading")
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: TeslemetryConfigEntry) -> bool:
     """Unload Teslemetry Config."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: TeslemetryConfigEntry) -> None:
+    """Remove the cached setup data of a removed config entry."""
+    await TeslemetrySetupCache(hass, entry.entry_id).async_remove()
+
+
 async def async_migrate_entry(
     hass: HomeAssistant, config_entry: TeslemetryConfigEntry
 ) -> bool:
@@ -747,19 +1260,22 @@ async def async_migrate_entry(
 
 
 def create_handle_vehicle_stream(
-    vin: str, coordinator: TeslemetryVehicleDataCoordinator
+    vehicle: TeslemetryVehicleData,
 ) -> Callable[[dict[str, Any]], None]:
     """Create a handle vehicle stream function."""
+    vin = vehicle.vin
+    coordinator = vehicle.coordinator
 
     def handle_vehicle_stream(data: dict[str, Any]) -> None:
         """Handle vehicle data from the stream."""
+        vehicle.stream_vehicle.health.async_frame(data)
+        vehicle.failover.async_frame()
         if "vehicle_data" in data:
             LOGGER.debug("Streaming received vehicle data from %s", vin)
-            coordinator.async_set_updated_data(flatten(data["vehicle_data"]))
+            coordinator.async_set_updated_vehicle_data(data["vehicle_data"])
         elif "state" in data:
             LOGGER.debug("Streaming received state from %s", vin)
-            coordinator.data["state"] = data["state"]
-            coordinator.async_set_updated_data(coordinator.data)
+            coordinator.async_set_updated_state(data["state"])
 
     return handle_vehicle_stream
 
@@ -789,7 +1305,7 @@ def async_setup_energy_device(
         config_entry_id=entry.entry_id, **energysite.device
     )
 
-    entry.async_on_unload(
+    energysite.async_on_remove(
         energysite.info_coordinator.async_add_listener(
             create_energy_info_listener(
                 hass, energysite.id, entry.entry_id, energysite.info_coordinator
@@ -798,22 +1314,64 @@ def async_setup_energy_device(
     )
 
 
-async def async_setup_stream(
+async def _async_timed[_T](description: str, awaitable: Awaitable[_T]) -> _T:
+    """Await a setup step and log how long it took."""
+    start = time.monotonic()
+    try:
+        return await awaitable
+    finally:
+        LOGGER.debug("Setup %s took %.3fs", description, time.monotonic() - start)
+
+
+@callback
+def async_setup_stream(
     hass: HomeAssistant, entry: TeslemetryConfigEntry, vehicle: TeslemetryVehicleData
 ) -> None:
-    """Set up the stream for a vehicle."""
-    await vehicle.stream_vehicle.get_config()
-    entry.async_create_background_task(
-        hass,
-        vehicle.stream_vehicle.prefer_typed(True),
-        f"Prefer typed for {vehicle.vin}",
+    """Set up the stream for a vehicle, loading its config in the background."""
+    vehicle.async_on_remove(
+        vehicle.stream.async_add_listener(
+            create_handle_vehicle_stream(vehicle),
+            {"vin": vehicle.vin},
+        )
     )
-
-    entry.async_on_unload(
+    vehicle.async_on_remove(vehicle.failover.async_start(hass))
+    vehicle.async_on_remove(
+        vehicle.stream.async_add_connection_listener(
+            vehicle.coordinator.async_handle_stream_connection
+        )
+    )
+    vehicle.async_on_remove(
         vehicle.stream_vehicle.listen_Version(
             create_vehicle_streaming_listener(hass, vehicle.vin, entry.entry_id)
         )
     )
+    entry.async_create_task(
+        hass,
+        _async_load_stream_config(hass, entry, vehicle),
+        f"Teslemetry stream config for {vehicle.vin}",
+    )
+
+
+async def _async_load_stream_config(
+    hass: HomeAssistant, entry: TeslemetryConfigEntry, vehicle: TeslemetryVehicleData
+) -> None:
+    """Load the stream config of a vehicle, then enable its queued fields."""
+    stream_vehicle = vehicle.stream_vehicle
+    try:
+        await _async_timed(
+            f"stream config of {vehicle.vin}", stream_vehicle.get_config()
+        )
+    except ClientError, TimeoutError:
+        # Fields are still enabled, they just cannot be compared to the config
+        LOGGER.warning("Could not load the stream config of %s", vehicle.vin)
+        stream_vehicle.async_set_config_loaded(False)
+        return
+    entry.async_create_background_task(
+        hass,
+        stream_vehicle.prefer_typed(True),
+        f"Prefer typed for {vehicle.vin}",
+    )
+    stream_vehicle.async_set_config_loaded(True)
 
 
 def create_vehicle_streaming_listener(
@@ -1,6 +1,6 @@
 """Binary Sensor platform for Teslemetry integration."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import cast, override
 
@@ -25,8 +25,10 @@ from .entity import (
     TeslemetryEnergyLiveEntity,
     TeslemetryVehiclePollingEntity,
     TeslemetryVehicleStreamEntity,
+    async_add_product_entities,
 )
-from .models import TeslemetryEnergyData, TeslemetryVehicleData
+from .models import TeslemetryEnergyData, TeslemetryProducts, TeslemetryVehicleData
+from .stream import STREAMING_SLOW_INTERVAL
 
 PARALLEL_UPDATES = 0
 
@@ -51,6 +53,9 @@ class TeslemetryBinarySensorEntityDescription(BinarySensorEntityDescription):
         | None
     ) = None
     streaming_firmware: str = "2024.26"
+    # Stream config of the field, None leaves the Teslemetry default
+    streaming_config_interval: int | None = None
+    streaming_config_minimum_delta: float | None = None
 
 
 VEHICLE_DESCRIPTIONS: tuple[TeslemetryBinarySensorEntityDescription, ...] = (
@@ -412,6 +417,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryBinarySensorEntityDescription, ...] = (
             vehicle.listen_OffroadLightbarPresent(callback)
         ),
         streaming_firmware="2024.44.25",
+        streaming_config_interval=STREAMING_SLOW_INTERVAL,
         entity_registry_enabled_default=False,
     ),
     TeslemetryBinarySensorEntityDescription(
@@ -428,6 +434,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryBinarySensorEntityDescription, ...] = (
             callback
         ),
         streaming_firmware="2024.44.25",
+        streaming_config_interval=STREAMING_SLOW_INTERVAL,
         entity_registry_enabled_default=False,
     ),
     TeslemetryBinarySensorEntityDescription(
@@ -436,6 +443,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryBinarySensorEntityDescription, ...] = (
             callback
         ),
         streaming_firmware="2024.44.25",
+        streaming_config_interval=STREAMING_SLOW_INTERVAL,
         entity_registry_enabled_default=False,
     ),
     TeslemetryBinarySensorEntityDescription(
@@ -562,37 +570,45 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Teslemetry binary sensor platform from a config entry."""
 
-    entities: list[BinarySensorEntity] = []
-    for vehicle in entry.runtime_data.vehicles:
-        for description in VEHICLE_DESCRIPTIONS:
-            if (
-                not vehicle.poll
-                and description.streaming_listener
-                and firmware_at_least(vehicle.firmware, description.streaming_firmware)
-            ):
-                entities.append(
-                    TeslemetryVehicleStreamingBinarySensorEntity(vehicle, description)
-                )
-            elif description.polling:
-                entities.append(
-                    TeslemetryVehiclePollingBinarySensorEntity(vehicle, description)
-                )
+    def _product_entities(products: TeslemetryProducts) -> Iterable[BinarySensorEntity]:
+        """Return the entities of the products."""
+        entities: list[BinarySensorEntity] = []
+        for vehicle in products.vehicles:
+            for description in VEHICLE_DESCRIPTIONS:
+                if (
+                    not vehicle.poll
+                    and description.streaming_listener
+                    and firmware_at_least(
+                        vehicle.firmware, description.streaming_firmware
+                    )
+                ):
+                    entities.append(
+                        TeslemetryVehicleStreamingBinarySensorEntity(
+                            vehicle, description
+                        )
+                    )
+                elif description.polling:
+                    entities.append(
+                        TeslemetryVehiclePollingBinarySensorEntity(vehicle, description)
+                    )
+
+        entities.extend(
+            TeslemetryEnergyLiveBinarySensorEntity(energysite, description)
+            for energysite in products.energysites
+            if energysite.live_coordinator
+            for description in ENERGY_LIVE_DESCRIPTIONS
+            if description.key in energysite.live_coordinator.data
+        )
+        entities.extend(
+            TeslemetryEnergyInfoBinarySensorEntity(energysite, description)
+            for energysite in products.energysites
+            for description in ENERGY_INFO_DESCRIPTIONS
+            if description.key in energysite.info_coordinator.data
+        )
 
-    entities.extend(
-        TeslemetryEnergyLiveBinarySensorEntity(energysite, description)
-        for energysite in entry.runtime_data.energysites
-        if energysite.live_coordinator
-        for description in ENERGY_LIVE_DESCRIPTIONS
-        if description.key in energysite.live_coordinator.data
-    )
-    entities.extend(
-        TeslemetryEnergyInfoBinarySensorEntity(energysite, description)
-        for energysite in entry.runtime_data.energysites
-        for description in ENERGY_INFO_DESCRIPTIONS
-        if description.key in energysite.info_coordinator.data
-    )
+        return entities
 
-    async_add_entities(entities)
+    async_add_product_entities(entry, async_add_entities, _product_entities)
 
 
 class TeslemetryVehiclePollingBinarySensorEntity(
@@ -635,6 +651,8 @@ class TeslemetryVehicleStreamingBinarySensorEntity(
     ) -> None:
         """Initialize the sensor."""
         self.entity_description = description
+        self._attr_stream_interval = description.streaming_config_interval
+        self._attr_stream_minimum_delta = description.streaming_config_minimum_delta
         super().__init__(data, description.key)
 
     @override
@@ -645,17 +663,18 @@ class TeslemetryVehicleStreamingBinarySensorEntity(
             self._attr_is_on = state.state == STATE_ON
 
         assert self.entity_description.streaming_listener
-        self.async_on_remove(
-            self.entity_description.streaming_listener(
-                self.vehicle.stream_vehicle, self._async_value_from_stream
+        with self.stream_fields_configured():
+            self.async_on_remove(
+                self.entity_description.streaming_listener(
+                    self.vehicle.stream_vehicle, self._async_value_from_stream
+                )
             )
-        )
 
     def _async_value_from_stream(self, value: bool | None) -> None:
         """Update the value of the entity."""
         self._attr_available = value is not None
         self._attr_is_on = value
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
 
 class TeslemetryEnergyLiveBinarySensorEntity(
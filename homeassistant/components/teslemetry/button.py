@@ -1,6 +1,6 @@
 """Button platform for Teslemetry integration."""
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 from typing import Any, override
 
@@ -12,9 +12,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from . import TeslemetryConfigEntry
-from .entity import TeslemetryVehicleStreamEntity
-from .helpers import handle_command, handle_vehicle_command
-from .models import TeslemetryVehicleData
+from .entity import TeslemetryVehicleStreamEntity, async_add_product_entities
+from .models import TeslemetryProducts, TeslemetryVehicleData
 
 PARALLEL_UPDATES = 0
 
@@ -28,26 +27,31 @@ class TeslemetryButtonEntityDescription(ButtonEntityDescription):
 
 DESCRIPTIONS: tuple[TeslemetryButtonEntityDescription, ...] = (
     TeslemetryButtonEntityDescription(
-        key="wake", func=lambda self: handle_command(self.api.wake_up())
+        key="wake", func=lambda self: self.vehicle.executor.async_wake()
     ),
     TeslemetryButtonEntityDescription(
         key="flash_lights",
-        func=lambda self: handle_vehicle_command(self.api.flash_lights()),
+        func=lambda self: self.vehicle.executor.async_execute(self.api.flash_lights()),
     ),
     TeslemetryButtonEntityDescription(
-        key="honk", func=lambda self: handle_vehicle_command(self.api.honk_horn())
+        key="honk",
+        func=lambda self: self.vehicle.executor.async_execute(self.api.honk_horn()),
     ),
     TeslemetryButtonEntityDescription(
         key="enable_keyless_driving",
-        func=lambda self: handle_vehicle_command(self.api.remote_start_drive()),
+        func=lambda self: self.vehicle.executor.async_execute(
+            self.api.remote_start_drive()
+        ),
     ),
     TeslemetryButtonEntityDescription(
         key="boombox",
-        func=lambda self: handle_vehicle_command(self.api.remote_boombox(0)),
+        func=lambda self: self.vehicle.executor.async_execute(
+            self.api.remote_boombox(0)
+        ),
     ),
     TeslemetryButtonEntityDescription(
         key="homelink",
-        func=lambda self: handle_vehicle_command(
+        func=lambda self: self.vehicle.executor.async_execute(
             self.api.trigger_homelink(
                 lat=self.hass.config.latitude,
                 lon=self.hass.config.longitude,
@@ -64,12 +68,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Teslemetry Button platform from a config entry."""
 
-    async_add_entities(
-        TeslemetryButtonEntity(vehicle, description)
-        for vehicle in entry.runtime_data.vehicles
-        for description in DESCRIPTIONS
-        if Scope.VEHICLE_CMDS in entry.runtime_data.scopes
-    )
+    def _product_entities(products: TeslemetryProducts) -> Iterable[ButtonEntity]:
+        """Return the entities of the products."""
+        return (
+            TeslemetryButtonEntity(vehicle, description)
+            for vehicle in products.vehicles
+            for description in DESCRIPTIONS
+            if Scope.VEHICLE_CMDS in products.scopes
+        )
+
+    async_add_product_entities(entry, async_add_entities, _product_entities)
 
 
 class TeslemetryButtonEntity(TeslemetryVehicleStreamEntity, ButtonEntity):
@@ -0,0 +1,70 @@
+"""Warm start cache for the Teslemetry integration."""
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+# Product fields never written to storage: credentials and unused protobuf data
+CACHE_EXCLUDE = {"backseat_token", "backseat_token_updated_at", "cached_data", "tokens"}
+
+
+class TeslemetrySetupCache:
+    """Store the last good setup data of a config entry.
+
+    Setup saves the products, metadata, the data of each polled vehicle and
+    the site info and live status of each energy site once it succeeds.
+    When Home Assistant starts, setup forwards the platforms from this
+    snapshot straight away and fetches every source again in the
+    background, instead of waiting on the API.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.setup"
+        )
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Return the last saved snapshot, if any."""
+        data = await self._store.async_load()
+        if not data or not {"products", "metadata", "energy_sites"} <= data.keys():
+            return None
+        return data
+
+    async def async_save(
+        self,
+        products: list[dict[str, Any]],
+        metadata: dict[str, Any],
+        energy_sites: dict[str, dict[str, Any]],
+        vehicles: dict[str, dict[str, Any]],
+    ) -> None:
+        """Save a snapshot of the setup data."""
+        await self._store.async_save(
+            {
+                "products": [_redact(product) for product in products],
+                "metadata": metadata,
+                "energy_sites": energy_sites,
+                "vehicles": {vin: _redact(data) for vin, data in vehicles.items()},
+            }
+        )
+
+    async def async_remove(self) -> None:
+        """Remove the snapshot."""
+        await self._store.async_remove()
+
+
+def _redact(data: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of product or vehicle data without the excluded fields."""
+    return {key: value for key, value in data.items() if key not in CACHE_EXCLUDE}
+
+
+def live_status_snapshot(data: dict[str, Any]) -> dict[str, Any]:
+    """Return live status coordinator data in the form the API returns it."""
+    wall_connectors = data.get("wall_connectors")
+    if isinstance(wall_connectors, dict):
+        return {**data, "wall_connectors": list(wall_connectors.values())}
+    return dict(data)
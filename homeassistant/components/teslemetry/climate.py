@@ -1,5 +1,6 @@
 """Climate platform for Teslemetry integration."""
 
+from collections.abc import Iterable
 from itertools import chain
 from typing import Any, cast, override
 
@@ -32,9 +33,9 @@ from .entity import (
     TeslemetryRootEntity,
     TeslemetryVehiclePollingEntity,
     TeslemetryVehicleStreamEntity,
+    async_add_product_entities,
 )
-from .helpers import handle_vehicle_command
-from .models import TeslemetryVehicleData
+from .models import TeslemetryProducts, TeslemetryVehicleData
 
 DEFAULT_MIN_TEMP = 15
 DEFAULT_MAX_TEMP = 28
@@ -61,36 +62,39 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Teslemetry Climate platform from a config entry."""
 
-    async_add_entities(
-        chain(
+    def _product_entities(products: TeslemetryProducts) -> Iterable[ClimateEntity]:
+        """Return the entities of the products."""
+        return chain(
             (
                 TeslemetryVehiclePollingClimateEntity(
-                    vehicle, TeslemetryClimateSide.DRIVER, entry.runtime_data.scopes
+                    vehicle, TeslemetryClimateSide.DRIVER, products.scopes
                 )
                 if vehicle.poll or not firmware_at_least(vehicle.firmware, "2024.44.25")
                 else TeslemetryStreamingClimateEntity(
-                    vehicle, TeslemetryClimateSide.DRIVER, entry.runtime_data.scopes
+                    vehicle, TeslemetryClimateSide.DRIVER, products.scopes
                 )
-                for vehicle in entry.runtime_data.vehicles
+                for vehicle in products.vehicles
             ),
             (
                 TeslemetryVehiclePollingCabinOverheatProtectionEntity(
-                    vehicle, entry.runtime_data.scopes
+                    vehicle, products.scopes
                 )
                 if vehicle.poll or not firmware_at_least(vehicle.firmware, "2024.44.25")
                 else TeslemetryStreamingCabinOverheatProtectionEntity(
-                    vehicle, entry.runtime_data.scopes
+                    vehicle, products.scopes
                 )
-                for vehicle in entry.runtime_data.vehicles
+                for vehicle in products.vehicles
             ),
         )
-    )
+
+    async_add_product_entities(entry, async_add_entities, _product_entities)
 
 
 class TeslemetryClimateEntity(TeslemetryRootEntity, ClimateEntity):
     """Vehicle Climate Control."""
 
     api: Vehicle
+    vehicle: TeslemetryVehicleData
     _attr_precision = PRECISION_HALVES
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_hvac_modes = [HVACMode.HEAT_COOL, HVACMode.OFF]
@@ -102,7 +106,7 @@ class TeslemetryClimateEntity(TeslemetryRootEntity, ClimateEntity):
         """Set the climate state to on."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-        await handle_vehicle_command(self.api.auto_conditioning_start())
+        await self.vehicle.executor.async_execute(self.api.auto_conditioning_start())
 
         self._attr_hvac_mode = HVACMode.HEAT_COOL
         self.async_write_ha_state()
@@ -112,7 +116,7 @@ class TeslemetryClimateEntity(TeslemetryRootEntity, ClimateEntity):
         """Set the climate state to off."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-        await handle_vehicle_command(self.api.auto_conditioning_stop())
+        await self.vehicle.executor.async_execute(self.api.auto_conditioning_stop())
 
         self._attr_hvac_mode = HVACMode.OFF
         self._attr_preset_mode = self._attr_preset_modes[0]
@@ -126,7 +130,7 @@ class TeslemetryClimateEntity(TeslemetryRootEntity, ClimateEntity):
         if temp := kwargs.get(ATTR_TEMPERATURE):
             self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-            await handle_vehicle_command(
+            await self.vehicle.executor.async_execute(
                 self.api.set_temps(
                     driver_temp=temp,
                     passenger_temp=temp,
@@ -153,7 +157,7 @@ class TeslemetryClimateEntity(TeslemetryRootEntity, ClimateEntity):
         """Set the climate preset mode."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-        await handle_vehicle_command(
+        await self.vehicle.executor.async_execute(
             self.api.set_climate_keeper_mode(
                 climate_keeper_mode=self._attr_preset_modes.index(preset_mode)
             )
@@ -170,7 +174,7 @@ class TeslemetryClimateEntity(TeslemetryRootEntity, ClimateEntity):
         """Set the Bioweapon defense mode."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-        await handle_vehicle_command(
+        await self.vehicle.executor.async_execute(
             self.api.set_bioweapon_mode(
                 on=(fan_mode != "off"),
                 manual_override=True,
@@ -344,7 +348,7 @@ class TeslemetryStreamingClimateEntity(
 
     def _async_handle_inside_temp(self, data: float | None) -> None:
         self._attr_current_temperature = data
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_hvac_power(self, data: str | None) -> None:
         self._attr_hvac_mode = (
@@ -354,15 +358,15 @@ class TeslemetryStreamingClimateEntity(
             if data == "On"
             else HVACMode.OFF
         )
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_climate_keeper_mode(self, data: str | None) -> None:
         self._attr_preset_mode = PRESET_MODES.get(data) if data else None
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_hvac_temperature_request(self, data: float | None) -> None:
         self._attr_target_temperature = data
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_rhd(self, data: bool | None) -> None:
         if data is not None:
@@ -386,6 +390,7 @@ class TeslemetryCabinOverheatProtectionEntity(TeslemetryRootEntity, ClimateEntit
     """Vehicle Cabin Overheat Protection."""
 
     api: Vehicle
+    vehicle: TeslemetryVehicleData
     _attr_precision = PRECISION_WHOLE
     _attr_target_temperature_step = 5
     _attr_min_temp = 30
@@ -418,7 +423,7 @@ class TeslemetryCabinOverheatProtectionEntity(TeslemetryRootEntity, ClimateEntit
                 )
             self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-            await handle_vehicle_command(self.api.set_cop_temp(cop_mode))
+            await self.vehicle.executor.async_execute(self.api.set_cop_temp(cop_mode))
             self._attr_target_temperature = temp
 
         if mode := kwargs.get(ATTR_HVAC_MODE):
@@ -433,15 +438,15 @@ class TeslemetryCabinOverheatProtectionEntity(TeslemetryRootEntity, ClimateEntit
         self.raise_for_scope(Scope.VEHICLE_CMDS)
 
         if hvac_mode == HVACMode.OFF:
-            await handle_vehicle_command(
+            await self.vehicle.executor.async_execute(
                 self.api.set_cabin_overheat_protection(on=False, fan_only=False)
             )
         elif hvac_mode == HVACMode.COOL:
-            await handle_vehicle_command(
+            await self.vehicle.executor.async_execute(
                 self.api.set_cabin_overheat_protection(on=True, fan_only=False)
             )
         elif hvac_mode == HVACMode.FAN_ONLY:
-            await handle_vehicle_command(
+            await self.vehicle.executor.async_execute(
                 self.api.set_cabin_overheat_protection(on=True, fan_only=True)
             )
 
@@ -563,14 +568,14 @@ class TeslemetryStreamingCabinOverheatProtectionEntity(
 
     def _async_handle_inside_temp(self, value: float | None) -> None:
         self._attr_current_temperature = value
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_protection_mode(self, value: str | None) -> None:
         self._attr_hvac_mode = COP_MODES.get(value) if value is not None else None
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_temperature_limit(self, value: str | None) -> None:
         self._attr_target_temperature = (
             COP_LEVELS.get(value) if value is not None else None
         )
-        self.async_write_ha_state()
+        self.async_write_stream_state()
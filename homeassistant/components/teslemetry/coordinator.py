@@ -1,6 +1,11 @@
 """Teslemetry Data Coordinator."""
 
-from datetime import timedelta
+from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+import hashlib
+import logging
 from typing import TYPE_CHECKING, Any, override
 
 from tesla_fleet_api.const import TeslaEnergyPeriod, VehicleDataEndpoint
@@ -17,15 +22,32 @@ from tesla_fleet_api.exceptions import (
 )
 from tesla_fleet_api.teslemetry import EnergySite, Teslemetry, Vehicle
 
-from homeassistant.core import HomeAssistant
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.json import json_bytes_sorted
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import EnergyConverter
 
 if TYPE_CHECKING:
     from . import TeslemetryConfigEntry
 
-from .const import DOMAIN, ENERGY_HISTORY_FIELDS, LOGGER
-from .helpers import async_update_device_sw_version, flatten
+from .const import DOMAIN, ENERGY_HISTORY_FIELDS, LOGGER, TeslemetryState
+from .governor import INSUFFICIENT_CREDITS_RETRY_AFTER, TeslemetryCreditGovernor
+from .helpers import async_update_device_sw_version, flatten, flatten_changes
+from .oauth import TeslemetryAccessToken
+from .tariff import TeslemetryTariffIndex
 
 RETRY_EXCEPTIONS = (
     InvalidResponse,
@@ -43,16 +65,94 @@ def _get_retry_after(e: TeslaFleetError) -> float:
     return 10.0
 
 
+def _insufficient_credits(governor: TeslemetryCreditGovernor) -> UpdateFailed:
+    """Record that the credits ran out and return the error that backs off."""
+    governor.async_set_exhausted()
+    return UpdateFailed(
+        translation_domain=DOMAIN,
+        translation_key="update_failed_insufficient_credits",
+        retry_after=INSUFFICIENT_CREDITS_RETRY_AFTER,
+    )
+
+
+def _bucket_time(period: dict[str, Any]) -> datetime | None:
+    """Return the start of an energy history bucket."""
+    if not isinstance(timestamp := period.get("timestamp"), str):
+        return None
+    return dt_util.parse_datetime(timestamp)
+
+
+def _bucket_hour(period: dict[str, Any]) -> datetime | None:
+    """Return the start of the UTC hour an energy history bucket falls in."""
+    if (start := _bucket_time(period)) is None:
+        return None
+    return dt_util.as_utc(start).replace(minute=0, second=0, microsecond=0)
+
+
+def _split_site_info(
+    data: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Split a site info payload into its fast and slow changing sections."""
+    fast: dict[str, Any] = {}
+    slow: dict[str, Any] = {}
+    for key, value in data.items():
+        if key in ENERGY_INFO_SLOW_KEYS:
+            slow[key] = value
+        elif key == "components" and isinstance(value, dict):
+            fast[key] = {
+                name: component
+                for name, component in value.items()
+                if name not in ENERGY_INFO_SLOW_COMPONENTS
+            }
+            slow[key] = {
+                name: component
+                for name, component in value.items()
+                if name in ENERGY_INFO_SLOW_COMPONENTS
+            }
+        else:
+            fast[key] = value
+    return fast, slow
+
+
 VEHICLE_INTERVAL = timedelta(seconds=60)
+VEHICLE_ACTIVE_INTERVAL = timedelta(seconds=30)
 VEHICLE_WAIT = timedelta(minutes=15)
+VEHICLE_FAILOVER_INTERVAL = timedelta(minutes=5)
 ENERGY_LIVE_INTERVAL = timedelta(seconds=30)
 ENERGY_INFO_INTERVAL = timedelta(seconds=30)
 ENERGY_HISTORY_INTERVAL = timedelta(seconds=60)
 METADATA_INTERVAL = timedelta(hours=1)
 
-# Insufficient credits will not resolve themselves quickly, so back off polling
-# instead of hammering the API at the coordinator's normal interval.
-INSUFFICIENT_CREDITS_RETRY_AFTER = timedelta(hours=1).total_seconds()
+# Refreshes requested this soon after a fetch share its result
+FRESHNESS_WINDOW = timedelta(seconds=5)
+
+# Sections of site info that rarely change, hashed apart from the rest
+ENERGY_INFO_SLOW_KEYS = frozenset(
+    {
+        "battery_count",
+        "installation_date",
+        "installation_time_zone",
+        "max_site_meter_power_ac",
+        "min_site_meter_power_ac",
+        "nameplate_energy",
+        "nameplate_power",
+        "tariff_content",
+        "tariff_content_v2",
+    }
+)
+# Component lists that rarely change, unlike the component settings beside them
+ENERGY_INFO_SLOW_COMPONENTS = frozenset({"batteries", "gateways", "wall_connectors"})
+# Tariff structures kept whole rather than flattened
+ENERGY_INFO_SKIP_KEYS = ["daily_charges", "demand_charges", "energy_charges", "seasons"]
+
+# Days of energy history imported into statistics when there are none yet
+STATISTICS_BACKFILL = timedelta(days=7)
+# Most energy history fetched to backfill statistics in one update
+STATISTICS_CHUNK = timedelta(days=1)
+
+# Vehicle activity that warrants polling at the active interval
+ACTIVE_SHIFT_STATES = {"D", "N", "R"}
+ACTIVE_CHARGING_STATES = {"Charging", "Starting"}
 
 ENDPOINTS = [
     VehicleDataEndpoint.CHARGE_STATE,
@@ -74,6 +174,8 @@ class TeslemetryMetadataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         config_entry: TeslemetryConfigEntry,
         teslemetry: Teslemetry,
+        governor: TeslemetryCreditGovernor,
+        access_token: TeslemetryAccessToken,
     ) -> None:
         """Initialize Teslemetry Metadata coordinator."""
         super().__init__(
@@ -84,14 +186,23 @@ class TeslemetryMetadataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=METADATA_INTERVAL,
         )
         self.teslemetry = teslemetry
+        self.governor = governor
+        self.access_token = access_token
 
     @override
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch latest metadata for subscription status."""
+        if self.data is not None and self.governor.async_defer(self.name):
+            return self.data
         try:
             data = await self.teslemetry.metadata()
-        except (InvalidToken, SubscriptionRequired, LoginRequired) as e:
+        except InvalidToken as e:
+            self.access_token.async_invalidate()
             raise ConfigEntryAuthFailed from e
+        except (SubscriptionRequired, LoginRequired) as e:
+            raise ConfigEntryAuthFailed from e
+        except InsufficientCredits as e:
+            raise _insufficient_credits(self.governor) from e
         except RETRY_EXCEPTIONS as e:
             raise UpdateFailed(
                 translation_domain=DOMAIN,
@@ -106,10 +217,169 @@ class TeslemetryMetadataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 translation_placeholders={"message": e.message},
             ) from e
 
+        self.governor.async_clear_exhausted()
         return data
 
 
-class TeslemetryVehicleDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+class TeslemetryKeyedCoordinator(DataUpdateCoordinator[dict[str, Any]], ABC):
+    """Coordinator that only updates the listeners of keys that changed."""
+
+    config_entry: TeslemetryConfigEntry
+    changed_keys: set[str] | None = None
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        logger: logging.Logger,
+        *,
+        config_entry: TeslemetryConfigEntry,
+        name: str,
+        governor: TeslemetryCreditGovernor,
+        access_token: TeslemetryAccessToken,
+        update_interval: timedelta | None = None,
+    ) -> None:
+        """Initialize the key listener index."""
+        super().__init__(
+            hass,
+            logger,
+            config_entry=config_entry,
+            name=name,
+            update_interval=update_interval,
+        )
+        self.governor = governor
+        self.access_token = access_token
+        self._key_listeners: dict[str, set[CALLBACK_TYPE]] = {}
+        self._listener_keys: dict[CALLBACK_TYPE, set[str]] = {}
+        self._fetch: asyncio.Task[dict[str, Any]] | None = None
+        self._fetched_at: datetime | None = None
+
+    @override
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data, sharing a fetch that is in flight or just finished.
+
+        Scheduled polls, requested refreshes and entity updates can all ask
+        for a refresh at once, and every API call is billed.
+        """
+        if self._fetch is not None:
+            data = await asyncio.shield(self._fetch)
+            # The refresh that started the fetch already notified the changes
+            self.changed_keys = set()
+            return data
+
+        if (
+            self._fetched_at is not None
+            and self.last_update_success
+            and dt_util.utcnow() - self._fetched_at < FRESHNESS_WINDOW
+        ):
+            self.changed_keys = set()
+            return self.data
+
+        self._fetch = self.hass.async_create_task(
+            self._async_fetch_data(), f"{self.name} fetch"
+        )
+        self._fetch.add_done_callback(self._async_fetch_done)
+        return await asyncio.shield(self._fetch)
+
+    @callback
+    def _async_fetch_done(self, fetch: asyncio.Task[dict[str, Any]]) -> None:
+        """Clear the fetch in flight and remember when it succeeded."""
+        self._fetch = None
+        if not fetch.cancelled() and fetch.exception() is None:
+            self._fetched_at = dt_util.utcnow()
+
+    @abstractmethod
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch data from the API."""
+
+    @callback
+    def async_add_key_listener(
+        self, update_callback: CALLBACK_TYPE, keys: Iterable[str]
+    ) -> CALLBACK_TYPE:
+        """Index a registered listener under the keys it reads.
+
+        A listener indexed with no keys keeps receiving every update.
+        """
+        self._listener_keys[update_callback] = set()
+        for key in keys:
+            self.async_add_listener_key(update_callback, key)
+
+        @callback
+        def remove_key_listener() -> None:
+            """Remove the listener from the key index."""
+            for key in self._listener_keys.pop(update_callback, ()):
+                listeners = self._key_listeners[key]
+                listeners.discard(update_callback)
+                if not listeners:
+                    del self._key_listeners[key]
+
+        return remove_key_listener
+
+    @callback
+    def async_add_listener_key(self, update_callback: CALLBACK_TYPE, key: str) -> None:
+        """Index an indexed listener under one more key."""
+        keys = self._listener_keys.get(update_callback)
+        if keys is None or key in keys:
+            return
+        keys.add(key)
+        self._key_listeners.setdefault(key, set()).add(update_callback)
+
+    @override
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update only the listeners indexed under a changed key.
+
+        Unindexed listeners, and every listener when changed_keys is None,
+        are always updated.
+        """
+        if self.changed_keys is None:
+            super().async_update_listeners()
+            return
+
+        notify: set[CALLBACK_TYPE] = set()
+        for key in self.changed_keys:
+            if listeners := self._key_listeners.get(key):
+                notify |= listeners
+
+        listener_keys = self._listener_keys
+        for update_callback, _ in list(self._listeners.values()):
+            if update_callback in notify or not listener_keys.get(update_callback):
+                update_callback()
+
+    def _defer(self) -> bool:
+        """Return if a non-essential refresh should be skipped to save credits."""
+        if self.data and self.governor.async_defer(self.name):
+            self.changed_keys = set()
+            return True
+        return False
+
+    def _merge(
+        self, data: dict[str, Any], *, skip_keys: list[str] | None = None
+    ) -> set[str] | None:
+        """Merge a nested payload into the flat data and return the changed keys.
+
+        Returns None while recovering from a failed update, so every entity
+        refreshes its availability.
+        """
+        changed = flatten_changes(self.data, data, skip_keys=skip_keys)
+        return changed if self.last_update_success else None
+
+    def _diff(self, data: dict[str, Any]) -> set[str] | None:
+        """Return the top level keys of data that differ from the current data.
+
+        Returns None while recovering from a failed update, so every entity
+        refreshes its availability.
+        """
+        if not self.last_update_success:
+            return None
+        current = self.data
+        return {
+            key
+            for key in current.keys() | data.keys()
+            if key not in current or key not in data or current[key] != data[key]
+        }
+
+
+class TeslemetryVehicleDataCoordinator(TeslemetryKeyedCoordinator):
     """Class to manage fetching data from the Teslemetry API."""
 
     config_entry: TeslemetryConfigEntry
@@ -121,6 +391,8 @@ class TeslemetryVehicleDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         config_entry: TeslemetryConfigEntry,
         api: Vehicle,
         product: dict[str, Any],
+        governor: TeslemetryCreditGovernor,
+        access_token: TeslemetryAccessToken,
     ) -> None:
         """Initialize Teslemetry Vehicle Update Coordinator."""
         super().__init__(
@@ -128,28 +400,91 @@ class TeslemetryVehicleDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             LOGGER,
             config_entry=config_entry,
             name="Teslemetry Vehicle",
+            governor=governor,
+            access_token=access_token,
         )
-        if product["command_signing"] == "off":
-            # Only allow automatic polling if its included
+        # Only allow automatic polling if its included
+        self.polling = product["command_signing"] == "off"
+        if self.polling:
             self.update_interval = VEHICLE_INTERVAL
+        # Polling in place of a stream that is down
+        self.failover = False
+        # The vehicle state is kept current by the stream
+        self.stream_state = False
+        # Polls that fetched vehicle data, and polls skipped as it was asleep
+        self.polls_billed = 0
+        self.polls_skipped = 0
 
         self.api = api
         self.vin = product["vin"]
         self.data = flatten(product)
 
+    @property
+    def poll_interval(self) -> timedelta:
+        """Return the poll interval for the last known vehicle state."""
+        if self.data.get("state") != TeslemetryState.ONLINE:
+            if self.stream_state and not self.failover:
+                # Asleep or offline, wait for the stream to report it online
+                return VEHICLE_WAIT
+            # Keep probing the state with the free API call
+            return VEHICLE_INTERVAL
+        if (
+            self.data.get("drive_state_shift_state") in ACTIVE_SHIFT_STATES
+            or self.data.get("charge_state_charging_state") in ACTIVE_CHARGING_STATES
+        ):
+            return VEHICLE_ACTIVE_INTERVAL
+        return VEHICLE_INTERVAL
+
+    @callback
+    def _async_update_interval(self) -> None:
+        """Adapt the poll interval to the vehicle state and credit budget."""
+        if self.polling:
+            self.update_interval = self.governor.async_interval(
+                self.name, self.poll_interval
+            )
+        elif self.failover:
+            self.update_interval = self.governor.async_interval(
+                self.name, max(self.poll_interval, VEHICLE_FAILOVER_INTERVAL)
+            )
+
+    @callback
+    def async_set_failover(self, failover: bool) -> None:
+        """Poll while the stream is down, or stop once it is back."""
+        self.failover = failover
+        if failover:
+            self._async_update_interval()
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self.async_request_refresh(),
+                f"Teslemetry failover poll for {self.vin}",
+            )
+        elif not self.polling:
+            self.update_interval = None
+            self._unschedule_refresh()
+
     @override
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_fetch_data(self) -> dict[str, Any]:
         """Update vehicle data using Teslemetry API."""
+        # A failed update must refresh every entity's availability
+        self.changed_keys = None
         try:
+            if self.stream_state and not self.failover:
+                state = self.data.get("state")
+            else:
+                # Check if the vehicle is awake using a free API call
+                state = (await self.api.vehicle())["response"]["state"]
+            if state != TeslemetryState.ONLINE:
+                self.polls_skipped += 1
+                self._async_set_state(state)
+                return self.data
             data = (await self.api.vehicle_data(endpoints=ENDPOINTS))["response"]
-        except (InvalidToken, SubscriptionRequired, LoginRequired) as e:
+        except InvalidToken as e:
+            self.access_token.async_invalidate()
+            raise ConfigEntryAuthFailed from e
+        except (SubscriptionRequired, LoginRequired) as e:
             raise ConfigEntryAuthFailed from e
         except InsufficientCredits as e:
-            raise UpdateFailed(
-                translation_domain=DOMAIN,
-                translation_key="update_failed_insufficient_credits",
-                retry_after=INSUFFICIENT_CREDITS_RETRY_AFTER,
-            ) from e
+            raise _insufficient_credits(self.governor) from e
         except RETRY_EXCEPTIONS as e:
             raise UpdateFailed(
                 translation_domain=DOMAIN,
@@ -164,18 +499,57 @@ class TeslemetryVehicleDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 translation_placeholders={"message": e.message},
             ) from e
 
-        data = flatten(data)
-        if version := data.get("vehicle_state_car_version"):
+        self.polls_billed += 1
+        self.governor.async_clear_exhausted()
+        self.changed_keys = self._merge(data)
+        self._async_update_interval()
+        if version := self.data.get("vehicle_state_car_version"):
             # Consume firmware opportunistically rather than through a listener
             # that would keep this coordinator polling after every entity is
             # disabled. Drop the build suffix (e.g. "2024.44.25 x" -> "2024.44.25").
             async_update_device_sw_version(
                 self.hass, self.vin, self.config_entry.entry_id, version.split(" ")[0]
             )
-        return data
-
-
-class TeslemetryEnergySiteLiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+        return self.data
+
+    @callback
+    def async_set_updated_vehicle_data(self, data: dict[str, Any]) -> None:
+        """Merge nested vehicle data from the stream and notify listeners."""
+        self.changed_keys = self._merge(data)
+        self._async_update_interval()
+        self.async_set_updated_data(self.data)
+
+    @callback
+    def async_set_updated_state(self, state: str) -> None:
+        """Update the vehicle state from the stream and notify listeners."""
+        self.stream_state = True
+        self._async_set_state(state)
+        self.async_set_updated_data(self.data)
+
+    @callback
+    def async_handle_stream_connection(self, connected: bool) -> None:
+        """Stop relying on the stream for the vehicle state while it is down."""
+        if not connected and self.stream_state:
+            self.stream_state = False
+            self._async_update_interval()
+            if self._listeners:
+                self._schedule_refresh()
+
+    @callback
+    def _async_set_state(self, state: str) -> None:
+        """Set the vehicle state and the keys it changed."""
+        changed = {"state"} if self.data.get("state") != state else set()
+        self.data["state"] = state
+        self.changed_keys = changed if self.last_update_success else None
+        self._async_update_interval()
+
+    @callback
+    def async_diagnostics(self) -> dict[str, Any]:
+        """Return how many polls were billed and skipped."""
+        return {"billed": self.polls_billed, "skipped": self.polls_skipped}
+
+
+class TeslemetryEnergySiteLiveCoordinator(TeslemetryKeyedCoordinator):
     """Class to manage fetching energy site live status from the Teslemetry API."""
 
     config_entry: TeslemetryConfigEntry
@@ -187,6 +561,8 @@ class TeslemetryEnergySiteLiveCoordinator(DataUpdateCoordinator[dict[str, Any]])
         config_entry: TeslemetryConfigEntry,
         api: EnergySite,
         data: dict[str, Any],
+        governor: TeslemetryCreditGovernor,
+        access_token: TeslemetryAccessToken,
     ) -> None:
         """Initialize Teslemetry Energy Site Live coordinator."""
         super().__init__(
@@ -194,6 +570,8 @@ class TeslemetryEnergySiteLiveCoordinator(DataUpdateCoordinator[dict[str, Any]])
             LOGGER,
             config_entry=config_entry,
             name="Teslemetry Energy Site Live",
+            governor=governor,
+            access_token=access_token,
             update_interval=ENERGY_LIVE_INTERVAL,
         )
         self.api = api
@@ -205,12 +583,18 @@ class TeslemetryEnergySiteLiveCoordinator(DataUpdateCoordinator[dict[str, Any]])
         self.data = data
 
     @override
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_fetch_data(self) -> dict[str, Any]:
         """Update energy site data using Teslemetry API."""
+        self.changed_keys = None
         try:
             data: dict[str, Any] = (await self.api.live_status())["response"]
-        except (InvalidToken, SubscriptionRequired, LoginRequired) as e:
+        except InvalidToken as e:
+            self.access_token.async_invalidate()
             raise ConfigEntryAuthFailed from e
+        except (SubscriptionRequired, LoginRequired) as e:
+            raise ConfigEntryAuthFailed from e
+        except InsufficientCredits as e:
+            raise _insufficient_credits(self.governor) from e
         except RETRY_EXCEPTIONS as e:
             raise UpdateFailed(
                 translation_domain=DOMAIN,
@@ -224,14 +608,20 @@ class TeslemetryEnergySiteLiveCoordinator(DataUpdateCoordinator[dict[str, Any]])
                 translation_key="update_failed",
                 translation_placeholders={"message": e.message},
             ) from e
+
+        self.governor.async_clear_exhausted()
         # Convert Wall Connectors from array to dict
         data["wall_connectors"] = {
             wc["din"]: wc for wc in (data.get("wall_connectors") or [])
         }
+        self.changed_keys = self._diff(data)
+        self.update_interval = self.governor.async_interval(
+            self.name, ENERGY_LIVE_INTERVAL
+        )
         return data
 
 
-class TeslemetryEnergySiteInfoCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+class TeslemetryEnergySiteInfoCoordinator(TeslemetryKeyedCoordinator):
     """Class to manage fetching energy site info from the Teslemetry API."""
 
     config_entry: TeslemetryConfigEntry
@@ -242,6 +632,8 @@ class TeslemetryEnergySiteInfoCoordinator(DataUpdateCoordinator[dict[str, Any]])
         config_entry: TeslemetryConfigEntry,
         api: EnergySite,
         product: dict[str, Any],
+        governor: TeslemetryCreditGovernor,
+        access_token: TeslemetryAccessToken,
     ) -> None:
         """Initialize Teslemetry Energy Info coordinator."""
         super().__init__(
@@ -249,18 +641,49 @@ class TeslemetryEnergySiteInfoCoordinator(DataUpdateCoordinator[dict[str, Any]])
             LOGGER,
             config_entry=config_entry,
             name="Teslemetry Energy Site Info",
+            governor=governor,
+            access_token=access_token,
             update_interval=ENERGY_INFO_INTERVAL,
         )
         self.api = api
         self.data = product
+        self._tariff_indexes: dict[str, TeslemetryTariffIndex] = {}
+        # Flat data and content hash of each tier of the site info
+        self._tiers: dict[str, dict[str, Any]] = {"fast": {}, "slow": {}}
+        self._digests: dict[str, bytes] = {}
+        # The last site info payload, kept for the warm start cache
+        self.site_info: dict[str, Any] | None = None
+
+    @callback
+    def async_set_cached_site_info(self, data: dict[str, Any]) -> None:
+        """Set the data from cached site info ahead of the first fetch."""
+        self._merge_site_info(data)
+
+    def tariff_index(self, key_base: str) -> TeslemetryTariffIndex:
+        """Return the interval index of a tariff, compiled again when it changes."""
+        if (index := self._tariff_indexes.get(key_base)) is None:
+            index = TeslemetryTariffIndex(
+                self.data.get(f"{key_base}_seasons") or {},
+                self.data.get(f"{key_base}_energy_charges") or {},
+            )
+            self._tariff_indexes[key_base] = index
+        return index
 
     @override
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_fetch_data(self) -> dict[str, Any]:
         """Update energy site data using Teslemetry API."""
+        self.changed_keys = None
+        if self._defer():
+            return self.data
         try:
             data = (await self.api.site_info())["response"]
-        except (InvalidToken, SubscriptionRequired, LoginRequired) as e:
+        except InvalidToken as e:
+            self.access_token.async_invalidate()
+            raise ConfigEntryAuthFailed from e
+        except (SubscriptionRequired, LoginRequired) as e:
             raise ConfigEntryAuthFailed from e
+        except InsufficientCredits as e:
+            raise _insufficient_credits(self.governor) from e
         except RETRY_EXCEPTIONS as e:
             raise UpdateFailed(
                 translation_domain=DOMAIN,
@@ -275,13 +698,42 @@ class TeslemetryEnergySiteInfoCoordinator(DataUpdateCoordinator[dict[str, Any]])
                 translation_placeholders={"message": e.message},
             ) from e
 
-        return flatten(
-            data,
-            skip_keys=["daily_charges", "demand_charges", "energy_charges", "seasons"],
-        )
-
-
-class TeslemetryEnergyHistoryCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+        self.governor.async_clear_exhausted()
+        changed = self._merge_site_info(data)
+        self.changed_keys = changed if self.last_update_success else None
+        return self.data
+
+    def _merge_site_info(self, data: dict[str, Any]) -> set[str]:
+        """Merge the tiers of a site info payload that changed."""
+        self.site_info = data
+        fast, slow = _split_site_info(data)
+        tiers = {"fast": fast, "slow": slow}
+
+        if not self._digests:
+            # The first fetch replaces the product data entirely
+            self.data = {}
+
+        changed: set[str] = set()
+        for tier, payload in tiers.items():
+            digest = hashlib.sha256(json_bytes_sorted(payload)).digest()
+            if digest == self._digests.get(tier):
+                # Nothing in this tier changed, so skip flattening it again
+                continue
+            self._digests[tier] = digest
+            if tier == "slow":
+                # The tariffs are part of the slow tier
+                self._tariff_indexes.clear()
+            flat = self._tiers[tier]
+            for key in flatten_changes(flat, payload, skip_keys=ENERGY_INFO_SKIP_KEYS):
+                if key in flat:
+                    self.data[key] = flat[key]
+                else:
+                    self.data.pop(key, None)
+                changed.add(key)
+        return changed
+
+
+class TeslemetryEnergyHistoryCoordinator(TeslemetryKeyedCoordinator):
     """Class to manage fetching energy site info from the Teslemetry API."""
 
     config_entry: TeslemetryConfigEntry
@@ -291,6 +743,8 @@ class TeslemetryEnergyHistoryCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         config_entry: TeslemetryConfigEntry,
         api: EnergySite,
+        governor: TeslemetryCreditGovernor,
+        access_token: TeslemetryAccessToken,
     ) -> None:
         """Initialize Teslemetry Energy Info coordinator."""
         super().__init__(
@@ -298,18 +752,35 @@ class TeslemetryEnergyHistoryCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             LOGGER,
             config_entry=config_entry,
             name=f"Teslemetry Energy History {api.energy_site_id}",
+            governor=governor,
+            access_token=access_token,
             update_interval=ENERGY_HISTORY_INTERVAL,
         )
         self.api = api
         self.data = {}
+        # Running totals of the current day and the last bucket added to them
+        self._day: str | None = None
+        self._totals: dict[str, Any] = dict.fromkeys(ENERGY_HISTORY_FIELDS, None)
+        self._last_bucket: dict[str, Any] = {}
+        # Start of the next hour to import into statistics and the sums so far
+        self._statistics_next: datetime | None = None
+        self._statistics_sums: dict[str, float] = {}
 
     @override
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_fetch_data(self) -> dict[str, Any]:
         """Update energy site data using Teslemetry API."""
+        self.changed_keys = None
+        if self._defer():
+            return self.data
         try:
             data = (await self.api.energy_history(TeslaEnergyPeriod.DAY))["response"]
-        except (InvalidToken, SubscriptionRequired, LoginRequired) as e:
+        except InvalidToken as e:
+            self.access_token.async_invalidate()
             raise ConfigEntryAuthFailed from e
+        except (SubscriptionRequired, LoginRequired) as e:
+            raise ConfigEntryAuthFailed from e
+        except InsufficientCredits as e:
+            raise _insufficient_credits(self.governor) from e
         except RETRY_EXCEPTIONS as e:
             raise UpdateFailed(
                 translation_domain=DOMAIN,
@@ -324,20 +795,169 @@ class TeslemetryEnergyHistoryCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 translation_placeholders={"message": e.message},
             ) from e
 
+        self.governor.async_clear_exhausted()
         if not data or not isinstance(data.get("time_series"), list):
             raise UpdateFailed(
                 translation_domain=DOMAIN,
                 translation_key="update_failed_invalid_data",
             )
 
-        # Add all time periods together
-        output = dict.fromkeys(ENERGY_HISTORY_FIELDS, None)
-        for period in data.get("time_series", []):
+        series: list[dict[str, Any]] = data["time_series"]
+        output = self._add_buckets(series)
+        if "recorder" in self.hass.config.components:
+            await self._async_update_statistics(series)
+
+        self.changed_keys = self._diff(output)
+        return output
+
+    def _add_buckets(self, series: list[dict[str, Any]]) -> dict[str, Any]:
+        """Add the new and changed buckets of the day to the running totals.
+
+        Each update returns the whole day, but only the buckets from the last
+        one already added onwards can be new or still changing.
+        """
+        day = series[0].get("timestamp") if series else None
+        if day != self._day:
+            # A new day of history starts the totals again
+            self._day = day
+            self._totals = dict.fromkeys(ENERGY_HISTORY_FIELDS, None)
+            self._last_bucket = {}
+
+        # Compare instants, as local timestamps repeat in the DST fold
+        last_time = _bucket_time(self._last_bucket)
+        start = len(series)
+        while start and (
+            last_time is None
+            or (
+                (time := _bucket_time(series[start - 1])) is not None
+                and time >= last_time
+            )
+        ):
+            start -= 1
+
+        for period in series[start:]:
+            previous = (
+                self._last_bucket
+                if last_time is not None and _bucket_time(period) == last_time
+                else {}
+            )
             for key in ENERGY_HISTORY_FIELDS:
                 if key in period:
-                    if output[key] is None:
-                        output[key] = period[key]
-                    else:
-                        output[key] += period[key]
+                    self._totals[key] = (
+                        (self._totals[key] or 0) + period[key] - previous.get(key, 0)
+                    )
+        if series:
+            self._last_bucket = series[-1]
+        return dict(self._totals)
+
+    def _statistic_id(self, key: str) -> str:
+        """Return the external statistic ID of an energy history field."""
+        return f"{DOMAIN}:{self.api.energy_site_id}_{key}"
+
+    async def _async_update_statistics(self, series: list[dict[str, Any]]) -> None:
+        """Import the completed hours of energy history into statistics.
+
+        The past is backfilled oldest first in bounded chunks, one per update,
+        so the cumulative sums are always built in order.
+        """
+        hours = [hour for period in series if (hour := _bucket_hour(period))]
+        if not hours:
+            return
+        day_start = hours[0]
+
+        if self._statistics_next is None:
+            await self._async_load_statistics(day_start - STATISTICS_BACKFILL)
+            assert self._statistics_next is not None
+
+        if self._statistics_next < day_start:
+            end = min(self._statistics_next + STATISTICS_CHUNK, day_start)
+            try:
+                past = (
+                    await self.api.energy_history(
+                        TeslaEnergyPeriod.DAY,
+                        start_date=self._statistics_next.isoformat(),
+                        end_date=end.isoformat(),
+                    )
+                )["response"]
+            except TeslaFleetError as e:
+                LOGGER.debug("Energy history backfill failed: %s", e.message)
+                return
+            if not past or not isinstance(past.get("time_series"), list):
+                return
+            self._async_import_statistics(past["time_series"], end)
+            return
+
+        # The hour of the latest bucket is still being filled
+        self._async_import_statistics(series, hours[-1])
+
+    async def _async_load_statistics(self, backfill_from: datetime) -> None:
+        """Resume the statistics after the last imported hour."""
+        statistic_ids = {key: self._statistic_id(key) for key in ENERGY_HISTORY_FIELDS}
+
+        def _get_last_statistics() -> dict[str, list[Any]]:
+            return {
+                key: get_last_statistics(self.hass, 1, statistic_id, True, {"sum"}).get(
+                    statistic_id, []
+                )
+                for key, statistic_id in statistic_ids.items()
+            }
+
+        last_statistics = await get_instance(self.hass).async_add_executor_job(
+            _get_last_statistics
+        )
+        latest: datetime | None = None
+        for key, rows in last_statistics.items():
+            if not rows:
+                continue
+            self._statistics_sums[key] = rows[0].get("sum") or 0
+            start = dt_util.utc_from_timestamp(rows[0]["start"])
+            if latest is None or start > latest:
+                latest = start
+        self._statistics_next = (
+            latest + timedelta(hours=1) if latest is not None else backfill_from
+        )
 
-        return output
+    @callback
+    def _async_import_statistics(
+        self, series: list[dict[str, Any]], before: datetime
+    ) -> None:
+        """Import the hourly totals of buckets up to an hour as statistics."""
+        assert self._statistics_next is not None
+        hourly: dict[datetime, dict[str, float]] = {}
+        for period in series:
+            hour = _bucket_hour(period)
+            if hour is None or not self._statistics_next <= hour < before:
+                continue
+            totals = hourly.setdefault(hour, {})
+            for key in ENERGY_HISTORY_FIELDS:
+                if isinstance(value := period.get(key), int | float):
+                    totals[key] = totals.get(key, 0) + value
+
+        for key in ENERGY_HISTORY_FIELDS:
+            statistics: list[StatisticData] = []
+            for hour in sorted(hourly):
+                if (value := hourly[hour].get(key)) is None:
+                    continue
+                self._statistics_sums[key] = self._statistics_sums.get(key, 0) + value
+                statistics.append(
+                    StatisticData(
+                        start=hour, state=value, sum=self._statistics_sums[key]
+                    )
+                )
+            if not statistics:
+                continue
+            async_add_external_statistics(
+                self.hass,
+                StatisticMetaData(
+                    mean_type=StatisticMeanType.NONE,
+                    has_sum=True,
+                    name=None,
+                    source=DOMAIN,
+                    statistic_id=self._statistic_id(key),
+                    unit_class=EnergyConverter.UNIT_CLASS,
+                    unit_of_measurement=UnitOfEnergy.WATT_HOUR,
+                ),
+                statistics,
+            )
+
+        self._statistics_next = max(self._statistics_next, before)
@@ -1,5 +1,6 @@
 """Cover platform for Teslemetry integration."""
 
+from collections.abc import Iterable
 from itertools import chain
 from typing import Any, override
 
@@ -29,9 +30,9 @@ from .entity import (
     TeslemetryRootEntity,
     TeslemetryVehiclePollingEntity,
     TeslemetryVehicleStreamEntity,
+    async_add_product_entities,
 )
-from .helpers import handle_vehicle_command
-from .models import TeslemetryVehicleData
+from .models import TeslemetryProducts, TeslemetryVehicleData
 
 OPEN = 1
 CLOSED = 0
@@ -47,60 +48,50 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Teslemetry cover platform from a config entry."""
 
-    async_add_entities(
-        chain(
+    def _product_entities(products: TeslemetryProducts) -> Iterable[CoverEntity]:
+        """Return the entities of the products."""
+        return chain(
             (
-                TeslemetryVehiclePollingWindowEntity(vehicle, entry.runtime_data.scopes)
+                TeslemetryVehiclePollingWindowEntity(vehicle, products.scopes)
                 if vehicle.poll or not firmware_at_least(vehicle.firmware, "2024.26")
-                else TeslemetryStreamingWindowEntity(vehicle, entry.runtime_data.scopes)
-                for vehicle in entry.runtime_data.vehicles
+                else TeslemetryStreamingWindowEntity(vehicle, products.scopes)
+                for vehicle in products.vehicles
             ),
             (
-                TeslemetryVehiclePollingChargePortEntity(
-                    vehicle, entry.runtime_data.scopes
-                )
+                TeslemetryVehiclePollingChargePortEntity(vehicle, products.scopes)
                 if vehicle.poll or not firmware_at_least(vehicle.firmware, "2024.44.25")
-                else TeslemetryStreamingChargePortEntity(
-                    vehicle, entry.runtime_data.scopes
-                )
-                for vehicle in entry.runtime_data.vehicles
+                else TeslemetryStreamingChargePortEntity(vehicle, products.scopes)
+                for vehicle in products.vehicles
             ),
             (
-                TeslemetryVehiclePollingFrontTrunkEntity(
-                    vehicle, entry.runtime_data.scopes
-                )
+                TeslemetryVehiclePollingFrontTrunkEntity(vehicle, products.scopes)
                 if vehicle.poll or not firmware_at_least(vehicle.firmware, "2024.26")
-                else TeslemetryStreamingFrontTrunkEntity(
-                    vehicle, entry.runtime_data.scopes
-                )
-                for vehicle in entry.runtime_data.vehicles
+                else TeslemetryStreamingFrontTrunkEntity(vehicle, products.scopes)
+                for vehicle in products.vehicles
             ),
             (
-                TeslemetryVehiclePollingRearTrunkEntity(
-                    vehicle, entry.runtime_data.scopes
-                )
+                TeslemetryVehiclePollingRearTrunkEntity(vehicle, products.scopes)
                 if vehicle.poll or not firmware_at_least(vehicle.firmware, "2024.26")
-                else TeslemetryStreamingRearTrunkEntity(
-                    vehicle, entry.runtime_data.scopes
-                )
-                for vehicle in entry.runtime_data.vehicles
+                else TeslemetryStreamingRearTrunkEntity(vehicle, products.scopes)
+                for vehicle in products.vehicles
             ),
             (
-                TeslemetrySunroofEntity(vehicle, entry.runtime_data.scopes)
-                for vehicle in entry.runtime_data.vehicles
+                TeslemetrySunroofEntity(vehicle, products.scopes)
+                for vehicle in products.vehicles
                 if vehicle.poll
                 and vehicle.coordinator.data.get("vehicle_config_sun_roof_installed")
             ),
             (
-                TeslemetryStreamingTonneauEntity(vehicle, entry.runtime_data.scopes)
-                for vehicle in entry.runtime_data.vehicles
+                TeslemetryStreamingTonneauEntity(vehicle, products.scopes)
+                for vehicle in products.vehicles
                 if not vehicle.poll
                 and firmware_at_least(vehicle.firmware, "2024.44.25")
                 and vehicle.coordinator.data.get("vehicle_config_car_type")
                 == "cybertruck"
             ),
         )
-    )
+
+    async_add_product_entities(entry, async_add_entities, _product_entities)
 
 
 class CoverRestoreEntity(RestoreEntity, CoverEntity):
@@ -121,6 +112,7 @@ class TeslemetryWindowEntity(TeslemetryRootEntity, CoverEntity):
     """Base class for window cover entities."""
 
     api: Vehicle
+    vehicle: TeslemetryVehicleData
     _attr_device_class = CoverDeviceClass.WINDOW
     _attr_supported_features = CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
 
@@ -129,7 +121,7 @@ class TeslemetryWindowEntity(TeslemetryRootEntity, CoverEntity):
         """Vent windows."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-        await handle_vehicle_command(
+        await self.vehicle.executor.async_execute(
             self.api.window_control(command=WindowCommand.VENT)
         )
         self._attr_is_closed = False
@@ -140,7 +132,7 @@ class TeslemetryWindowEntity(TeslemetryRootEntity, CoverEntity):
         """Close windows."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-        await handle_vehicle_command(
+        await self.vehicle.executor.async_execute(
             self.api.window_control(command=WindowCommand.CLOSE)
         )
         self._attr_is_closed = True
@@ -200,23 +192,20 @@ class TeslemetryStreamingWindowEntity(
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        self.async_on_remove(
-            self.stream.async_add_listener(
-                self._handle_stream_update,
-                {"vin": self.vin, "data": None},
-            )
-        )
-        for signal in (
+        signals = (
             Signal.FD_WINDOW,
             Signal.FP_WINDOW,
             Signal.RD_WINDOW,
             Signal.RP_WINDOW,
-        ):
-            self.vehicle.config_entry.async_create_background_task(
-                self.hass,
-                self.add_field(signal),
-                f"Adding field {signal} to {self.vehicle.vin}",
+        )
+        for signal in signals:
+            self.async_on_remove(
+                self.stream.async_add_listener(
+                    self._handle_stream_update,
+                    {"vin": self.vin, "data": {signal: None}},
+                )
             )
+        self.vehicle.stream_vehicle.async_enable_fields(signals)
 
     def _handle_stream_update(self, data: dict[str, Any]) -> None:
         """Update the entity attributes."""
@@ -245,7 +234,7 @@ class TeslemetryStreamingWindowEntity(
         else:
             self._attr_is_closed = True
 
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
 
 class TeslemetryChargePortEntity(
@@ -255,6 +244,7 @@ class TeslemetryChargePortEntity(
     """Base class for for charge port cover entities."""
 
     api: Vehicle
+    vehicle: TeslemetryVehicleData
     _attr_device_class = CoverDeviceClass.DOOR
     _attr_supported_features = CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
 
@@ -263,7 +253,7 @@ class TeslemetryChargePortEntity(
         """Open charge port."""
         self.raise_for_scope(Scope.VEHICLE_CHARGING_CMDS)
 
-        await handle_vehicle_command(self.api.charge_port_door_open())
+        await self.vehicle.executor.async_execute(self.api.charge_port_door_open())
         self._attr_is_closed = False
         self.async_write_ha_state()
 
@@ -272,7 +262,7 @@ class TeslemetryChargePortEntity(
         """Close charge port."""
         self.raise_for_scope(Scope.VEHICLE_CHARGING_CMDS)
 
-        await handle_vehicle_command(self.api.charge_port_door_close())
+        await self.vehicle.executor.async_execute(self.api.charge_port_door_close())
         self._attr_is_closed = True
         self.async_write_ha_state()
 
@@ -334,13 +324,14 @@ class TeslemetryStreamingChargePortEntity(
     def _async_value_from_stream(self, value: bool | None) -> None:
         """Update the value of the entity."""
         self._attr_is_closed = None if value is None else not value
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
 
 class TeslemetryFrontTrunkEntity(TeslemetryRootEntity, CoverEntity):
     """Base class for the front trunk cover entities."""
 
     api: Vehicle
+    vehicle: TeslemetryVehicleData
     _attr_device_class = CoverDeviceClass.DOOR
     _attr_supported_features = CoverEntityFeature.OPEN
 
@@ -349,7 +340,7 @@ class TeslemetryFrontTrunkEntity(TeslemetryRootEntity, CoverEntity):
         """Open front trunk."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-        await handle_vehicle_command(self.api.actuate_trunk(Trunk.FRONT))
+        await self.vehicle.executor.async_execute(self.api.actuate_trunk(Trunk.FRONT))
         self._attr_is_closed = False
         self.async_write_ha_state()
 
@@ -401,13 +392,14 @@ class TeslemetryStreamingFrontTrunkEntity(
         """Update the entity attributes."""
 
         self._attr_is_closed = None if value is None else not value
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
 
 class TeslemetryRearTrunkEntity(TeslemetryRootEntity, CoverEntity):
     """Cover entity for the rear trunk."""
 
     api: Vehicle
+    vehicle: TeslemetryVehicleData
     _attr_device_class = CoverDeviceClass.DOOR
     _attr_supported_features = CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
 
@@ -417,7 +409,9 @@ class TeslemetryRearTrunkEntity(TeslemetryRootEntity, CoverEntity):
         if self.is_closed is not False:
             self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-            await handle_vehicle_command(self.api.actuate_trunk(Trunk.REAR))
+            await self.vehicle.executor.async_execute(
+                self.api.actuate_trunk(Trunk.REAR)
+            )
             self._attr_is_closed = False
             self.async_write_ha_state()
 
@@ -427,7 +421,9 @@ class TeslemetryRearTrunkEntity(TeslemetryRootEntity, CoverEntity):
         if self.is_closed is not True:
             self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-            await handle_vehicle_command(self.api.actuate_trunk(Trunk.REAR))
+            await self.vehicle.executor.async_execute(
+                self.api.actuate_trunk(Trunk.REAR)
+            )
             self._attr_is_closed = True
             self.async_write_ha_state()
 
@@ -476,7 +472,7 @@ class TeslemetryStreamingRearTrunkEntity(
         """Update the entity attributes."""
 
         self._attr_is_closed = None if value is None else not value
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
 
 class TeslemetrySunroofEntity(TeslemetryVehiclePollingEntity, CoverEntity):
@@ -514,7 +510,9 @@ class TeslemetrySunroofEntity(TeslemetryVehiclePollingEntity, CoverEntity):
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open sunroof."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
-        await handle_vehicle_command(self.api.sun_roof_control(SunRoofCommand.VENT))
+        await self.vehicle.executor.async_execute(
+            self.api.sun_roof_control(SunRoofCommand.VENT)
+        )
         self._attr_is_closed = False
         self.async_write_ha_state()
 
@@ -522,7 +520,9 @@ class TeslemetrySunroofEntity(TeslemetryVehiclePollingEntity, CoverEntity):
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close sunroof."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
-        await handle_vehicle_command(self.api.sun_roof_control(SunRoofCommand.CLOSE))
+        await self.vehicle.executor.async_execute(
+            self.api.sun_roof_control(SunRoofCommand.CLOSE)
+        )
         self._attr_is_closed = True
         self.async_write_ha_state()
 
@@ -530,7 +530,9 @@ class TeslemetrySunroofEntity(TeslemetryVehiclePollingEntity, CoverEntity):
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Close sunroof."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
-        await handle_vehicle_command(self.api.sun_roof_control(SunRoofCommand.STOP))
+        await self.vehicle.executor.async_execute(
+            self.api.sun_roof_control(SunRoofCommand.STOP)
+        )
         self._attr_is_closed = False
         self.async_write_ha_state()
 
@@ -539,6 +541,7 @@ class TeslemetryTonneauEntity(TeslemetryRootEntity, CoverEntity):
     """Base class for the Cybertruck tonneau cover entity."""
 
     api: Vehicle
+    vehicle: TeslemetryVehicleData
     _attr_device_class = CoverDeviceClass.DOOR
     _attr_supported_features = (
         CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE | CoverEntityFeature.STOP
@@ -548,7 +551,9 @@ class TeslemetryTonneauEntity(TeslemetryRootEntity, CoverEntity):
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open tonneau."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
-        await handle_vehicle_command(self.api.closure(tonneau=ClosureState.OPEN))
+        await self.vehicle.executor.async_execute(
+            self.api.closure(tonneau=ClosureState.OPEN)
+        )
         self._attr_is_closed = False
         self.async_write_ha_state()
 
@@ -556,7 +561,9 @@ class TeslemetryTonneauEntity(TeslemetryRootEntity, CoverEntity):
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close tonneau."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
-        await handle_vehicle_command(self.api.closure(tonneau=ClosureState.CLOSE))
+        await self.vehicle.executor.async_execute(
+            self.api.closure(tonneau=ClosureState.CLOSE)
+        )
         self._attr_is_closed = True
         self.async_write_ha_state()
 
@@ -564,7 +571,9 @@ class TeslemetryTonneauEntity(TeslemetryRootEntity, CoverEntity):
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop tonneau."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
-        await handle_vehicle_command(self.api.closure(tonneau=ClosureState.STOP))
+        await self.vehicle.executor.async_execute(
+            self.api.closure(tonneau=ClosureState.STOP)
+        )
         self._attr_is_closed = False
         self.async_write_ha_state()
 
@@ -608,9 +617,9 @@ class TeslemetryStreamingTonneauEntity(
             self._attr_is_closed = None
         else:
             self._attr_is_closed = value == TONNEAU_CLOSED
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_percent_from_stream(self, value: float | None) -> None:
         """Update the entity attributes."""
         self._attr_current_cover_position = None if value is None else int(value)
-        self.async_write_ha_state()
+        self.async_write_stream_state()
@@ -1,6 +1,6 @@
 """Device tracker platform for Teslemetry integration."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import override
 
@@ -19,8 +19,12 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from . import TeslemetryConfigEntry
-from .entity import TeslemetryVehiclePollingEntity, TeslemetryVehicleStreamEntity
-from .models import TeslemetryVehicleData
+from .entity import (
+    TeslemetryVehiclePollingEntity,
+    TeslemetryVehicleStreamEntity,
+    async_add_product_entities,
+)
+from .models import TeslemetryProducts, TeslemetryVehicleData
 
 PARALLEL_UPDATES = 0
 
@@ -70,31 +74,35 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Teslemetry device tracker platform from a config entry."""
 
-    entities: list[
-        TeslemetryVehiclePollingDeviceTrackerEntity
-        | TeslemetryStreamingDeviceTrackerEntity
-    ] = []
-    # Only add vehicle location entities if the user has granted vehicle location scope.
-    if Scope.VEHICLE_LOCATION not in entry.runtime_data.scopes:
-        return
-
-    for vehicle in entry.runtime_data.vehicles:
-        for description in DESCRIPTIONS:
-            if vehicle.poll or not firmware_at_least(
-                vehicle.firmware, description.streaming_firmware
-            ):
-                if description.polling_prefix:
-                    entities.append(
-                        TeslemetryVehiclePollingDeviceTrackerEntity(
-                            vehicle, description
+    def _product_entities(products: TeslemetryProducts) -> Iterable[TrackerEntity]:
+        """Return the entities of the products."""
+        entities: list[
+            TeslemetryVehiclePollingDeviceTrackerEntity
+            | TeslemetryStreamingDeviceTrackerEntity
+        ] = []
+        # Only add vehicle location entities with the vehicle location scope
+        if Scope.VEHICLE_LOCATION not in products.scopes:
+            return []
+
+        for vehicle in products.vehicles:
+            for description in DESCRIPTIONS:
+                if vehicle.poll or not firmware_at_least(
+                    vehicle.firmware, description.streaming_firmware
+                ):
+                    if description.polling_prefix:
+                        entities.append(
+                            TeslemetryVehiclePollingDeviceTrackerEntity(
+                                vehicle, description
+                            )
                         )
+                else:
+                    entities.append(
+                        TeslemetryStreamingDeviceTrackerEntity(vehicle, description)
                     )
-            else:
-                entities.append(
-                    TeslemetryStreamingDeviceTrackerEntity(vehicle, description)
-                )
 
-    async_add_entities(entities)
+        return entities
+
+    async_add_product_entities(entry, async_add_entities, _product_entities)
 
 
 class TeslemetryVehiclePollingDeviceTrackerEntity(
@@ -160,4 +168,4 @@ class TeslemetryStreamingDeviceTrackerEntity(
         """Update the value of the entity."""
         self._attr_latitude = None if location is None else location.latitude
         self._attr_longitude = None if location is None else location.longitude
-        self.async_write_ha_state()
+        self.async_write_stream_state()
@@ -33,9 +33,13 @@ async def async_get_config_entry_diagnostics(
     vehicles = [
         {
             "data": async_redact_data(x.coordinator.data, VEHICLE_REDACT),
+            "polls": x.coordinator.async_diagnostics(),
             "stream": {
                 "config": x.stream_vehicle.config,
+                "failover": x.failover.async_diagnostics(),
+                "health": x.stream_vehicle.health.async_diagnostics(),
             },
+            "commands": x.executor.async_diagnostics(),
         }
         for x in entry.runtime_data.vehicles
     ]
@@ -55,4 +59,10 @@ async def async_get_config_entry_diagnostics(
         "vehicles": vehicles,
         "energysites": energysites,
         "scopes": entry.runtime_data.scopes,
+        "credits": entry.runtime_data.governor.async_diagnostics(),
+        "stream": (
+            entry.runtime_data.stream.health.async_diagnostics()
+            if entry.runtime_data.stream
+            else None
+        ),
     }
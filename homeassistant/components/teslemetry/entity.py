@@ -1,26 +1,61 @@
 """Teslemetry parent entity class."""
 
 from abc import abstractmethod
+from collections.abc import Callable, Iterable
+from contextlib import AbstractContextManager
+from functools import partial
 from typing import Any, override
 
 from tesla_fleet_api.const import Scope
 from tesla_fleet_api.teslemetry import EnergySite, Vehicle
+import voluptuous as vol
 
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, LOGGER
 from .coordinator import (
     TeslemetryEnergyHistoryCoordinator,
     TeslemetryEnergySiteInfoCoordinator,
     TeslemetryEnergySiteLiveCoordinator,
     TeslemetryVehicleDataCoordinator,
 )
-from .models import TeslemetryEnergyData, TeslemetryVehicleData
+from .models import (
+    TeslemetryData,
+    TeslemetryEnergyData,
+    TeslemetryProducts,
+    TeslemetryVehicleData,
+)
+from .stream import (
+    CONF_STREAM_INTERVAL,
+    CONF_STREAM_MINIMUM_DELTA,
+    STREAM_OPTIONS_SCHEMA,
+)
+
+
+@callback
+def async_add_product_entities(
+    entry: ConfigEntry[TeslemetryData],
+    async_add_entities: AddConfigEntryEntitiesCallback,
+    product_entities: Callable[[TeslemetryProducts], Iterable[Entity]],
+) -> None:
+    """Add the entities of every product, and of products added later."""
+
+    @callback
+    def _async_add_products(products: TeslemetryProducts) -> None:
+        async_add_entities(product_entities(products))
+
+    _async_add_products(entry.runtime_data.products)
+    entry.async_on_unload(
+        entry.runtime_data.async_add_product_listener(_async_add_products)
+    )
 
 
 class TeslemetryRootEntity(Entity):
@@ -61,26 +96,50 @@ class TeslemetryPollingEntity(
         """Initialize common aspects of a Teslemetry entity."""
         super().__init__(coordinator)
         self.key = key
+        # Every coordinator key this entity has read, indexed on the coordinator
+        # so updates that did not touch any of them skip this entity
+        self._read_keys: set[str] = set()
         self._attr_translation_key = self.key
         self._async_update_attrs()
 
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Index this entity under the coordinator keys it reads."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_key_listener(
+                self._handle_coordinator_update, self._read_keys
+            )
+        )
+
     @property
     @override
     def available(self) -> bool:
         """Return if sensor is available."""
         return self.coordinator.last_update_success and self._attr_available
 
+    def _track_key(self, key: str) -> None:
+        """Record that this entity reads a coordinator key."""
+        if key not in self._read_keys:
+            self._read_keys.add(key)
+            self.coordinator.async_add_listener_key(
+                self._handle_coordinator_update, key
+            )
+
     @property
     def _value(self) -> Any | None:
         """Return a specific value from coordinator data."""
+        self._track_key(self.key)
         return self.coordinator.data.get(self.key)
 
     def get(self, key: str, default: Any | None = None) -> Any | None:
         """Return a specific value from coordinator data."""
+        self._track_key(key)
         return self.coordinator.data.get(key, default)
 
     def get_number(self, key: str, default: float) -> float:
         """Return a specific number from coordinator data."""
+        self._track_key(key)
         if isinstance(value := self.coordinator.data.get(key), (int, float)):
             return value
         return default
@@ -131,6 +190,7 @@ class TeslemetryVehiclePollingEntity(TeslemetryPollingEntity):
     @override
     def _value(self) -> Any | None:
         """Return a specific value from coordinator data."""
+        self._track_key(self.key)
         return self.coordinator.data.get(self.key)
 
 
@@ -240,6 +300,7 @@ class TeslemetryWallConnectorEntity(TeslemetryPollingEntity):
     @override
     def _value(self) -> StateType:
         """Return a specific wall connector value from coordinator data."""
+        self._track_key("wall_connectors")
         value: StateType = (
             self.coordinator.data.get("wall_connectors", {})
             .get(self.din, {})
@@ -250,6 +311,7 @@ class TeslemetryWallConnectorEntity(TeslemetryPollingEntity):
     @property
     def exists(self) -> bool:
         """Return True if it exists in the wall connector coordinator data."""
+        self._track_key("wall_connectors")
         return self.key in self.coordinator.data.get("wall_connectors", {}).get(
             self.din, {}
         )
@@ -259,6 +321,8 @@ class TeslemetryVehicleStreamEntity(TeslemetryRootEntity):
     """Parent class for Teslemetry Vehicle Stream entities."""
 
     api: Vehicle
+    _attr_stream_interval: int | None = None
+    _attr_stream_minimum_delta: float | None = None
 
     def __init__(self, data: TeslemetryVehicleData, key: str) -> None:
         """Initialize common aspects of a Teslemetry entity."""
@@ -267,8 +331,61 @@ class TeslemetryVehicleStreamEntity(TeslemetryRootEntity):
         self.api = data.api
         self.stream = data.stream
         self.vin = data.vin
-        self.add_field = data.stream.get_vehicle(self.vin).add_field
 
         self._attr_translation_key = key
         self._attr_unique_id = f"{data.vin}-{key}"
         self._attr_device_info = data.device
+
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Drop any pending stream write when the entity is removed."""
+        await super().async_added_to_hass()
+        self.async_on_remove(partial(self.vehicle.stream_writer.async_discard, self))
+        self.async_on_remove(
+            partial(self.vehicle.stream_vehicle.async_remove_field_options, self)
+        )
+
+    @property
+    def stream_field_options(self) -> dict[str, Any]:
+        """Return the stream config for the fields of the entity.
+
+        The entity options override the interval and minimum delta, invalid
+        options are ignored.
+        """
+        options: dict[str, Any] = {}
+        if self.registry_entry is not None:
+            try:
+                options = STREAM_OPTIONS_SCHEMA(
+                    dict(self.registry_entry.options.get(DOMAIN, {}))
+                )
+            except vol.Invalid as err:
+                LOGGER.warning(
+                    "Ignoring invalid stream options of %s: %s", self.entity_id, err
+                )
+        return {
+            "interval_seconds": options.get(
+                CONF_STREAM_INTERVAL, self._attr_stream_interval
+            ),
+            "minimum_delta": options.get(
+                CONF_STREAM_MINIMUM_DELTA, self._attr_stream_minimum_delta
+            ),
+        }
+
+    def stream_fields_configured(self) -> AbstractContextManager[None]:
+        """Give the fields listeners enable inside the block the entity config."""
+        return self.vehicle.stream_vehicle.field_options(
+            self, self.stream_field_options
+        )
+
+    @callback
+    @override
+    def async_registry_entry_updated(self) -> None:
+        """Apply changed entity options to the stream config."""
+        self.vehicle.stream_vehicle.async_update_field_options(
+            self, self.stream_field_options
+        )
+
+    @callback
+    def async_write_stream_state(self) -> None:
+        """Write state for a stream update, coalesced with the vehicle's others."""
+        self.vehicle.stream_writer.async_schedule_write(self)
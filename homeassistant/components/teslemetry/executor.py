@@ -0,0 +1,159 @@
+"""Vehicle command executor for the Teslemetry integration."""
+
+import asyncio
+from collections.abc import Coroutine
+from datetime import datetime, timedelta
+from typing import Any
+
+from tesla_fleet_api.teslemetry import Vehicle
+
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+from .const import LOGGER, TeslemetryState
+from .coordinator import TeslemetryVehicleDataCoordinator
+from .helpers import handle_command, handle_vehicle_command
+
+# Vehicle states that need a wake up before a command can be delivered
+SLEEP_STATES = {TeslemetryState.ASLEEP, TeslemetryState.OFFLINE}
+# Longest time to wait for the vehicle to report online after a wake up
+WAKE_TIMEOUT = timedelta(seconds=30)
+
+
+class TeslemetryCommandExecutor:
+    """Run the commands for one vehicle in order under its wakelock.
+
+    Commands that arrive together, such as several automations firing at the
+    same time, queue on the lock. The first command to find the vehicle
+    asleep wakes it, and the rest run back to back in the same awake window
+    instead of each triggering a wake of their own. This holds even when the
+    vehicle does not report online in time, as the queued commands share the
+    one wake up until the queue drains.
+    """
+
+    def __init__(
+        self,
+        api: Vehicle,
+        coordinator: TeslemetryVehicleDataCoordinator,
+        wakelock: asyncio.Lock,
+    ) -> None:
+        """Initialize the executor."""
+        self.api = api
+        self.coordinator = coordinator
+        self.wakelock = wakelock
+        self.queue_depth = 0
+        self.commands = 0
+        self.wakes = 0
+        self.commands_since_wake = 0
+        self.wake_latency: timedelta | None = None
+        self.last_wake: datetime | None = None
+        # A wake up was sent for the commands queued now
+        self.woken = False
+
+    @property
+    def asleep(self) -> bool:
+        """Return if the last known vehicle state needs a wake up."""
+        return not self.woken and self.coordinator.data.get("state") in SLEEP_STATES
+
+    async def async_execute(self, command: Coroutine[Any, Any, dict[str, Any]]) -> Any:
+        """Run a vehicle command, waking the vehicle first if it is asleep."""
+        self.queue_depth += 1
+        try:
+            async with self.wakelock:
+                if self.asleep:
+                    await self._async_wake()
+                result = await handle_vehicle_command(
+                    command, self.coordinator.governor
+                )
+                self.commands += 1
+                self.commands_since_wake += 1
+                return result
+        finally:
+            # Never leave a command that did not get to run unawaited
+            command.close()
+            self._async_dequeue()
+
+    async def async_wake(self) -> dict[str, Any]:
+        """Wake the vehicle, after any commands already queued."""
+        self.queue_depth += 1
+        try:
+            async with self.wakelock:
+                return await self._async_wake()
+        finally:
+            self._async_dequeue()
+
+    @callback
+    def _async_dequeue(self) -> None:
+        """Count a finished request, ending the shared wake once none are left."""
+        self.queue_depth -= 1
+        if not self.queue_depth:
+            self.woken = False
+
+    async def _async_wake(self) -> dict[str, Any]:
+        """Wake the vehicle and wait for it to report online."""
+        started = dt_util.utcnow()
+        result = await handle_command(self.api.wake_up(), self.coordinator.governor)
+        self.wakes += 1
+        self.commands_since_wake = 0
+        self.last_wake = started
+        self.woken = True
+
+        state = (result.get("response") or {}).get("state")
+        if state == TeslemetryState.ONLINE:
+            self.coordinator.async_set_updated_state(state)
+        elif not await self._async_wait_online():
+            LOGGER.debug(
+                "Vehicle %s did not report online within %s of a wake up",
+                self.coordinator.vin,
+                WAKE_TIMEOUT,
+            )
+            # Leave the command to fail or be delivered by the API
+            return result
+
+        self.wake_latency = dt_util.utcnow() - started
+        return result
+
+    async def _async_wait_online(self) -> bool:
+        """Wait for the stream or a poll to report the vehicle online."""
+        online = asyncio.Event()
+
+        @callback
+        def _async_check_state() -> None:
+            if self.coordinator.data.get("state") == TeslemetryState.ONLINE:
+                online.set()
+
+        _async_check_state()
+        if online.is_set():
+            return True
+        remove_listener = self.coordinator.async_add_listener(_async_check_state)
+        remove_key_listener = self.coordinator.async_add_key_listener(
+            _async_check_state, ["state"]
+        )
+        try:
+            async with asyncio.timeout(WAKE_TIMEOUT.total_seconds()):
+                await online.wait()
+        except TimeoutError:
+            return False
+        finally:
+            remove_key_listener()
+            remove_listener()
+        return True
+
+    @callback
+    def async_diagnostics(self) -> dict[str, Any]:
+        """Return the command and wake metrics."""
+        return {
+            "queue_depth": self.queue_depth,
+            "commands": self.commands,
+            "wakes": self.wakes,
+            "commands_since_wake": self.commands_since_wake,
+            "commands_per_wake": (
+                round(self.commands / self.wakes, 2) if self.wakes else None
+            ),
+            "wake_latency": (
+                self.wake_latency.total_seconds()
+                if self.wake_latency is not None
+                else None
+            ),
+            "last_wake": self.last_wake.isoformat() if self.last_wake else None,
+        }
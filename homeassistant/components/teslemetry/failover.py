@@ -0,0 +1,137 @@
+"""Stream liveness and polling failover for the Teslemetry integration."""
+
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from .const import LOGGER, TeslemetryState
+from .coordinator import TeslemetryVehicleDataCoordinator
+from .stream import TeslemetryDispatchStream
+
+# Time the stream may stay disconnected before an online vehicle is polled
+STREAM_DOWN = timedelta(minutes=5)
+# How often the stream liveness is checked
+LIVENESS_INTERVAL = timedelta(minutes=1)
+# Number of failover transitions kept for diagnostics
+TRANSITION_HISTORY = 10
+
+
+class TeslemetryStreamFailover:
+    """Poll a vehicle while its stream is down.
+
+    An online vehicle that is idle sends no frames, so silence alone does not
+    mean the stream was lost. The stream library closes the connection on
+    every error and reconnects with a backoff, so a stream that stays
+    disconnected for a while has lost the vehicle. Vehicle data is then
+    polled at a throttled interval until the stream is back.
+    """
+
+    def __init__(
+        self,
+        stream: TeslemetryDispatchStream,
+        coordinator: TeslemetryVehicleDataCoordinator,
+    ) -> None:
+        """Initialize the failover."""
+        self.stream = stream
+        self.coordinator = coordinator
+        self.active = False
+        self.connected = False
+        self.disconnected_at: datetime | None = None
+        self.last_frame: datetime | None = None
+        self.transitions: deque[dict[str, Any]] = deque(maxlen=TRANSITION_HISTORY)
+
+    @callback
+    def async_start(self, hass: HomeAssistant) -> CALLBACK_TYPE:
+        """Start checking the stream liveness and return a callback to stop."""
+        self._async_handle_connection(bool(self.stream.connected))
+        remove_interval = async_track_time_interval(
+            hass, self._async_check, LIVENESS_INTERVAL
+        )
+        remove_connection = self.stream.async_add_connection_listener(
+            self._async_handle_connection
+        )
+
+        @callback
+        def _async_stop() -> None:
+            remove_interval()
+            remove_connection()
+
+        return _async_stop
+
+    @callback
+    def _async_handle_connection(self, connected: bool) -> None:
+        """Record a connection change of the stream."""
+        self.connected = connected
+        if connected:
+            self.disconnected_at = None
+        elif self.disconnected_at is None:
+            self.disconnected_at = dt_util.utcnow()
+        self._async_check()
+
+    @callback
+    def async_frame(self) -> None:
+        """Record a frame from the stream, and stop polling if it was down."""
+        self.last_frame = dt_util.utcnow()
+        # A frame proves the stream is delivering again
+        self.connected = True
+        self.disconnected_at = None
+        if self.active:
+            self._async_transition(False, "frames resumed")
+
+    def _failover_reason(self, now: datetime) -> str | None:
+        """Return why the stream should be replaced by polling, if it should."""
+        if (
+            self.coordinator.polling
+            or self.coordinator.data.get("state") != TeslemetryState.ONLINE
+        ):
+            return None
+        if (since := self.disconnected_at) is not None and now - since >= STREAM_DOWN:
+            return "stream disconnected"
+        return None
+
+    @callback
+    def _async_check(self, *_: Any) -> None:
+        """Start or stop polling to match the stream liveness."""
+        reason = self._failover_reason(dt_util.utcnow())
+        if reason is not None and not self.active:
+            self._async_transition(True, reason)
+        elif reason is None and self.active:
+            self._async_transition(
+                False, "stream connected" if self.connected else "vehicle not online"
+            )
+
+    @callback
+    def _async_transition(self, active: bool, reason: str) -> None:
+        """Switch between streaming and polling."""
+        LOGGER.debug(
+            "%s polling %s: %s",
+            "Starting" if active else "Stopping",
+            self.coordinator.vin,
+            reason,
+        )
+        self.active = active
+        self.transitions.append(
+            {
+                "time": dt_util.utcnow().isoformat(),
+                "polling": active,
+                "reason": reason,
+            }
+        )
+        self.coordinator.async_set_failover(active)
+
+    @callback
+    def async_diagnostics(self) -> dict[str, Any]:
+        """Return the stream liveness and failover transitions."""
+        return {
+            "connected": self.connected,
+            "disconnected_at": (
+                self.disconnected_at.isoformat() if self.disconnected_at else None
+            ),
+            "polling": self.active,
+            "last_frame": self.last_frame.isoformat() if self.last_frame else None,
+            "transitions": list(self.transitions),
+        }
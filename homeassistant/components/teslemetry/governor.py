@@ -0,0 +1,200 @@
+"""Credit budget governor for the Teslemetry integration."""
+
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+# Window used to measure the recent credit spend rate
+SPEND_WINDOW = timedelta(hours=1)
+# Period to spread the available credits over when no quota reset is known
+BUDGET_HORIZON = timedelta(days=30)
+# Largest factor an update interval is stretched by
+MAX_STRETCH = 8.0
+# Number of throttling decisions kept for diagnostics
+DECISION_HISTORY = 20
+# Insufficient credits will not resolve themselves quickly, so back off polling
+# instead of hammering the API at the coordinator's normal interval.
+INSUFFICIENT_CREDITS_RETRY_AFTER = timedelta(hours=1).total_seconds()
+
+
+class TeslemetryCreditGovernor:
+    """Pace API requests against the remaining Teslemetry credits.
+
+    Credit events from the stream report what each request cost, the
+    remaining balance and how much of the quota has been used. The governor
+    projects the recent spend rate against what the remaining credits can
+    sustain until the quota resets, and stretches update intervals or defers
+    non-essential refreshes when the projection exceeds the budget. Commands
+    are not sent while the API reports the credits exhausted. That report
+    expires after the retry delay, and the next request probes the credits.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the governor."""
+        self.balance: int | None = None
+        self.quota_used: int | None = None
+        self.quota_fraction: float | None = None
+        self.quota_reset_at: datetime | None = None
+        self.exhausted_at: datetime | None = None
+        self._spend: deque[tuple[datetime, int]] = deque()
+        self.decisions: deque[dict[str, Any]] = deque(maxlen=DECISION_HISTORY)
+
+    @callback
+    def async_update_credits(self, credits: dict[str, Any]) -> None:
+        """Handle a credits event from the stream."""
+        now = dt_util.utcnow()
+        balance = credits.get("balance")
+        if not isinstance(balance, int) or isinstance(balance, bool):
+            balance = None
+
+        cost = credits.get("cost")
+        if isinstance(cost, int) and not isinstance(cost, bool) and cost > 0:
+            self._spend.append((now, cost))
+        elif balance is not None and self.balance is not None:
+            if (spent := self.balance - balance) > 0:
+                self._spend.append((now, spent))
+
+        if balance is not None:
+            self.balance = balance
+            if balance > 0:
+                self.exhausted_at = None
+
+        if isinstance(quota := credits.get("quota"), dict):
+            used = quota.get("used")
+            fraction = quota.get("fraction")
+            if isinstance(used, int) and isinstance(fraction, float | int):
+                self.quota_used = used
+                self.quota_fraction = fraction
+            if isinstance(reset_at := quota.get("reset_at"), str):
+                self.quota_reset_at = dt_util.parse_datetime(reset_at)
+
+    @property
+    def exhausted(self) -> bool:
+        """Return if the API refused a request for lack of credits recently."""
+        return self.exhausted_at is not None and (
+            dt_util.utcnow() - self.exhausted_at
+            < timedelta(seconds=INSUFFICIENT_CREDITS_RETRY_AFTER)
+        )
+
+    @callback
+    def async_set_exhausted(self) -> None:
+        """Record that the API refused a request for lack of credits."""
+        self.exhausted_at = dt_util.utcnow()
+
+    @callback
+    def async_refuse_command(self) -> bool:
+        """Return if a command should not be sent as the credits ran out."""
+        if self._async_probe("command"):
+            return False
+        if not self.exhausted:
+            return False
+        self._async_record("command", "refuse", MAX_STRETCH)
+        return True
+
+    @callback
+    def async_clear_exhausted(self) -> None:
+        """Record that the API accepted a request again."""
+        self.exhausted_at = None
+
+    @callback
+    def _async_probe(self, name: str) -> bool:
+        """Return if a request should probe credits that are no longer exhausted.
+
+        Exhaustion is renewed for the probe, so other requests wait for its
+        result instead of all probing at once.
+        """
+        if self.exhausted_at is None or self.exhausted:
+            return False
+        self.async_set_exhausted()
+        self._async_record(name, "probe", MAX_STRETCH)
+        return True
+
+    @property
+    def spend_rate(self) -> float:
+        """Return the credits spent per hour over the spend window."""
+        cutoff = dt_util.utcnow() - SPEND_WINDOW
+        while self._spend and self._spend[0][0] < cutoff:
+            self._spend.popleft()
+        hours = SPEND_WINDOW.total_seconds() / 3600
+        return sum(cost for _, cost in self._spend) / hours
+
+    @property
+    def budget_rate(self) -> float | None:
+        """Return the credits per hour the remaining credits can sustain."""
+        available: float | None = None
+        if self.balance is not None:
+            available = max(self.balance, 0)
+        if self.quota_used is not None and self.quota_fraction:
+            total = self.quota_used / self.quota_fraction
+            available = (available or 0) + max(total - self.quota_used, 0)
+        if available is None:
+            return None
+
+        horizon = BUDGET_HORIZON
+        now = dt_util.utcnow()
+        if self.quota_reset_at is not None and self.quota_reset_at > now:
+            horizon = self.quota_reset_at - now
+        return available / (horizon.total_seconds() / 3600)
+
+    @property
+    def pressure(self) -> float:
+        """Return the projected spend as a fraction of the budget."""
+        if self.exhausted:
+            return MAX_STRETCH
+        if (budget := self.budget_rate) is None:
+            return 0.0
+        spend = self.spend_rate
+        if budget <= 0:
+            return MAX_STRETCH if spend else 0.0
+        return spend / budget
+
+    @callback
+    def async_interval(self, name: str, interval: timedelta) -> timedelta:
+        """Return an update interval stretched to fit the budget."""
+        stretch = min(max(self.pressure, 1), MAX_STRETCH)
+        if stretch > 1:
+            self._async_record(name, "stretch", stretch)
+        return interval * stretch
+
+    @callback
+    def async_defer(self, name: str) -> bool:
+        """Return if a non-essential refresh should be skipped."""
+        if self._async_probe(name):
+            return False
+        if (pressure := self.pressure) <= 1:
+            return False
+        self._async_record(name, "defer", pressure)
+        return True
+
+    @callback
+    def _async_record(self, name: str, action: str, factor: float) -> None:
+        """Record a throttling decision."""
+        self.decisions.append(
+            {
+                "time": dt_util.utcnow().isoformat(),
+                "coordinator": name,
+                "action": action,
+                "factor": round(factor, 2),
+            }
+        )
+
+    @callback
+    def async_diagnostics(self) -> dict[str, Any]:
+        """Return the state and recent decisions of the governor."""
+        budget = self.budget_rate
+        return {
+            "balance": self.balance,
+            "quota_used": self.quota_used,
+            "quota_fraction": self.quota_fraction,
+            "quota_reset_at": (
+                self.quota_reset_at.isoformat() if self.quota_reset_at else None
+            ),
+            "exhausted": self.exhausted,
+            "spend_rate": round(self.spend_rate, 2),
+            "budget_rate": round(budget, 2) if budget is not None else None,
+            "pressure": round(self.pressure, 2),
+            "decisions": list(self.decisions),
+        }
@@ -0,0 +1,246 @@
+"""Stream health metrics for the Teslemetry integration."""
+
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+import logging
+from math import ceil
+from typing import Any
+
+from teslemetry_stream import TeslemetryStream
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+# Window the frame rates and lag distribution are measured over
+RATE_WINDOW = timedelta(minutes=5)
+# How often listeners are told the rates have moved on
+HEALTH_INTERVAL = timedelta(seconds=30)
+# Longest reconnect backoff of the stream library, in seconds
+MAX_BACKOFF = 600
+# Logger of the stream library, whose warnings and errors are recorded
+STREAM_LOGGER = "teslemetry_stream"
+
+# The stream whose listen task is running in the current context
+_LISTENING: ContextVar[TeslemetryStream | None] = ContextVar(
+    "teslemetry_stream_listening", default=None
+)
+
+
+def _percentile(values: list[float], fraction: float) -> float | None:
+    """Return the nearest rank percentile of sorted values."""
+    if not values:
+        return None
+    return values[max(0, ceil(fraction * len(values)) - 1)]
+
+
+class TeslemetryVehicleStreamHealth:
+    """Measure the frames one vehicle sends on the stream.
+
+    Each frame is kept for the rate window with its number of fields and the
+    lag from its createdAt timestamp to when it was received.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the vehicle stream health."""
+        self.frames = 0
+        self.last_frame: datetime | None = None
+        self._window: deque[tuple[datetime, int, float | None]] = deque()
+
+    @callback
+    def async_frame(self, event: dict[str, Any]) -> None:
+        """Record a frame received from the stream."""
+        now = dt_util.utcnow()
+        lag: float | None = None
+        if isinstance(timestamp := event.get("timestamp"), int):
+            lag = max(0.0, now.timestamp() - timestamp / 1000)
+        data = event.get("data")
+        self._window.append((now, len(data) if isinstance(data, dict) else 0, lag))
+        self.frames += 1
+        self.last_frame = now
+        self._async_prune(now)
+
+    @callback
+    def _async_prune(self, now: datetime) -> None:
+        """Drop the frames that have left the rate window."""
+        cutoff = now - RATE_WINDOW
+        while self._window and self._window[0][0] < cutoff:
+            self._window.popleft()
+
+    @property
+    def frame_rate(self) -> float:
+        """Return the frames received per second over the rate window."""
+        self._async_prune(dt_util.utcnow())
+        return len(self._window) / RATE_WINDOW.total_seconds()
+
+    @property
+    def field_rate(self) -> float:
+        """Return the fields received per second over the rate window."""
+        self._async_prune(dt_util.utcnow())
+        return sum(fields for _, fields, _ in self._window) / (
+            RATE_WINDOW.total_seconds()
+        )
+
+    def lag(self, fraction: float) -> float | None:
+        """Return a percentile of the frame lag in seconds over the rate window."""
+        self._async_prune(dt_util.utcnow())
+        return _percentile(
+            sorted(lag for _, _, lag in self._window if lag is not None), fraction
+        )
+
+    @callback
+    def async_diagnostics(self) -> dict[str, Any]:
+        """Return the frame rates and lag distribution."""
+        return {
+            "frames": self.frames,
+            "last_frame": self.last_frame.isoformat() if self.last_frame else None,
+            "frame_rate": round(self.frame_rate, 3),
+            "field_rate": round(self.field_rate, 3),
+            "lag_p50": self.lag(0.5),
+            "lag_p95": self.lag(0.95),
+            "lag_max": self.lag(1),
+        }
+
+
+class _StreamErrorHandler(logging.Handler):
+    """Record the warnings and errors one stream logs from its listen task.
+
+    The stream library logs to one logger for every stream in the process,
+    so records from other streams and from config updates are filtered out.
+    """
+
+    def __init__(self, health: TeslemetryStreamHealth) -> None:
+        """Initialize the handler."""
+        super().__init__(logging.WARNING)
+        self.health = health
+        self.addFilter(lambda _: _LISTENING.get() is health.stream)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Record the message of a log record."""
+        self.health.last_error = record.getMessage()
+        self.health.last_error_at = dt_util.utcnow()
+
+
+class TeslemetryStreamHealth:
+    """Track the connection health of the Teslemetry stream.
+
+    Connects and disconnects come from the stream's connection listener. The
+    library only closes the connection from its listen task when the stream
+    fails, so those disconnects count as errors, and the warning it logged
+    just before is the last error. Listeners are notified on every
+    connection change and periodically, so the rates of the vehicles on the
+    stream are kept current.
+    """
+
+    def __init__(self, hass: HomeAssistant, stream: TeslemetryStream) -> None:
+        """Initialize the stream health."""
+        self.hass = hass
+        self.stream = stream
+        self.connects = 0
+        self.connected_at: datetime | None = None
+        self.disconnected_at: datetime | None = None
+        self.errors = 0
+        self.last_error: str | None = None
+        self.last_error_at: datetime | None = None
+        self._listeners: set[CALLBACK_TYPE] = set()
+        self._unsub_interval: CALLBACK_TYPE | None = None
+
+    @property
+    def reconnects(self) -> int:
+        """Return how often the stream connected again after its first connect."""
+        return max(0, self.connects - 1)
+
+    @property
+    def backoff(self) -> int:
+        """Return the delay before the next reconnect attempt, in seconds."""
+        if self.stream.connected or not self.stream.retries:
+            return 0
+        return min(2**self.stream.retries, MAX_BACKOFF)
+
+    @callback
+    def async_set_listening(self) -> None:
+        """Mark the current task as the listen task of the stream."""
+        _LISTENING.set(self.stream)
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start tracking the stream and return a callback to stop."""
+        handler = _StreamErrorHandler(self)
+        logger = logging.getLogger(STREAM_LOGGER)
+        logger.addHandler(handler)
+        remove_connection = self.stream.async_add_connection_listener(
+            self._async_handle_connection
+        )
+
+        @callback
+        def _async_stop() -> None:
+            logger.removeHandler(handler)
+            remove_connection()
+            self._async_cancel()
+
+        return _async_stop
+
+    @callback
+    def _async_handle_connection(self, connected: bool) -> None:
+        """Record a connection change and notify the listeners."""
+        if connected:
+            self.connects += 1
+            self.connected_at = dt_util.utcnow()
+        else:
+            self.disconnected_at = dt_util.utcnow()
+            if _LISTENING.get() is self.stream:
+                self.errors += 1
+        self._async_update_listeners()
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for connection changes and periodic rate updates."""
+        self._listeners.add(update_callback)
+        if self._unsub_interval is None:
+            self._unsub_interval = async_track_time_interval(
+                self.hass, self._async_update_listeners, HEALTH_INTERVAL
+            )
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener and stop the timer after the last one."""
+            self._listeners.discard(update_callback)
+            if not self._listeners:
+                self._async_cancel()
+
+        return remove_listener
+
+    @callback
+    def _async_cancel(self) -> None:
+        """Cancel the update timer."""
+        if self._unsub_interval is not None:
+            self._unsub_interval()
+            self._unsub_interval = None
+
+    @callback
+    def _async_update_listeners(self, *_: Any) -> None:
+        """Notify every listener."""
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_diagnostics(self) -> dict[str, Any]:
+        """Return the connection health."""
+        return {
+            "connected": bool(self.stream.connected),
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "backoff": self.backoff,
+            "connected_at": (
+                self.connected_at.isoformat() if self.connected_at else None
+            ),
+            "disconnected_at": (
+                self.disconnected_at.isoformat() if self.disconnected_at else None
+            ),
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "last_error_at": (
+                self.last_error_at.isoformat() if self.last_error_at else None
+            ),
+        }
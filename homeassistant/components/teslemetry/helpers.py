@@ -1,15 +1,16 @@
 """Teslemetry helper functions."""
 
-from collections.abc import Awaitable
+from collections.abc import Coroutine
 from typing import Any
 
-from tesla_fleet_api.exceptions import TeslaFleetError
+from tesla_fleet_api.exceptions import InsufficientCredits, TeslaFleetError
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 
 from .const import DOMAIN, LOGGER
+from .governor import TeslemetryCreditGovernor
 
 
 def flatten(
@@ -31,23 +32,84 @@ def flatten(
     return result
 
 
-async def handle_command(command: Awaitable[dict[str, Any]]) -> dict[str, Any]:
+def flatten_changes(
+    target: dict[str, Any],
+    data: dict[str, Any],
+    *,
+    skip_keys: list[str] | None = None,
+) -> set[str]:
+    """Flatten data into target in place and return the keys that changed.
+
+    Keys missing from data are removed from target and reported as changed, so
+    target ends up equal to flatten(data) without being rebuilt.
+    """
+    seen: set[str] = set()
+    changed: set[str] = set()
+    _flatten_changes(target, data, None, skip_keys, seen, changed)
+    for key in target.keys() - seen:
+        del target[key]
+        changed.add(key)
+    return changed
+
+
+def _flatten_changes(
+    target: dict[str, Any],
+    data: dict[str, Any],
+    parent: str | None,
+    skip_keys: list[str] | None,
+    seen: set[str],
+    changed: set[str],
+) -> None:
+    """Recursively merge data into target, recording seen and changed keys."""
+    for key, value in data.items():
+        skip = skip_keys and key in skip_keys
+        if parent:
+            key = f"{parent}_{key}"
+        if isinstance(value, dict) and not skip:
+            _flatten_changes(target, value, key, skip_keys, seen, changed)
+            continue
+        seen.add(key)
+        if key not in target or target[key] != value:
+            target[key] = value
+            changed.add(key)
+
+
+async def handle_command(
+    command: Coroutine[Any, Any, dict[str, Any]],
+    governor: TeslemetryCreditGovernor,
+) -> dict[str, Any]:
     """Handle a command."""
+    if governor.async_refuse_command():
+        command.close()
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="command_insufficient_credits",
+        )
     try:
         result = await command
+    except InsufficientCredits as e:
+        governor.async_set_exhausted()
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="command_insufficient_credits",
+        ) from e
     except TeslaFleetError as e:
         raise HomeAssistantError(
             translation_domain=DOMAIN,
             translation_key="command_exception",
             translation_placeholders={"message": e.message},
         ) from e
+    governor.async_clear_exhausted()
     LOGGER.debug("Command result: %s", result)
     return result
 
 
-async def handle_vehicle_command(command: Awaitable[dict[str, Any]]) -> Any:
+async def handle_vehicle_command(
+    command: Coroutine[Any, Any, dict[str, Any]],
+    governor: TeslemetryCreditGovernor,
+) -> Any:
     """Handle a vehicle command."""
-    result = await handle_command(command)
+    result = await handle_command(command, governor)
     if (response := result.get("response")) is None:
         if error := result.get("error"):
             # No response with error
@@ -1,5 +1,6 @@
 """Lock platform for Teslemetry integration."""
 
+from collections.abc import Iterable
 from itertools import chain
 from typing import Any, override
 
@@ -19,9 +20,9 @@ from .entity import (
     TeslemetryRootEntity,
     TeslemetryVehiclePollingEntity,
     TeslemetryVehicleStreamEntity,
+    async_add_product_entities,
 )
-from .helpers import handle_vehicle_command
-from .models import TeslemetryVehicleData
+from .models import TeslemetryProducts, TeslemetryVehicleData
 
 ENGAGED = "Engaged"
 
@@ -35,43 +36,46 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Teslemetry lock platform from a config entry."""
 
-    async_add_entities(
-        chain(
+    def _product_entities(products: TeslemetryProducts) -> Iterable[LockEntity]:
+        """Return the entities of the products."""
+        return chain(
             (
                 TeslemetryVehiclePollingVehicleLockEntity(
-                    vehicle, Scope.VEHICLE_CMDS in entry.runtime_data.scopes
+                    vehicle, Scope.VEHICLE_CMDS in products.scopes
                 )
                 if vehicle.poll or not firmware_at_least(vehicle.firmware, "2024.26")
                 else TeslemetryStreamingVehicleLockEntity(
-                    vehicle, Scope.VEHICLE_CMDS in entry.runtime_data.scopes
+                    vehicle, Scope.VEHICLE_CMDS in products.scopes
                 )
-                for vehicle in entry.runtime_data.vehicles
+                for vehicle in products.vehicles
             ),
             (
                 TeslemetryVehiclePollingCableLockEntity(
-                    vehicle, Scope.VEHICLE_CMDS in entry.runtime_data.scopes
+                    vehicle, Scope.VEHICLE_CMDS in products.scopes
                 )
                 if vehicle.poll or not firmware_at_least(vehicle.firmware, "2024.26")
                 else TeslemetryStreamingCableLockEntity(
-                    vehicle, Scope.VEHICLE_CMDS in entry.runtime_data.scopes
+                    vehicle, Scope.VEHICLE_CMDS in products.scopes
                 )
-                for vehicle in entry.runtime_data.vehicles
+                for vehicle in products.vehicles
             ),
         )
-    )
+
+    async_add_product_entities(entry, async_add_entities, _product_entities)
 
 
 class TeslemetryVehicleLockEntity(TeslemetryRootEntity, LockEntity):
     """Base vehicle lock entity for Teslemetry."""
 
     api: Vehicle
+    vehicle: TeslemetryVehicleData
 
     @override
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the doors."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-        await handle_vehicle_command(self.api.door_lock())
+        await self.vehicle.executor.async_execute(self.api.door_lock())
         self._attr_is_locked = True
         self.async_write_ha_state()
 
@@ -80,7 +84,7 @@ class TeslemetryVehicleLockEntity(TeslemetryRootEntity, LockEntity):
         """Unlock the doors."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-        await handle_vehicle_command(self.api.door_unlock())
+        await self.vehicle.executor.async_execute(self.api.door_unlock())
         self._attr_is_locked = False
         self.async_write_ha_state()
 
@@ -135,13 +139,14 @@ class TeslemetryStreamingVehicleLockEntity(
     def _callback(self, value: bool | None) -> None:
         """Update entity attributes."""
         self._attr_is_locked = value
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
 
 class TeslemetryCableLockEntity(TeslemetryRootEntity, LockEntity):
     """Base cable Lock entity for Teslemetry."""
 
     api: Vehicle
+    vehicle: TeslemetryVehicleData
 
     @override
     async def async_lock(self, **kwargs: Any) -> None:
@@ -156,7 +161,7 @@ class TeslemetryCableLockEntity(TeslemetryRootEntity, LockEntity):
         """Unlock charge cable lock."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-        await handle_vehicle_command(self.api.charge_port_door_open())
+        await self.vehicle.executor.async_execute(self.api.charge_port_door_open())
         self._attr_is_locked = False
         self.async_write_ha_state()
 
@@ -224,4 +229,4 @@ class TeslemetryStreamingCableLockEntity(
     def _callback(self, value: str | None) -> None:
         """Update entity attributes."""
         self._attr_is_locked = None if value is None else value == ENGAGED
-        self.async_write_ha_state()
+        self.async_write_stream_state()
@@ -8,14 +8,17 @@ without users pasting log files.
 
 import asyncio
 from collections import deque
+from collections.abc import Iterable
+import gzip
 import logging
-from typing import Any, override
+from typing import Any, NamedTuple, override
 from weakref import WeakKeyDictionary
 
 from homeassistant.const import __version__ as HA_VERSION
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import instance_id
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.json import json_bytes
 from homeassistant.loader import async_get_integration
 
 from .const import DOMAIN
@@ -45,7 +48,10 @@ _INTERNAL_LOGGER_NAME = __name__
 _LOGGER = logging.getLogger(_INTERNAL_LOGGER_NAME)
 
 MAX_BUFFER_SIZE = 1000
-BATCH_SIZE = 200
+# Largest estimated size of the records in one export request, before gzip
+MAX_BATCH_BYTES = 256 * 1024
+# Estimated JSON size of a record beyond its body, logger and function names
+RECORD_OVERHEAD = 160
 FLUSH_INTERVAL = 5.0
 HTTP_TIMEOUT = 10.0
 
@@ -67,9 +73,43 @@ def _severity_number(levelno: int) -> int:
     return number
 
 
+# One formatter for every record, rather than one per record
+_FORMATTER = logging.Formatter()
+
+
+class LogEntry(NamedTuple):
+    """A log record reduced to the fields that are shipped."""
+
+    time_unix_nano: int
+    levelno: int
+    levelname: str
+    name: str
+    body: str
+    func: str
+    lineno: int
+
+
 def _format_record(record: logging.LogRecord) -> str:
     """Render a record's message with any exception folded in."""
-    return logging.Formatter().format(record)
+    return _FORMATTER.format(record)
+
+
+def compact_record(record: logging.LogRecord) -> LogEntry:
+    """Reduce a stdlib LogRecord to a log entry when it is emitted."""
+    return LogEntry(
+        int(record.created * 1e9),
+        record.levelno,
+        record.levelname,
+        record.name,
+        _format_record(record),
+        record.funcName,
+        record.lineno,
+    )
+
+
+def _entry_size(entry: LogEntry) -> int:
+    """Estimate the encoded size of a log entry in bytes."""
+    return len(entry.body) + len(entry.name) + len(entry.func) + RECORD_OVERHEAD
 
 
 def _attr(key: str, value: Any) -> dict[str, Any]:
@@ -81,28 +121,28 @@ def _attr(key: str, value: Any) -> dict[str, Any]:
     return {"key": key, "value": {"stringValue": str(value)}}
 
 
-def _record_to_log_record(record: logging.LogRecord) -> dict[str, Any]:
-    """Convert a stdlib LogRecord to an OTLP LogRecord."""
+def _entry_to_log_record(entry: LogEntry) -> dict[str, Any]:
+    """Convert a log entry to an OTLP LogRecord."""
     return {
-        "timeUnixNano": str(int(record.created * 1e9)),
-        "severityNumber": _severity_number(record.levelno),
-        "severityText": record.levelname,
-        "body": {"stringValue": _format_record(record)},
+        "timeUnixNano": str(entry.time_unix_nano),
+        "severityNumber": _severity_number(entry.levelno),
+        "severityText": entry.levelname,
+        "body": {"stringValue": entry.body},
         "attributes": [
-            _attr("logger.name", record.name),
-            _attr("code.function", record.funcName),
-            _attr("code.lineno", record.lineno),
+            _attr("logger.name", entry.name),
+            _attr("code.function", entry.func),
+            _attr("code.lineno", entry.lineno),
         ],
     }
 
 
 def build_payload(
-    records: list[logging.LogRecord], resource_attrs: dict[str, Any]
+    entries: Iterable[LogEntry], resource_attrs: dict[str, Any]
 ) -> dict[str, Any]:
     """Build an OTLP/HTTP JSON ExportLogsServiceRequest for a batch."""
     scopes: dict[str, list[dict[str, Any]]] = {}
-    for record in records:
-        scopes.setdefault(record.name, []).append(_record_to_log_record(record))
+    for entry in entries:
+        scopes.setdefault(entry.name, []).append(_entry_to_log_record(entry))
 
     return {
         "resourceLogs": [
@@ -119,12 +159,18 @@ def build_payload(
     }
 
 
+def encode_payload(entries: list[LogEntry], resource_attrs: dict[str, Any]) -> bytes:
+    """Serialize and gzip the export request for a batch.
+
+    Runs in the executor, so a large batch never blocks the event loop.
+    """
+    return gzip.compress(json_bytes(build_payload(entries, resource_attrs)))
+
+
 class _OTLPLogHandler(logging.Handler):
     """Buffer records from the watched loggers, bounded and gated."""
 
-    def __init__(
-        self, buffer: deque[logging.LogRecord], shipper: TeslemetryLogShipper
-    ) -> None:
+    def __init__(self, buffer: deque[LogEntry], shipper: TeslemetryLogShipper) -> None:
         """Initialize the handler around a shared bounded buffer."""
         super().__init__(level=logging.DEBUG)
         self._buffer = buffer
@@ -138,7 +184,10 @@ class _OTLPLogHandler(logging.Handler):
             return
         if not self._shipper.is_shipping_authorized():
             return
-        self._buffer.append(record)  # bounded deque drops the oldest when full
+        if len(self._buffer) == self._buffer.maxlen:
+            self._shipper.dropped += 1
+        # Bounded deque drops the oldest when full
+        self._buffer.append(compact_record(record))
 
 
 class TeslemetryLogShipper:
@@ -155,8 +204,13 @@ class TeslemetryLogShipper:
         # silently closes the gate for an opted-in user.
         self._force_count = 0
         self._attached = False
-        self._buffer: deque[logging.LogRecord] = deque(maxlen=MAX_BUFFER_SIZE)
+        self._buffer: deque[LogEntry] = deque(maxlen=MAX_BUFFER_SIZE)
         self._handler = _OTLPLogHandler(self._buffer, self)
+        # Records that left the buffer: evicted unsent, shipped, or lost to a
+        # failed export
+        self.dropped = 0
+        self.sent = 0
+        self.failed = 0
         self._resource_attrs: dict[str, Any] = {}
         self._task: asyncio.Task | None = None
 
@@ -236,22 +290,40 @@ class TeslemetryLogShipper:
         """Ship one batch. Never raises: shipping must not break the integration."""
         if not self._buffer:
             return
-        batch = [
-            self._buffer.popleft() for _ in range(min(BATCH_SIZE, len(self._buffer)))
-        ]
+        batch: list[LogEntry] = []
+        size = 0
+        while self._buffer and (
+            not batch or size + _entry_size(self._buffer[0]) <= MAX_BATCH_BYTES
+        ):
+            entry = self._buffer.popleft()
+            size += _entry_size(entry)
+            batch.append(entry)
         try:
-            payload = build_payload(batch, self._resource_attrs)
+            body = await self.hass.async_add_executor_job(
+                encode_payload, batch, self._resource_attrs
+            )
             session = async_get_clientsession(self.hass)
-            async with asyncio.timeout(HTTP_TIMEOUT):
-                await session.post(
+            async with (
+                asyncio.timeout(HTTP_TIMEOUT),
+                session.post(
                     OTLP_ENDPOINT,
-                    json=payload,
-                    headers={"authorization": INGEST_KEY},
-                )
+                    data=body,
+                    headers={
+                        "authorization": INGEST_KEY,
+                        "content-encoding": "gzip",
+                        "content-type": "application/json",
+                    },
+                ) as response,
+            ):
+                shipped = response.status < 400
         except asyncio.CancelledError:
             raise
         except Exception:  # noqa: BLE001  # fail-silent by design
-            return
+            shipped = False
+        if shipped:
+            self.sent += len(batch)
+        else:
+            self.failed += len(batch)
 
 
 # Shared across every config entry of this domain, keyed by hass instance
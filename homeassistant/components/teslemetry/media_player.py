@@ -1,5 +1,7 @@
 """Media player platform for Teslemetry integration."""
 
+from collections.abc import Iterable
+from datetime import datetime
 from typing import override
 
 from tesla_fleet_api import firmware_at_least
@@ -16,15 +18,16 @@ from homeassistant.components.media_player import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
 
 from . import TeslemetryConfigEntry
 from .entity import (
     TeslemetryRootEntity,
     TeslemetryVehiclePollingEntity,
     TeslemetryVehicleStreamEntity,
+    async_add_product_entities,
 )
-from .helpers import handle_vehicle_command
-from .models import TeslemetryVehicleData
+from .models import TeslemetryProducts, TeslemetryVehicleData
 
 STATES = {
     "Playing": MediaPlayerState.PLAYING,
@@ -42,6 +45,9 @@ DISPLAY_STATES = {
 # Tesla uses 31 steps, in 0.333 increments up to 10.333
 VOLUME_STEP = 1 / 31
 VOLUME_FACTOR = 31 / 3  # 10.333
+# Seconds the reported position may drift from the extrapolated position
+# before the state is written again
+MEDIA_POSITION_DRIFT = 2
 
 PARALLEL_UPDATES = 0
 
@@ -53,18 +59,23 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Teslemetry Media platform from a config entry."""
 
-    async_add_entities(
-        TeslemetryVehiclePollingMediaEntity(vehicle, entry.runtime_data.scopes)
-        if vehicle.poll or not firmware_at_least(vehicle.firmware, "2025.2.6")
-        else TeslemetryStreamingMediaEntity(vehicle, entry.runtime_data.scopes)
-        for vehicle in entry.runtime_data.vehicles
-    )
+    def _product_entities(products: TeslemetryProducts) -> Iterable[MediaPlayerEntity]:
+        """Return the entities of the products."""
+        return (
+            TeslemetryVehiclePollingMediaEntity(vehicle, products.scopes)
+            if vehicle.poll or not firmware_at_least(vehicle.firmware, "2025.2.6")
+            else TeslemetryStreamingMediaEntity(vehicle, products.scopes)
+            for vehicle in products.vehicles
+        )
+
+    async_add_product_entities(entry, async_add_entities, _product_entities)
 
 
 class TeslemetryMediaEntity(TeslemetryRootEntity, MediaPlayerEntity):
     """Base vehicle media player class."""
 
     api: Vehicle
+    vehicle: TeslemetryVehicleData
     _attr_device_class = MediaPlayerDeviceClass.SPEAKER
     _attr_volume_step = VOLUME_STEP
 
@@ -73,7 +84,9 @@ class TeslemetryMediaEntity(TeslemetryRootEntity, MediaPlayerEntity):
         """Set volume level, range 0..1."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-        await handle_vehicle_command(self.api.adjust_volume(volume * VOLUME_FACTOR))
+        await self.vehicle.executor.async_execute(
+            self.api.adjust_volume(volume * VOLUME_FACTOR)
+        )
         self._attr_volume_level = volume
         self.async_write_ha_state()
 
@@ -83,7 +96,7 @@ class TeslemetryMediaEntity(TeslemetryRootEntity, MediaPlayerEntity):
         if self.state != MediaPlayerState.PLAYING:
             self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-            await handle_vehicle_command(self.api.media_toggle_playback())
+            await self.vehicle.executor.async_execute(self.api.media_toggle_playback())
             self._attr_state = MediaPlayerState.PLAYING
             self.async_write_ha_state()
 
@@ -94,7 +107,7 @@ class TeslemetryMediaEntity(TeslemetryRootEntity, MediaPlayerEntity):
         if self.state == MediaPlayerState.PLAYING:
             self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-            await handle_vehicle_command(self.api.media_toggle_playback())
+            await self.vehicle.executor.async_execute(self.api.media_toggle_playback())
             self._attr_state = MediaPlayerState.PAUSED
             self.async_write_ha_state()
 
@@ -103,14 +116,14 @@ class TeslemetryMediaEntity(TeslemetryRootEntity, MediaPlayerEntity):
         """Send next track command."""
 
         self.raise_for_scope(Scope.VEHICLE_CMDS)
-        await handle_vehicle_command(self.api.media_next_track())
+        await self.vehicle.executor.async_execute(self.api.media_next_track())
 
     @override
     async def async_media_previous_track(self) -> None:
         """Send previous track command."""
 
         self.raise_for_scope(Scope.VEHICLE_CMDS)
-        await handle_vehicle_command(self.api.media_prev_track())
+        await self.vehicle.executor.async_execute(self.api.media_prev_track())
 
 
 class TeslemetryVehiclePollingMediaEntity(
@@ -223,6 +236,14 @@ class TeslemetryStreamingMediaEntity(
             self._attr_media_position = state.attributes.get(
                 MediaPlayerEntityStateAttribute.MEDIA_POSITION
             )
+            updated_at = state.attributes.get(
+                MediaPlayerEntityStateAttribute.MEDIA_POSITION_UPDATED_AT
+            )
+            self._attr_media_position_updated_at = (
+                dt_util.parse_datetime(updated_at)
+                if isinstance(updated_at, str)
+                else updated_at
+            )
             self._attr_source = state.attributes.get(
                 MediaPlayerEntityStateAttribute.INPUT_SOURCE
             )
@@ -284,51 +305,90 @@ class TeslemetryStreamingMediaEntity(
         """Update entity attributes."""
         if value is not None:
             self._attr_state = DISPLAY_STATES.get(value)
-            self.async_write_ha_state()
+            self.async_write_stream_state()
+
+    def _extrapolated_position(self, now: datetime) -> float | None:
+        """Return the position the frontend shows for the current time."""
+        position = self._attr_media_position
+        updated_at = self._attr_media_position_updated_at
+        if (
+            position is None
+            or updated_at is None
+            or self._attr_state != MediaPlayerState.PLAYING
+        ):
+            return position
+        elapsed = (now - updated_at).total_seconds()
+        if self._attr_media_duration:
+            return min(position + elapsed, self._attr_media_duration)
+        return position + elapsed
 
     def _async_handle_media_playback_status(self, value: str | None) -> None:
         """Update entity attributes."""
-        self._attr_state = MediaPlayerState.OFF if value is None else STATES.get(value)
-        self.async_write_ha_state()
+        state = MediaPlayerState.OFF if value is None else STATES.get(value)
+        if state != self._attr_state:
+            # Anchor the position so it stops or starts moving from here
+            now = dt_util.utcnow()
+            if (position := self._extrapolated_position(now)) is not None:
+                self._attr_media_position = round(position)
+                self._attr_media_position_updated_at = now
+            self._attr_state = state
+        self.async_write_stream_state()
 
     def _async_handle_media_playback_source(self, value: str | None) -> None:
         """Update entity attributes."""
         self._attr_source = value
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_media_audio_volume(self, value: float | None) -> None:
         """Update entity attributes."""
         self._attr_volume_level = None if value is None else value / VOLUME_FACTOR
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_media_now_playing_duration(self, value: int | None) -> None:
         """Update entity attributes."""
         self._attr_media_duration = None if value is None else int(value / 1000)
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_media_now_playing_elapsed(self, value: int | None) -> None:
-        """Update entity attributes."""
-        self._attr_media_position = None if value is None else int(value / 1000)
-        self.async_write_ha_state()
+        """Update the media position when it drifts from the extrapolation.
+
+        The frontend advances the position from media_position_updated_at
+        while playing, so the elapsed time reported every second only needs
+        writing after a seek or when the clocks drift apart.
+        """
+        if value is None:
+            self._attr_media_position = None
+            self._attr_media_position_updated_at = None
+            self.async_write_stream_state()
+            return
+
+        position = int(value / 1000)
+        now = dt_util.utcnow()
+        expected = self._extrapolated_position(now)
+        if expected is not None and abs(position - expected) <= MEDIA_POSITION_DRIFT:
+            return
+        self._attr_media_position = position
+        self._attr_media_position_updated_at = now
+        self.async_write_stream_state()
 
     def _async_handle_media_now_playing_artist(self, value: str | None) -> None:
         """Update entity attributes."""
         self._attr_media_artist = value  # Check if this is album artist or not
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_media_now_playing_album(self, value: str | None) -> None:
         """Update entity attributes."""
         self._attr_media_album_name = value
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_media_now_playing_title(self, value: str | None) -> None:
         """Update entity attributes."""
         self._attr_media_title = value
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_media_now_playing_station(self, value: str | None) -> None:
         """Update entity attributes."""
         self._attr_media_channel = (
             value  # could also be _attr_media_playlist when Spotify
         )
-        self.async_write_ha_state()
+        self.async_write_stream_state()
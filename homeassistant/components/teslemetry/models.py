@@ -1,13 +1,15 @@
 """The Teslemetry integration models."""
 
 import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import partial
 
 from tesla_fleet_api.const import Scope
 from tesla_fleet_api.teslemetry import EnergySite, Vehicle
-from teslemetry_stream import TeslemetryStream, TeslemetryStreamVehicle
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from .coordinator import (
@@ -17,6 +19,24 @@ from .coordinator import (
     TeslemetryMetadataCoordinator,
     TeslemetryVehicleDataCoordinator,
 )
+from .executor import TeslemetryCommandExecutor
+from .failover import TeslemetryStreamFailover
+from .governor import TeslemetryCreditGovernor
+from .oauth import TeslemetryAccessToken
+from .stream import (
+    TeslemetryDispatchStream,
+    TeslemetryDispatchStreamVehicle,
+    TeslemetryStreamWriter,
+)
+
+
+@dataclass
+class TeslemetryProducts:
+    """Vehicles and energy sites whose entities are added together."""
+
+    vehicles: list[TeslemetryVehicleData]
+    energysites: list[TeslemetryEnergyData]
+    scopes: list[Scope]
 
 
 @dataclass
@@ -26,28 +46,84 @@ class TeslemetryData:
     vehicles: list[TeslemetryVehicleData]
     energysites: list[TeslemetryEnergyData]
     scopes: list[Scope]
-    stream: TeslemetryStream | None
+    stream: TeslemetryDispatchStream | None
     metadata_coordinator: TeslemetryMetadataCoordinator
+    governor: TeslemetryCreditGovernor
+    access_token: TeslemetryAccessToken
+    product_listeners: list[Callable[[TeslemetryProducts], None]] = field(
+        default_factory=list
+    )
+
+    @property
+    def products(self) -> TeslemetryProducts:
+        """Return every vehicle and energy site."""
+        return TeslemetryProducts(self.vehicles, self.energysites, self.scopes)
+
+    @callback
+    def async_add_product_listener(
+        self, listener: Callable[[TeslemetryProducts], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for products added after setup."""
+        self.product_listeners.append(listener)
+        return partial(self.product_listeners.remove, listener)
+
+    @callback
+    def async_add_products(self, products: TeslemetryProducts) -> None:
+        """Add products and let the platforms add their entities."""
+        self.vehicles.extend(products.vehicles)
+        self.energysites.extend(products.energysites)
+        for listener in list(self.product_listeners):
+            listener(products)
 
 
 @dataclass
-class TeslemetryVehicleData:
+class TeslemetryProductData:
+    """Callbacks to run when a vehicle or energy site is removed."""
+
+    remove_callbacks: list[CALLBACK_TYPE] = field(
+        default_factory=list, init=False, repr=False
+    )
+
+    @callback
+    def async_on_remove(self, func: CALLBACK_TYPE) -> None:
+        """Add a function to call when the product is removed or unloaded."""
+        self.remove_callbacks.append(func)
+
+    @callback
+    def async_remove(self) -> None:
+        """Stop everything set up for the product."""
+        while self.remove_callbacks:
+            self.remove_callbacks.pop()()
+
+
+@dataclass
+class TeslemetryVehicleData(TeslemetryProductData):
     """Data for a vehicle in the Teslemetry integration."""
 
     api: Vehicle
     config_entry: ConfigEntry
     coordinator: TeslemetryVehicleDataCoordinator
     poll: bool
-    stream: TeslemetryStream
-    stream_vehicle: TeslemetryStreamVehicle
+    stream: TeslemetryDispatchStream
+    stream_vehicle: TeslemetryDispatchStreamVehicle
     vin: str
     firmware: str
     device: DeviceInfo
+    stream_writer: TeslemetryStreamWriter
     wakelock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    executor: TeslemetryCommandExecutor = field(init=False)
+    failover: TeslemetryStreamFailover = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Create the command executor on the wakelock and the stream failover."""
+        self.executor = TeslemetryCommandExecutor(
+            self.api, self.coordinator, self.wakelock
+        )
+        self.failover = TeslemetryStreamFailover(self.stream, self.coordinator)
 
 
 @dataclass
-class TeslemetryEnergyData:
+class TeslemetryEnergyData(TeslemetryProductData):
     """Data for a vehicle in the Teslemetry integration."""
 
     api: EnergySite
@@ -1,6 +1,6 @@
 """Number platform for Teslemetry integration."""
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 from itertools import chain
 from typing import Any, override
@@ -33,9 +33,10 @@ from .entity import (
     TeslemetryRootEntity,
     TeslemetryVehiclePollingEntity,
     TeslemetryVehicleStreamEntity,
+    async_add_product_entities,
 )
-from .helpers import handle_command, handle_vehicle_command
-from .models import TeslemetryEnergyData, TeslemetryVehicleData
+from .helpers import handle_command
+from .models import TeslemetryEnergyData, TeslemetryProducts, TeslemetryVehicleData
 
 PARALLEL_UPDATES = 0
 
@@ -135,42 +136,45 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Teslemetry number platform from a config entry."""
 
-    async_add_entities(
-        chain(
+    def _product_entities(products: TeslemetryProducts) -> Iterable[NumberEntity]:
+        """Return the entities of the products."""
+        return chain(
             (
                 TeslemetryVehiclePollingNumberEntity(
                     vehicle,
                     description,
-                    entry.runtime_data.scopes,
+                    products.scopes,
                 )
                 if vehicle.poll or not firmware_at_least(vehicle.firmware, "2024.26")
                 else TeslemetryStreamingNumberEntity(
                     vehicle,
                     description,
-                    entry.runtime_data.scopes,
+                    products.scopes,
                 )
-                for vehicle in entry.runtime_data.vehicles
+                for vehicle in products.vehicles
                 for description in VEHICLE_DESCRIPTIONS
             ),
             (
                 TeslemetryEnergyInfoNumberSensorEntity(
                     energysite,
                     description,
-                    entry.runtime_data.scopes,
+                    products.scopes,
                 )
-                for energysite in entry.runtime_data.energysites
+                for energysite in products.energysites
                 for description in ENERGY_INFO_DESCRIPTIONS
                 if description.requires is None
                 or energysite.info_coordinator.data.get(description.requires)
             ),
         )
-    )
+
+    async_add_product_entities(entry, async_add_entities, _product_entities)
 
 
 class TeslemetryVehicleNumberEntity(TeslemetryRootEntity, NumberEntity):
     """Vehicle number entity base class."""
 
     api: Vehicle
+    vehicle: TeslemetryVehicleData
     entity_description: TeslemetryNumberVehicleEntityDescription
 
     @override
@@ -178,7 +182,9 @@ class TeslemetryVehicleNumberEntity(TeslemetryRootEntity, NumberEntity):
         """Set new value."""
         value = int(value)
         self.raise_for_scope(self.entity_description.scopes[0])
-        await handle_vehicle_command(self.entity_description.func(self.api, value))
+        await self.vehicle.executor.async_execute(
+            self.entity_description.func(self.api, value)
+        )
         self._attr_native_value = value
         self.async_write_ha_state()
 
@@ -263,14 +269,14 @@ class TeslemetryStreamingNumberEntity(
     def _value_callback(self, value: int | None) -> None:
         """Update the value of the entity."""
         self._attr_native_value = None if value is None else value
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _max_callback(self, value: int | None) -> None:
         """Update the value of the entity."""
         self._attr_native_max_value = (
             self.entity_description.native_max_value if value is None else value
         )
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
 
 class TeslemetryEnergyInfoNumberSensorEntity(TeslemetryEnergyInfoEntity, NumberEntity):
@@ -304,6 +310,8 @@ class TeslemetryEnergyInfoNumberSensorEntity(TeslemetryEnergyInfoEntity, NumberE
         """Set new value."""
         value = int(value)
         self.raise_for_scope(Scope.ENERGY_CMDS)
-        await handle_command(self.entity_description.func(self.api, value))
+        await handle_command(
+            self.entity_description.func(self.api, value), self.coordinator.governor
+        )
         self._attr_native_value = value
         self.async_write_ha_state()
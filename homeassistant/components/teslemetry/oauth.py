@@ -1,11 +1,35 @@
 """Provide oauth implementations for the Teslemetry integration."""
 
-from typing import Any, override
+import asyncio
+from datetime import datetime
+import time
+from typing import Any, cast, override
 
-from homeassistant.core import HomeAssistant
+from aiohttp import ClientError
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_ACCESS_TOKEN
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import (
+    ConfigEntryAuthFailed,
+    ConfigEntryNotReady,
+    HomeAssistantError,
+    OAuth2TokenRequestError,
+    OAuth2TokenRequestReauthError,
+)
 from homeassistant.helpers import config_entry_oauth2_flow
+from homeassistant.helpers.config_entry_oauth2_flow import (
+    CLOCK_OUT_OF_SYNC_MAX_SEC,
+    OAuth2Session,
+)
+from homeassistant.helpers.event import async_call_later
+
+from .const import AUTHORIZE_URL, DOMAIN, LOGGER, TOKEN_URL
 
-from .const import AUTHORIZE_URL, TOKEN_URL
+# Seconds before the access token expires that it is refreshed in the background
+TOKEN_REFRESH_BEFORE = 300
+# Shortest delay before a background refresh, and between failed ones, in seconds
+TOKEN_REFRESH_RETRY = 60
 
 
 class TeslemetryImplementation(
@@ -49,3 +73,167 @@ class TeslemetryImplementation(
         }
         data.update(super().extra_token_resolve_data)
         return data
+
+
+class TeslemetryAccessToken:
+    """Provide the access token for the API and stream.
+
+    This is the one place that decides when the token is refreshed. While it
+    is valid it is returned straight from the config entry, without awaiting
+    anything. It is refreshed in the background shortly before it expires,
+    and callers that find it expired or invalidated wait on that one refresh
+    instead of each starting their own.
+    """
+
+    def __init__(self, hass: HomeAssistant, session: OAuth2Session) -> None:
+        """Initialize the token provider."""
+        self.hass = hass
+        self.session = session
+        self.entry = session.config_entry
+        self._refresh_task: asyncio.Task[str] | None = None
+        self._invalid_token: str | None = None
+        self._unsub_refresh: CALLBACK_TYPE | None = None
+        self._running = False
+
+    async def __call__(self) -> str:
+        """Return a valid access token."""
+        access_token = self.session.token.get(CONF_ACCESS_TOKEN)
+        if isinstance(access_token, str) and self.valid:
+            return access_token
+        return await self.async_refresh()
+
+    @property
+    def valid(self) -> bool:
+        """Return if the token is neither expiring nor rejected by the API."""
+        token = self.session.token
+        expires_at = token.get("expires_at")
+        return (
+            token.get(CONF_ACCESS_TOKEN) != self._invalid_token
+            and isinstance(expires_at, (int, float))
+            and expires_at > time.time() + CLOCK_OUT_OF_SYNC_MAX_SEC
+        )
+
+    async def async_refresh(self) -> str:
+        """Refresh the token, sharing a refresh that is already in flight."""
+        if self._refresh_task is None:
+            self._refresh_task = self.entry.async_create_background_task(
+                self.hass,
+                self._async_refresh(),
+                "teslemetry token refresh",
+                eager_start=False,
+            )
+        return await asyncio.shield(self._refresh_task)
+
+    async def _async_refresh(self) -> str:
+        """Refresh the token and schedule the next refresh."""
+        LOGGER.debug(
+            "Refreshing token, valid: %s, expires_at: %s",
+            self.valid,
+            self.session.token.get("expires_at"),
+        )
+        try:
+            token = await self._async_request_token()
+        finally:
+            self._refresh_task = None
+        self.hass.config_entries.async_update_entry(
+            self.entry, data={**self.entry.data, "token": token}
+        )
+        self._invalid_token = None
+        self._async_schedule_refresh()
+        return cast(str, token[CONF_ACCESS_TOKEN])
+
+    async def _async_request_token(self) -> dict:
+        """Request a new token, raising errors that fit the entry state."""
+        setup_in_progress = self.entry.state is ConfigEntryState.SETUP_IN_PROGRESS
+        try:
+            return await self.session.implementation.async_refresh_token(
+                self.session.token
+            )
+        except OAuth2TokenRequestReauthError as err:
+            if setup_in_progress:
+                raise ConfigEntryAuthFailed(
+                    translation_domain=DOMAIN,
+                    translation_key="auth_failed",
+                ) from err
+            # Not in setup: let the coordinator's own OAuth2TokenRequestError
+            # handling stop polling and (re)start reauth without tearing
+            # down the already-loaded entry.
+            self.entry.async_start_reauth(self.hass)
+            raise
+        except OAuth2TokenRequestError as err:
+            # Recoverable (e.g. 429/5xx). During setup this backs off via the
+            # normal ConfigEntryNotReady retry; once loaded, let it propagate so
+            # the coordinator treats it as a transient failed update instead.
+            if setup_in_progress:
+                raise ConfigEntryNotReady(
+                    translation_domain=DOMAIN,
+                    translation_key="not_ready_connection_error",
+                ) from err
+            raise
+        except (KeyError, TypeError) as err:
+            raise ConfigEntryAuthFailed(
+                translation_domain=DOMAIN,
+                translation_key="token_data_malformed",
+            ) from err
+        except ClientError as err:
+            raise ConfigEntryNotReady(
+                translation_domain=DOMAIN,
+                translation_key="not_ready_connection_error",
+            ) from err
+
+    @callback
+    def async_invalidate(self) -> None:
+        """Stop handing out a token the API rejected, so the next call refreshes."""
+        self._invalid_token = self.session.token.get(CONF_ACCESS_TOKEN)
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start refreshing the token ahead of expiry and return a callback to stop."""
+        self._running = True
+        self._async_schedule_refresh()
+
+        @callback
+        def _async_stop() -> None:
+            self._running = False
+            if self._unsub_refresh is not None:
+                self._unsub_refresh()
+                self._unsub_refresh = None
+
+        return _async_stop
+
+    @callback
+    def _async_schedule_refresh(self, retry: bool = False) -> None:
+        """Schedule a background refresh shortly before the token expires."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+        self._unsub_refresh = None
+        expires_at = self.session.token.get("expires_at")
+        if not self._running or not isinstance(expires_at, (int, float)):
+            return
+        delay = float(TOKEN_REFRESH_RETRY)
+        if not retry:
+            delay = max(delay, expires_at - TOKEN_REFRESH_BEFORE - time.time())
+        self._unsub_refresh = async_call_later(
+            self.hass, delay, self._async_scheduled_refresh
+        )
+
+    @callback
+    def _async_scheduled_refresh(self, _: datetime) -> None:
+        """Refresh the token in the background."""
+        self._unsub_refresh = None
+        self.entry.async_create_background_task(
+            self.hass,
+            self._async_background_refresh(),
+            "teslemetry token background refresh",
+        )
+
+    async def _async_background_refresh(self) -> None:
+        """Refresh the still valid token, retrying later if that fails."""
+        try:
+            await self.async_refresh()
+        except ConfigEntryAuthFailed, OAuth2TokenRequestReauthError:
+            # Reauthentication has started and replaces the token
+            return
+        except HomeAssistantError, ClientError, TimeoutError:
+            LOGGER.debug("Background token refresh failed, retrying later")
+            self._async_schedule_refresh(retry=True)
@@ -1,6 +1,6 @@
 """Select platform for Teslemetry integration."""
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 from itertools import chain
 from typing import Any, override
@@ -21,9 +21,10 @@ from .entity import (
     TeslemetryRootEntity,
     TeslemetryVehiclePollingEntity,
     TeslemetryVehicleStreamEntity,
+    async_add_product_entities,
 )
-from .helpers import handle_command, handle_vehicle_command
-from .models import TeslemetryEnergyData, TeslemetryVehicleData
+from .helpers import handle_command
+from .models import TeslemetryEnergyData, TeslemetryProducts, TeslemetryVehicleData
 
 OFF = "off"
 LOW = "low"
@@ -214,20 +215,21 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Teslemetry select platform from a config entry."""
 
-    async_add_entities(
-        chain(
+    def _product_entities(products: TeslemetryProducts) -> Iterable[SelectEntity]:
+        """Return the entities of the products."""
+        return chain(
             (
                 TeslemetryVehiclePollingSelectEntity(
-                    vehicle, description, entry.runtime_data.scopes
+                    vehicle, description, products.scopes
                 )
                 if vehicle.poll
                 or not firmware_at_least(vehicle.firmware, "2024.26")
                 or description.streaming_listener is None
                 else TeslemetryStreamingSelectEntity(
-                    vehicle, description, entry.runtime_data.scopes
+                    vehicle, description, products.scopes
                 )
                 for description in VEHICLE_DESCRIPTIONS
-                for vehicle in entry.runtime_data.vehicles
+                for vehicle in products.vehicles
                 if description.supported_fn(
                     entry.runtime_data.metadata_coordinator.data.get("vehicles", {})
                     .get(vehicle.vin, {})
@@ -235,24 +237,26 @@ async def async_setup_entry(
                 )
             ),
             (
-                TeslemetryOperationSelectEntity(energysite, entry.runtime_data.scopes)
-                for energysite in entry.runtime_data.energysites
+                TeslemetryOperationSelectEntity(energysite, products.scopes)
+                for energysite in products.energysites
                 if energysite.info_coordinator.data.get("components_battery")
             ),
             (
-                TeslemetryExportRuleSelectEntity(energysite, entry.runtime_data.scopes)
-                for energysite in entry.runtime_data.energysites
+                TeslemetryExportRuleSelectEntity(energysite, products.scopes)
+                for energysite in products.energysites
                 if energysite.info_coordinator.data.get("components_battery")
                 and energysite.info_coordinator.data.get("components_solar")
             ),
         )
-    )
+
+    async_add_product_entities(entry, async_add_entities, _product_entities)
 
 
 class TeslemetrySelectEntity(TeslemetryRootEntity, SelectEntity):
     """Parent vehicle select entity class."""
 
     api: Vehicle
+    vehicle: TeslemetryVehicleData
     entity_description: TeslemetrySelectEntityDescription
     _climate: bool = False
 
@@ -263,8 +267,12 @@ class TeslemetrySelectEntity(TeslemetryRootEntity, SelectEntity):
         level = LEVEL[option]
         # AC must be on to turn on heaters
         if level and not self._climate:
-            await handle_vehicle_command(self.api.auto_conditioning_start())
-        await handle_vehicle_command(self.entity_description.select_fn(self.api, level))
+            await self.vehicle.executor.async_execute(
+                self.api.auto_conditioning_start()
+            )
+        await self.vehicle.executor.async_execute(
+            self.entity_description.select_fn(self.api, level)
+        )
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -347,7 +355,7 @@ class TeslemetryStreamingSelectEntity(
             self._attr_current_option = options[max(0, min(value, len(options) - 1))]
         else:
             self._attr_current_option = None
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _climate_callback(self, value: bool | None) -> None:
         """Update the value of the entity."""
@@ -381,7 +389,7 @@ class TeslemetryOperationSelectEntity(TeslemetryEnergyInfoEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         self.raise_for_scope(Scope.ENERGY_CMDS)
-        await handle_command(self.api.operation(option))
+        await handle_command(self.api.operation(option), self.coordinator.governor)
         self._attr_current_option = option
         self.async_write_ha_state()
 
@@ -436,7 +444,8 @@ class TeslemetryExportRuleSelectEntity(
         """Change the selected option."""
         self.raise_for_scope(Scope.ENERGY_CMDS)
         await handle_command(
-            self.api.grid_import_export(customer_preferred_export_rule=option)
+            self.api.grid_import_export(customer_preferred_export_rule=option),
+            self.coordinator.governor,
         )
         self._attr_current_option = option
         self.async_write_ha_state()
@@ -1,6 +1,6 @@
 """Sensor platform for Teslemetry integration."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, override
@@ -29,8 +29,9 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import StateType
 from homeassistant.util import dt as dt_util
 from homeassistant.util.variance import ignore_variance
@@ -44,14 +45,23 @@ from .entity import (
     TeslemetryVehiclePollingEntity,
     TeslemetryVehicleStreamEntity,
     TeslemetryWallConnectorEntity,
+    async_add_product_entities,
 )
-from .models import TeslemetryEnergyData, TeslemetryVehicleData
+from .health import TeslemetryStreamHealth, TeslemetryVehicleStreamHealth
+from .models import TeslemetryEnergyData, TeslemetryProducts, TeslemetryVehicleData
+from .stream import STREAMING_ODOMETER_INTERVAL, STREAMING_SLOW_INTERVAL
+from .tariff import TARIFF_BUY, TARIFF_SELL, TariffPrices, TeslemetryTariffTracker
 
 PARALLEL_UPDATES = 0
 
 # Teslemetry streams TPMS pressure in atmospheres; entities are declared in bar.
 ATM_TO_BAR = 1.01325
 
+# High rate streaming fields are written at most this often while driving
+STREAMING_MIN_INTERVAL = timedelta(seconds=5)
+# Values filtered by a deadband are written at least this often
+STREAMING_MAX_AGE = timedelta(minutes=5)
+
 BMS_STATES = {
     "Standby": "standby",
     "Drive": "drive",
@@ -208,6 +218,14 @@ class TeslemetryVehicleSensorEntityDescription(SensorEntityDescription):
         | None
     ) = None
     streaming_firmware: str = "2024.26"
+    # Stream config of the field, None leaves the Teslemetry default
+    streaming_config_interval: int | None = None
+    streaming_config_minimum_delta: float | None = None
+    # Minimum time between state writes of stream values
+    streaming_min_interval: timedelta | None = None
+    streaming_deadband: float = 0
+    streaming_deadband_relative: float = 0
+    streaming_max_age: timedelta = STREAMING_MAX_AGE
 
 
 VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
@@ -355,6 +373,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_VehicleSpeed(
             callback
         ),
+        streaming_min_interval=STREAMING_MIN_INTERVAL,
+        streaming_deadband=1,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfSpeed.MILES_PER_HOUR,
         device_class=SensorDeviceClass.SPEED,
@@ -386,6 +406,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         key="vehicle_state_odometer",
         polling=True,
         streaming_listener=lambda vehicle, callback: vehicle.listen_Odometer(callback),
+        streaming_config_interval=STREAMING_ODOMETER_INTERVAL,
+        streaming_config_minimum_delta=0.1,
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfLength.MILES,
         device_class=SensorDeviceClass.DISTANCE,
@@ -399,6 +421,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_TpmsPressureFl(
             lambda x: callback(None) if x is None else callback(x * ATM_TO_BAR)
         ),
+        streaming_config_interval=STREAMING_SLOW_INTERVAL,
+        streaming_config_minimum_delta=0.01,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPressure.BAR,
         suggested_unit_of_measurement=UnitOfPressure.PSI,
@@ -413,6 +437,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_TpmsPressureFr(
             lambda x: callback(None) if x is None else callback(x * ATM_TO_BAR)
         ),
+        streaming_config_interval=STREAMING_SLOW_INTERVAL,
+        streaming_config_minimum_delta=0.01,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPressure.BAR,
         suggested_unit_of_measurement=UnitOfPressure.PSI,
@@ -427,6 +453,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_TpmsPressureRl(
             lambda x: callback(None) if x is None else callback(x * ATM_TO_BAR)
         ),
+        streaming_config_interval=STREAMING_SLOW_INTERVAL,
+        streaming_config_minimum_delta=0.01,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPressure.BAR,
         suggested_unit_of_measurement=UnitOfPressure.PSI,
@@ -441,6 +469,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_TpmsPressureRr(
             lambda x: callback(None) if x is None else callback(x * ATM_TO_BAR)
         ),
+        streaming_config_interval=STREAMING_SLOW_INTERVAL,
+        streaming_config_minimum_delta=0.01,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPressure.BAR,
         suggested_unit_of_measurement=UnitOfPressure.PSI,
@@ -785,6 +815,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_DiMotorCurrentF(
             callback
         ),
+        streaming_min_interval=STREAMING_MIN_INTERVAL,
+        streaming_deadband=5,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         device_class=SensorDeviceClass.CURRENT,
@@ -796,6 +828,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_DiMotorCurrentR(
             callback
         ),
+        streaming_min_interval=STREAMING_MIN_INTERVAL,
+        streaming_deadband=5,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         device_class=SensorDeviceClass.CURRENT,
@@ -807,6 +841,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_DiMotorCurrentREL(
             callback
         ),
+        streaming_min_interval=STREAMING_MIN_INTERVAL,
+        streaming_deadband=5,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         device_class=SensorDeviceClass.CURRENT,
@@ -818,6 +854,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_DiMotorCurrentRER(
             callback
         ),
+        streaming_min_interval=STREAMING_MIN_INTERVAL,
+        streaming_deadband=5,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         device_class=SensorDeviceClass.CURRENT,
@@ -931,6 +969,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_DiTorqueActualF(
             callback
         ),
+        streaming_min_interval=STREAMING_MIN_INTERVAL,
+        streaming_deadband=10,
         native_unit_of_measurement="Nm",  # Newton-meters
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -941,6 +981,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_DiTorqueActualR(
             callback
         ),
+        streaming_min_interval=STREAMING_MIN_INTERVAL,
+        streaming_deadband=10,
         native_unit_of_measurement="Nm",  # Newton-meters
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -951,6 +993,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_DiTorqueActualREL(
             callback
         ),
+        streaming_min_interval=STREAMING_MIN_INTERVAL,
+        streaming_deadband=10,
         native_unit_of_measurement="Nm",  # Newton-meters
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -961,6 +1005,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_DiTorqueActualRER(
             callback
         ),
+        streaming_min_interval=STREAMING_MIN_INTERVAL,
+        streaming_deadband=10,
         native_unit_of_measurement="Nm",  # Newton-meters
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -1090,6 +1136,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_HomelinkDeviceCount(
             callback
         ),
+        streaming_config_interval=STREAMING_SLOW_INTERVAL,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
@@ -1118,6 +1165,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_IsolationResistance(
             callback
         ),
+        streaming_config_interval=STREAMING_SLOW_INTERVAL,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
         native_unit_of_measurement="kΩ",
@@ -1142,6 +1190,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_LateralAcceleration(
             callback
         ),
+        streaming_min_interval=STREAMING_MIN_INTERVAL,
+        streaming_deadband=0.05,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement="g",
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -1152,6 +1202,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_LifetimeEnergyUsed(
             callback
         ),
+        streaming_config_interval=STREAMING_SLOW_INTERVAL,
+        streaming_config_minimum_delta=0.1,
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
@@ -1163,6 +1215,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: (
             vehicle.listen_LongitudinalAcceleration(callback)
         ),
+        streaming_min_interval=STREAMING_MIN_INTERVAL,
+        streaming_deadband=0.05,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement="g",
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -1193,6 +1247,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_PackCurrent(
             callback
         ),
+        streaming_min_interval=STREAMING_MIN_INTERVAL,
+        streaming_deadband=5,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         device_class=SensorDeviceClass.CURRENT,
@@ -1204,6 +1260,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryVehicleSensorEntityDescription, ...] = (
         streaming_listener=lambda vehicle, callback: vehicle.listen_PackVoltage(
             callback
         ),
+        streaming_min_interval=STREAMING_MIN_INTERVAL,
+        streaming_deadband_relative=0.005,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
@@ -1577,6 +1635,127 @@ ENERGY_INFO_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
     ),
 )
 
+
+@dataclass(frozen=True, kw_only=True)
+class TeslemetryTariffSensorEntityDescription(SensorEntityDescription):
+    """Describes Teslemetry Tariff Sensor entity."""
+
+    value_fn: Callable[[TariffPrices], StateType | datetime]
+    price: bool = True
+
+
+TARIFF_DESCRIPTIONS: tuple[TeslemetryTariffSensorEntityDescription, ...] = (
+    TeslemetryTariffSensorEntityDescription(
+        key="tariff_buy_price",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda prices: prices.buy.price if prices.buy else None,
+    ),
+    TeslemetryTariffSensorEntityDescription(
+        key="tariff_sell_price",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda prices: prices.sell.price if prices.sell else None,
+    ),
+    TeslemetryTariffSensorEntityDescription(
+        key="tariff_next_change",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        price=False,
+        value_fn=lambda prices: prices.next_change,
+    ),
+    TeslemetryTariffSensorEntityDescription(
+        key="tariff_next_price",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda prices: prices.next_buy.price if prices.next_buy else None,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class TeslemetryVehicleStreamHealthSensorEntityDescription(SensorEntityDescription):
+    """Describes Teslemetry vehicle stream health Sensor entity."""
+
+    value_fn: Callable[[TeslemetryVehicleStreamHealth], StateType]
+
+
+VEHICLE_STREAM_HEALTH_DESCRIPTIONS: tuple[
+    TeslemetryVehicleStreamHealthSensorEntityDescription, ...
+] = (
+    TeslemetryVehicleStreamHealthSensorEntityDescription(
+        key="stream_frame_rate",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda health: health.frame_rate,
+    ),
+    TeslemetryVehicleStreamHealthSensorEntityDescription(
+        key="stream_field_rate",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda health: health.field_rate,
+    ),
+    TeslemetryVehicleStreamHealthSensorEntityDescription(
+        key="stream_lag",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda health: health.lag(0.5),
+    ),
+    TeslemetryVehicleStreamHealthSensorEntityDescription(
+        key="stream_lag_p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda health: health.lag(0.95),
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class TeslemetryStreamHealthSensorEntityDescription(SensorEntityDescription):
+    """Describes Teslemetry stream health Sensor entity."""
+
+    value_fn: Callable[[TeslemetryStreamHealth], StateType]
+
+
+STREAM_HEALTH_DESCRIPTIONS: tuple[
+    TeslemetryStreamHealthSensorEntityDescription, ...
+] = (
+    TeslemetryStreamHealthSensorEntityDescription(
+        key="stream_reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda health: health.reconnects,
+    ),
+    TeslemetryStreamHealthSensorEntityDescription(
+        key="stream_backoff",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda health: health.backoff,
+    ),
+    TeslemetryStreamHealthSensorEntityDescription(
+        key="stream_last_error",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda health: (
+            health.last_error[:255] if health.last_error is not None else None
+        ),
+    ),
+)
+
 ENERGY_HISTORY_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = tuple(
     SensorEntityDescription(
         key=key,
@@ -1600,61 +1779,91 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Teslemetry sensor platform from a config entry."""
 
-    entities: list[SensorEntity] = []
-    for vehicle in entry.runtime_data.vehicles:
-        for description in VEHICLE_DESCRIPTIONS:
-            if (
-                not vehicle.poll
-                and description.streaming_listener
-                and firmware_at_least(vehicle.firmware, description.streaming_firmware)
-            ):
-                entities.append(TeslemetryStreamSensorEntity(vehicle, description))
-            elif description.polling:
-                entities.append(TeslemetryVehicleSensorEntity(vehicle, description))
+    def _product_entities(products: TeslemetryProducts) -> Iterable[SensorEntity]:
+        """Return the entities of the products."""
+        entities: list[SensorEntity] = []
+        for vehicle in products.vehicles:
+            for description in VEHICLE_DESCRIPTIONS:
+                if (
+                    not vehicle.poll
+                    and description.streaming_listener
+                    and firmware_at_least(
+                        vehicle.firmware, description.streaming_firmware
+                    )
+                ):
+                    entities.append(TeslemetryStreamSensorEntity(vehicle, description))
+                elif description.polling:
+                    entities.append(TeslemetryVehicleSensorEntity(vehicle, description))
+
+            for time_description in VEHICLE_TIME_DESCRIPTIONS:
+                if not vehicle.poll and firmware_at_least(
+                    vehicle.firmware, time_description.streaming_firmware
+                ):
+                    entities.append(
+                        TeslemetryStreamTimeSensorEntity(vehicle, time_description)
+                    )
+                else:
+                    entities.append(
+                        TeslemetryVehicleTimeSensorEntity(vehicle, time_description)
+                    )
+
+            entities.extend(
+                TeslemetryVehicleStreamHealthSensorEntity(vehicle, description)
+                for description in VEHICLE_STREAM_HEALTH_DESCRIPTIONS
+            )
 
-        for time_description in VEHICLE_TIME_DESCRIPTIONS:
-            if not vehicle.poll and firmware_at_least(
-                vehicle.firmware, time_description.streaming_firmware
-            ):
-                entities.append(
-                    TeslemetryStreamTimeSensorEntity(vehicle, time_description)
-                )
-            else:
-                entities.append(
-                    TeslemetryVehicleTimeSensorEntity(vehicle, time_description)
-                )
+        entities.extend(
+            TeslemetryEnergyLiveSensorEntity(energysite, description)
+            for energysite in products.energysites
+            if energysite.live_coordinator
+            for description in ENERGY_LIVE_DESCRIPTIONS
+            if description.key in energysite.live_coordinator.data
+            or description.key == "percentage_charged"
+        )
 
-    entities.extend(
-        TeslemetryEnergyLiveSensorEntity(energysite, description)
-        for energysite in entry.runtime_data.energysites
-        if energysite.live_coordinator
-        for description in ENERGY_LIVE_DESCRIPTIONS
-        if description.key in energysite.live_coordinator.data
-        or description.key == "percentage_charged"
-    )
+        entities.extend(
+            TeslemetryWallConnectorSensorEntity(energysite, din, description)
+            for energysite in products.energysites
+            if energysite.live_coordinator
+            for din in energysite.live_coordinator.data.get("wall_connectors", {})
+            for description in WALL_CONNECTOR_DESCRIPTIONS
+        )
 
-    entities.extend(
-        TeslemetryWallConnectorSensorEntity(energysite, din, description)
-        for energysite in entry.runtime_data.energysites
-        if energysite.live_coordinator
-        for din in energysite.live_coordinator.data.get("wall_connectors", {})
-        for description in WALL_CONNECTOR_DESCRIPTIONS
-    )
+        entities.extend(
+            TeslemetryEnergyInfoSensorEntity(energysite, description)
+            for energysite in products.energysites
+            for description in ENERGY_INFO_DESCRIPTIONS
+            if description.key in energysite.info_coordinator.data
+        )
 
-    entities.extend(
-        TeslemetryEnergyInfoSensorEntity(energysite, description)
-        for energysite in entry.runtime_data.energysites
-        for description in ENERGY_INFO_DESCRIPTIONS
-        if description.key in energysite.info_coordinator.data
-    )
+        for energysite in products.energysites:
+            if not energysite.info_coordinator.data.get(f"{TARIFF_BUY}_seasons"):
+                continue
+            # One tracker per site so the price sensors share a boundary timer
+            tracker = TeslemetryTariffTracker(hass, energysite.info_coordinator)
+            # Prices are in the tariff's own currency, not the instance's
+            currency = (
+                energysite.info_coordinator.data.get(f"{TARIFF_BUY}_currency")
+                or hass.config.currency
+            )
+            entities.extend(
+                TeslemetryTariffSensorEntity(energysite, tracker, description, currency)
+                for description in TARIFF_DESCRIPTIONS
+                if description.key != "tariff_sell_price"
+                or energysite.info_coordinator.data.get(f"{TARIFF_SELL}_seasons")
+            )
 
-    entities.extend(
-        TeslemetryEnergyHistorySensorEntity(energysite, description)
-        for energysite in entry.runtime_data.energysites
-        for description in ENERGY_HISTORY_DESCRIPTIONS
-        if energysite.history_coordinator is not None
-    )
+        entities.extend(
+            TeslemetryEnergyHistorySensorEntity(energysite, description)
+            for energysite in products.energysites
+            for description in ENERGY_HISTORY_DESCRIPTIONS
+            if energysite.history_coordinator is not None
+        )
+        return entities
 
+    async_add_product_entities(entry, async_add_entities, _product_entities)
+
+    entities: list[SensorEntity] = []
     if entry.runtime_data.stream is not None:
         entities.extend(
             (
@@ -1666,6 +1875,14 @@ async def async_setup_entry(
                 ),
             )
         )
+        entities.extend(
+            TeslemetryStreamHealthSensorEntity(
+                entry.unique_id or entry.entry_id,
+                entry.runtime_data.stream.health,
+                description,
+            )
+            for description in STREAM_HEALTH_DESCRIPTIONS
+        )
 
     async_add_entities(entities)
 
@@ -1674,6 +1891,11 @@ class TeslemetryStreamSensorEntity(TeslemetryVehicleStreamEntity, RestoreSensor)
     """Base class for Teslemetry vehicle streaming sensors."""
 
     entity_description: TeslemetryVehicleSensorEntityDescription
+    _latest_value: StateType = None
+    _written_value: StateType = None
+    _written_at: datetime | None = None
+    _pending_write: CALLBACK_TYPE | None = None
+    _max_age_write: CALLBACK_TYPE | None = None
 
     def __init__(
         self,
@@ -1682,6 +1904,8 @@ class TeslemetryStreamSensorEntity(TeslemetryVehicleStreamEntity, RestoreSensor)
     ) -> None:
         """Initialize the sensor."""
         self.entity_description = description
+        self._attr_stream_interval = description.streaming_config_interval
+        self._attr_stream_minimum_delta = description.streaming_config_minimum_delta
         super().__init__(data, description.key)
 
     @override
@@ -1691,18 +1915,89 @@ class TeslemetryStreamSensorEntity(TeslemetryVehicleStreamEntity, RestoreSensor)
 
         if (sensor_data := await self.async_get_last_sensor_data()) is not None:
             self._attr_native_value = sensor_data.native_value
+            self._latest_value = sensor_data.native_value
 
         if self.entity_description.streaming_listener is not None:
-            self.async_on_remove(
-                self.entity_description.streaming_listener(
-                    self.vehicle.stream_vehicle, self._async_value_from_stream
+            with self.stream_fields_configured():
+                self.async_on_remove(
+                    self.entity_description.streaming_listener(
+                        self.vehicle.stream_vehicle, self._async_value_from_stream
+                    )
                 )
-            )
+        self.async_on_remove(self._async_cancel_pending_write)
+        self.async_on_remove(self._async_cancel_max_age_write)
 
     def _async_value_from_stream(self, value: StateType) -> None:
         """Update the value of the entity."""
-        self._attr_native_value = value
-        self.async_write_ha_state()
+        self._latest_value = value
+        description = self.entity_description
+        now = dt_util.utcnow()
+
+        if self._written_at is not None and value is not None:
+            age = now - self._written_at
+            if age < description.streaming_max_age and self._within_deadband(value):
+                # Close enough to what was last written, drop any trailing write
+                # but still write the value once the last one gets too old
+                self._async_cancel_pending_write()
+                if value != self._written_value and self._max_age_write is None:
+                    self._max_age_write = async_call_later(
+                        self.hass,
+                        description.streaming_max_age - age,
+                        self._async_write_pending,
+                    )
+                return
+            if description.streaming_min_interval is not None and (
+                age < description.streaming_min_interval
+            ):
+                # Written too recently, write the latest value once allowed
+                if self._pending_write is None:
+                    self._pending_write = async_call_later(
+                        self.hass,
+                        description.streaming_min_interval - age,
+                        self._async_write_pending,
+                    )
+                return
+
+        self._async_write_value(now)
+
+    def _within_deadband(self, value: StateType) -> bool:
+        """Return if a value is within the deadband of the last written value."""
+        last = self._written_value
+        if not isinstance(value, int | float) or not isinstance(last, int | float):
+            return False
+        deadband = max(
+            self.entity_description.streaming_deadband,
+            self.entity_description.streaming_deadband_relative * abs(last),
+        )
+        return abs(value - last) < deadband
+
+    @callback
+    def _async_write_pending(self, now: datetime) -> None:
+        """Write the latest value held back by the minimum interval or deadband."""
+        self._async_write_value(now)
+
+    @callback
+    def _async_cancel_pending_write(self) -> None:
+        """Cancel a pending write."""
+        if self._pending_write is not None:
+            self._pending_write()
+            self._pending_write = None
+
+    @callback
+    def _async_cancel_max_age_write(self) -> None:
+        """Cancel a write scheduled for when the written value gets too old."""
+        if self._max_age_write is not None:
+            self._max_age_write()
+            self._max_age_write = None
+
+    def _async_write_value(self, now: datetime) -> None:
+        """Write the latest value of the entity."""
+        self._async_cancel_pending_write()
+        self._async_cancel_max_age_write()
+        self._attr_native_value = self._latest_value
+        self._written_value = self._latest_value
+        self._written_at = now
+        self.async_write_stream_state()
 
 
 class TeslemetryVehicleSensorEntity(TeslemetryVehiclePollingEntity, SensorEntity):
@@ -1769,7 +2064,7 @@ class TeslemetryStreamTimeSensorEntity(TeslemetryVehicleStreamEntity, SensorEnti
             self._attr_native_value = None
         else:
             self._attr_native_value = self._get_timestamp(value)
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
 
 class TeslemetryVehicleTimeSensorEntity(TeslemetryVehiclePollingEntity, SensorEntity):
@@ -1866,6 +2161,46 @@ class TeslemetryEnergyInfoSensorEntity(TeslemetryEnergyInfoEntity, SensorEntity)
         self._attr_native_value = self._value
 
 
+class TeslemetryTariffSensorEntity(TeslemetryEnergyInfoEntity, SensorEntity):
+    """Base class for Teslemetry energy site tariff sensors."""
+
+    entity_description: TeslemetryTariffSensorEntityDescription
+
+    def __init__(
+        self,
+        data: TeslemetryEnergyData,
+        tracker: TeslemetryTariffTracker,
+        description: TeslemetryTariffSensorEntityDescription,
+        currency: str,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self.tracker = tracker
+        if description.price:
+            self._attr_native_unit_of_measurement = (
+                f"{currency}/{UnitOfEnergy.KILO_WATT_HOUR}"
+            )
+        super().__init__(data, description.key)
+
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Handle entity which will be added."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.tracker.async_add_listener(self._handle_coordinator_update)
+        )
+
+    @override
+    def _async_update_attrs(self) -> None:
+        """Update the attributes of the sensor."""
+        for key_base in (TARIFF_BUY, TARIFF_SELL):
+            self._track_key(f"{key_base}_seasons")
+            self._track_key(f"{key_base}_energy_charges")
+        self._attr_native_value = self.entity_description.value_fn(
+            self.tracker.async_prices()
+        )
+
+
 class TeslemetryEnergyHistorySensorEntity(TeslemetryEnergyHistoryEntity, SensorEntity):
     """Base class for Tesla Fleet energy site metric sensors."""
 
@@ -1955,3 +2290,66 @@ class TeslemetryCreditQuotaSensor(RestoreSensor):
 
         self._attr_native_value = fraction * 100
         self.async_write_ha_state()
+
+
+class TeslemetryVehicleStreamHealthSensorEntity(
+    TeslemetryVehicleStreamEntity, SensorEntity
+):
+    """Entity for the stream health of a Teslemetry vehicle."""
+
+    entity_description: TeslemetryVehicleStreamHealthSensorEntityDescription
+
+    def __init__(
+        self,
+        data: TeslemetryVehicleData,
+        description: TeslemetryVehicleStreamHealthSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self.health = data.stream_vehicle.health
+        super().__init__(data, description.key)
+        self._attr_native_value = description.value_fn(self.health)
+
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Handle entity which will be added."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.stream.health.async_add_listener(self._async_update))
+
+    @callback
+    def _async_update(self) -> None:
+        """Handle updated stream health."""
+        self._attr_native_value = self.entity_description.value_fn(self.health)
+        self.async_write_ha_state()
+
+
+class TeslemetryStreamHealthSensorEntity(SensorEntity):
+    """Entity for the connection health of the Teslemetry stream."""
+
+    _attr_has_entity_name = True
+    entity_description: TeslemetryStreamHealthSensorEntityDescription
+
+    def __init__(
+        self,
+        uid: str,
+        health: TeslemetryStreamHealth,
+        description: TeslemetryStreamHealthSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self.health = health
+        self._attr_translation_key = description.key
+        self._attr_unique_id = f"{uid}_{description.key}"
+        self._attr_native_value = description.value_fn(health)
+
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Handle entity which will be added."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.health.async_add_listener(self._async_update))
+
+    @callback
+    def _async_update(self) -> None:
+        """Handle updated stream health."""
+        self._attr_native_value = self.entity_description.value_fn(self.health)
+        self.async_write_ha_state()
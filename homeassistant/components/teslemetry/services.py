@@ -20,7 +20,7 @@ from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv, device_registry as dr
 
 from .const import DOMAIN
-from .helpers import handle_command, handle_vehicle_command
+from .helpers import handle_command
 from .models import TeslemetryEnergyData, TeslemetryVehicleData
 
 if TYPE_CHECKING:
@@ -139,7 +139,7 @@ def async_setup_services(hass: HomeAssistant) -> None:
         config = async_get_config_for_device(hass, device)
         vehicle = async_get_vehicle_for_entry(hass, device, config)
 
-        await handle_vehicle_command(
+        await vehicle.executor.async_execute(
             vehicle.api.navigation_gps_request(
                 lat=call.data[ATTR_GPS][CONF_LATITUDE],
                 lon=call.data[ATTR_GPS][CONF_LONGITUDE],
@@ -181,7 +181,7 @@ def async_setup_services(hass: HomeAssistant) -> None:
         else:
             time = 0
 
-        await handle_vehicle_command(
+        await vehicle.executor.async_execute(
             vehicle.api.set_scheduled_charging(enable=call.data["enable"], time=time)
         )
 
@@ -241,7 +241,7 @@ def async_setup_services(hass: HomeAssistant) -> None:
         else:
             end_off_peak_time = 0
 
-        await handle_vehicle_command(
+        await vehicle.executor.async_execute(
             vehicle.api.set_scheduled_departure(
                 enable,
                 preconditioning_enabled,
@@ -277,7 +277,7 @@ def async_setup_services(hass: HomeAssistant) -> None:
         config = async_get_config_for_device(hass, device)
         vehicle = async_get_vehicle_for_entry(hass, device, config)
 
-        await handle_vehicle_command(
+        await vehicle.executor.async_execute(
             vehicle.api.set_valet_mode(call.data["enable"], call.data["pin"])
         )
 
@@ -302,11 +302,11 @@ def async_setup_services(hass: HomeAssistant) -> None:
 
         enable = call.data["enable"]
         if enable is True:
-            await handle_vehicle_command(
+            await vehicle.executor.async_execute(
                 vehicle.api.speed_limit_activate(call.data["pin"])
             )
         elif enable is False:
-            await handle_vehicle_command(
+            await vehicle.executor.async_execute(
                 vehicle.api.speed_limit_deactivate(call.data["pin"])
             )
 
@@ -334,13 +334,18 @@ def async_setup_services(hass: HomeAssistant) -> None:
         if "tariff_content_v2" in tou_settings:
             tou_settings = tou_settings["tariff_content_v2"]
 
-        resp = await handle_command(site.api.time_of_use_settings(tou_settings))
+        resp = await handle_command(
+            site.api.time_of_use_settings(tou_settings),
+            site.info_coordinator.governor,
+        )
         if "error" in resp:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="command_error",
                 translation_placeholders={"error": resp["error"]},
             )
+        # Pick up the new tariff without waiting for the next poll
+        await site.info_coordinator.async_request_refresh()
 
     hass.services.async_register(
         DOMAIN,
@@ -395,7 +400,7 @@ def async_setup_services(hass: HomeAssistant) -> None:
         schedule_id = call.data.get(ATTR_ID)
         name = call.data.get(ATTR_NAME)
 
-        await handle_vehicle_command(
+        await vehicle.executor.async_execute(
             vehicle.api.add_charge_schedule(
                 days_of_week=days_of_week,
                 enabled=enabled,
@@ -440,7 +445,7 @@ def async_setup_services(hass: HomeAssistant) -> None:
         # Extract parameters from the service call
         schedule_id = call.data[ATTR_ID]
 
-        await handle_vehicle_command(
+        await vehicle.executor.async_execute(
             vehicle.api.remove_charge_schedule(
                 id=schedule_id,
             )
@@ -490,7 +495,7 @@ def async_setup_services(hass: HomeAssistant) -> None:
         one_time = call.data.get(ATTR_ONE_TIME)
         name = call.data.get(ATTR_NAME)
 
-        await handle_vehicle_command(
+        await vehicle.executor.async_execute(
             vehicle.api.add_precondition_schedule(
                 days_of_week=days_of_week,
                 enabled=enabled,
@@ -533,7 +538,7 @@ def async_setup_services(hass: HomeAssistant) -> None:
         # Extract parameters from the service call
         schedule_id = call.data[ATTR_ID]
 
-        await handle_vehicle_command(
+        await vehicle.executor.async_execute(
             vehicle.api.remove_precondition_schedule(
                 id=schedule_id,
             )
@@ -0,0 +1,455 @@
+"""Teslemetry stream helpers."""
+
+from asyncio import Handle
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any, override
+
+from aiohttp import ClientError
+from teslemetry_stream import Signal, TeslemetryStream, TeslemetryStreamVehicle
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+
+from .const import LOGGER
+from .health import TeslemetryStreamHealth, TeslemetryVehicleStreamHealth
+
+# Seconds to collect stream driven state writes before flushing them. Zero
+# flushes on the next event loop iteration, which coalesces one stream frame.
+STREAM_WRITE_WINDOW = 0.0
+# Seconds to wait after entities are disabled or removed before dropping the
+# fields they used, so a batch of registry changes causes one update
+FIELD_RECONCILE_DELAY = 2.0
+# Entity options overriding the stream config of the fields an entity uses
+CONF_STREAM_INTERVAL = "stream_interval"
+CONF_STREAM_MINIMUM_DELTA = "stream_minimum_delta"
+STREAM_OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_STREAM_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_STREAM_MINIMUM_DELTA): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+# Stream config keys of a field that entities can set
+FIELD_OPTIONS = ("interval_seconds", "minimum_delta")
+# Seconds between frames of streaming fields that rarely change
+STREAMING_SLOW_INTERVAL = 300
+# Seconds between odometer frames, which otherwise change with every meter driven
+STREAMING_ODOMETER_INTERVAL = 60
+
+
+class TeslemetryStreamWriter:
+    """Coalesce stream driven state writes for a vehicle.
+
+    Stream callbacks mark their entity dirty instead of writing state, and each
+    dirty entity is written once per flush, however many fields changed.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, window: float = STREAM_WRITE_WINDOW
+    ) -> None:
+        """Initialize the writer."""
+        self.hass = hass
+        self.window = window
+        self._dirty: dict[Entity, None] = {}
+        self._handle: Handle | None = None
+
+    @callback
+    def async_schedule_write(self, entity: Entity) -> None:
+        """Mark an entity dirty and schedule a flush."""
+        self._dirty[entity] = None
+        if self._handle is not None:
+            return
+        if self.window:
+            self._handle = self.hass.loop.call_later(self.window, self._async_flush)
+        else:
+            self._handle = self.hass.loop.call_soon(self._async_flush)
+
+    @callback
+    def async_discard(self, entity: Entity) -> None:
+        """Forget a pending write for an entity that is being removed."""
+        self._dirty.pop(entity, None)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the pending flush and drop every pending write."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._dirty.clear()
+
+    @callback
+    def _async_flush(self) -> None:
+        """Write the state of every dirty entity once."""
+        self._handle = None
+        dirty, self._dirty = self._dirty, {}
+        for entity in dirty:
+            entity.async_write_ha_state()
+
+
+class TeslemetryStreamDispatcher:
+    """Route the stream fields of one vehicle to their listeners.
+
+    A single stream listener receives every frame for the vehicle, and each
+    field in the frame is handed to the listeners registered for that field.
+    """
+
+    def __init__(self, stream: TeslemetryStream, vin: str) -> None:
+        """Initialize the dispatcher."""
+        self.stream = stream
+        self.vin = vin
+        self._routes: dict[
+            str, dict[CALLBACK_TYPE, Callable[[dict[str, Any]], None]]
+        ] = {}
+        self._remove_listener: CALLBACK_TYPE | None = None
+
+    @property
+    def fields(self) -> set[str]:
+        """Return the fields that have listeners."""
+        return set(self._routes)
+
+    @callback
+    def async_add_field_listener(
+        self, field: str, listener: Callable[[dict[str, Any]], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for frames containing a field."""
+        routes = self._routes.setdefault(field, {})
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the field listener."""
+            del routes[remove_listener]
+            if not routes:
+                del self._routes[field]
+            if not self._routes and self._remove_listener is not None:
+                self._remove_listener()
+                self._remove_listener = None
+
+        routes[remove_listener] = listener
+        if self._remove_listener is None:
+            self._remove_listener = self.stream.async_add_listener(
+                self._async_handle_event, {"vin": self.vin, "data": None}
+            )
+        return remove_listener
+
+    @callback
+    def _async_handle_event(self, event: dict[str, Any]) -> None:
+        """Dispatch each field of a frame to its listeners."""
+        for field in event["data"]:
+            if (routes := self._routes.get(field)) is None:
+                continue
+            for listener in list(routes.values()):
+                try:
+                    listener(event)
+                except Exception:  # noqa: BLE001
+                    LOGGER.exception(
+                        "Error handling streaming field %s for %s", field, self.vin
+                    )
+
+
+class TeslemetryDispatchStreamVehicle(TeslemetryStreamVehicle):
+    """Stream vehicle that enables the fields of its listeners in batches."""
+
+    stream: TeslemetryDispatchStream
+
+    def __init__(self, stream: TeslemetryDispatchStream, vin: str) -> None:
+        """Initialize the vehicle."""
+        super().__init__(stream, vin)
+        self._pending_fields: dict[str, None] = {}
+        self._handle: Handle | None = None
+        # Every field enabled for a listener since setup
+        self._requested_fields: set[str] = set()
+        # Stream config each owner wants for a field, with None as the owner
+        # of listeners without one
+        self._field_options: dict[str, dict[object, dict[str, Any]]] = {}
+        # Fields given a non default config since setup
+        self._configured_fields: set[str] = set()
+        self._owner: tuple[object, dict[str, Any]] | None = None
+        # The config load has finished, and whether it succeeded
+        self.config_loaded = False
+        self.config_known = False
+        self.health = TeslemetryVehicleStreamHealth()
+
+    @override
+    def _enable_field(self, field: Signal) -> None:
+        """Queue a field requested by a listener."""
+        self.async_enable_fields((field,))
+
+    @callback
+    def async_enable_fields(self, fields: Iterable[Signal | str]) -> None:
+        """Queue fields to be enabled together with any others requested."""
+        owner, options = self._owner or (None, {})
+        for field in fields:
+            self._requested_fields.add(field)
+            self._field_options.setdefault(field, {})[owner] = options
+            self._pending_fields[field] = None
+        self._async_schedule_flush()
+
+    @contextmanager
+    def field_options(self, owner: object, options: dict[str, Any]) -> Iterator[None]:
+        """Give the fields that listeners enable inside the block a config.
+
+        The options are stream config keys of a field, like interval_seconds
+        and minimum_delta, and apply until the owner removes them.
+        """
+        self._owner = (owner, options)
+        try:
+            yield
+        finally:
+            self._owner = None
+
+    @callback
+    def async_update_field_options(
+        self, owner: object, options: dict[str, Any]
+    ) -> None:
+        """Replace the config an owner wants for its fields."""
+        for field, owners in self._field_options.items():
+            if owner in owners:
+                owners[owner] = options
+                self._pending_fields[field] = None
+        self._async_schedule_flush()
+
+    @callback
+    def async_remove_field_options(self, owner: object) -> None:
+        """Remove the config an owner wants for its fields."""
+        for field, owners in self._field_options.items():
+            if owners.pop(owner, None) is not None and owners:
+                self._pending_fields[field] = None
+        self._async_schedule_flush()
+
+    def _field_config(self, field: str) -> dict[str, Any] | None:
+        """Return the stream config that every owner of a field can accept.
+
+        An option is only set when every owner asks for it, and then to its
+        most demanding value, so no owner receives the field less often than
+        it wants.
+        """
+        owners = self._field_options.get(field, {}).values()
+        config: dict[str, Any] = {}
+        for key in FIELD_OPTIONS:
+            values = [options.get(key) for options in owners]
+            if values and None not in values:
+                config[key] = min(values)
+        return config or None
+
+    def _field_outdated(self, field: str, config: dict[str, Any] | None) -> bool:
+        """Return if the vehicle config of a field differs from the wanted one."""
+        if (current := self.fields.get(field)) is None:
+            return True
+        if config is None:
+            # Reset a field this integration configured, but leave the config
+            # other clients gave the field alone
+            return field in self._configured_fields
+        return any(current.get(key) != value for key, value in config.items())
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Flush the queued fields on the next event loop iteration."""
+        if (
+            self._pending_fields
+            and self.stream.started
+            and self.config_loaded
+            and self._handle is None
+        ):
+            self._handle = self.stream.hass.loop.call_soon(self.async_flush_fields)
+
+    @callback
+    def async_flush_fields(self) -> None:
+        """Configure every queued field with a single configuration update."""
+        self._handle = None
+        if not self.config_loaded:
+            # Fields already enabled are only known once the config is loaded
+            return
+        fields: dict[str, dict[str, Any] | None] = {}
+        for field in self._pending_fields:
+            config = self._field_config(field)
+            if not self._field_outdated(field, config):
+                continue
+            fields[field] = config
+            if config is None:
+                self._configured_fields.discard(field)
+            else:
+                self._configured_fields.add(field)
+        self._pending_fields.clear()
+        if fields:
+            self.stream.config_entry.async_create_background_task(
+                self.stream.hass,
+                self.update_config({"fields": fields}),
+                f"Adding fields to {self.vin}",
+            )
+
+    @callback
+    def async_reconcile_fields(self) -> None:
+        """Drop the enabled fields that no listener uses any more.
+
+        Only fields enabled for a listener since setup are dropped, so fields
+        configured for other Teslemetry clients are left alone. Without a
+        loaded config the enabled fields are unknown, so nothing is dropped.
+        """
+        if not self.config_known:
+            return
+        dispatcher = self.stream.dispatchers.get(self.vin)
+        used = dispatcher.fields if dispatcher else set()
+        unused = {
+            field
+            for field in self._requested_fields
+            if field not in used and field in self.fields
+        }
+        if not unused:
+            return
+        self._requested_fields -= unused
+        self.stream.config_entry.async_create_background_task(
+            self.stream.hass,
+            self._async_remove_fields(unused),
+            f"Removing fields from {self.vin}",
+        )
+
+    async def _async_remove_fields(self, unused: set[str]) -> None:
+        """Replace the vehicle config with one that leaves out unused fields.
+
+        The config is loaded again right before it is replaced, so changes
+        other clients made since setup are kept.
+        """
+        async with self.lock:
+            try:
+                await self.get_config()
+                fields = {
+                    field: value
+                    for field, value in self.fields.items()
+                    if field not in unused
+                }
+                response = await self.post_config({**self.config, "fields": fields})
+            except (ClientError, TimeoutError) as err:
+                response = {"error": str(err)}
+            if error := response.get("error"):
+                LOGGER.warning(
+                    "Could not remove streaming fields from %s: %s", self.vin, error
+                )
+                # Try again on the next reconcile
+                self._requested_fields |= unused
+                return
+            LOGGER.debug(
+                "Removed streaming fields %s from %s", ", ".join(unused), self.vin
+            )
+            self.fields = fields
+            self._configured_fields -= unused
+
+    @callback
+    def async_set_config_loaded(self, known: bool) -> None:
+        """Enable the fields queued while the configuration was loading."""
+        self.config_loaded = True
+        self.config_known = known
+        if self.stream.started:
+            self.async_flush_fields()
+
+
+class TeslemetryDispatchStream(TeslemetryStream):
+    """Teslemetry stream with one listener and one field update per vehicle."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the stream."""
+        self.hass = hass
+        self.config_entry = config_entry
+        self.started = False
+        self.dispatchers: dict[str, TeslemetryStreamDispatcher] = {}
+        self._reconcile_handle: Handle | None = None
+        super().__init__(*args, **kwargs)
+        self.health = TeslemetryStreamHealth(hass, self)
+
+    @override
+    def get_vehicle(self, vin: str) -> TeslemetryDispatchStreamVehicle:
+        """Return the stream vehicle for a VIN."""
+        if vin not in self.vehicles:
+            self.vehicles[vin] = TeslemetryDispatchStreamVehicle(self, vin)
+        return self.vehicles[vin]  # type: ignore[return-value]
+
+    @override
+    def async_add_listener(
+        self,
+        callback: Callable[[dict[str, Any]], None],
+        filters: dict[str, Any] | None = None,
+    ) -> Callable[[], None]:
+        """Listen for stream events, routing single field listeners by vehicle."""
+        if (
+            filters is not None
+            and filters.keys() == {"vin", "data"}
+            and isinstance(data := filters["data"], dict)
+            and len(data) == 1
+            and None in data.values()
+        ):
+            vin = filters["vin"]
+            if (dispatcher := self.dispatchers.get(vin)) is None:
+                dispatcher = self.dispatchers[vin] = TeslemetryStreamDispatcher(
+                    self, vin
+                )
+            return dispatcher.async_add_field_listener(next(iter(data)), callback)
+        return super().async_add_listener(callback, filters)
+
+    @override
+    async def listen(self) -> None:
+        """Listen to the stream, attributing its errors to its health."""
+        self.health.async_set_listening()
+        await super().listen()
+
+    @callback
+    def async_start(self) -> None:
+        """Enable the fields queued during setup, one update per vehicle."""
+        self.started = True
+        self.config_entry.async_on_unload(self.health.async_start())
+        self.config_entry.async_on_unload(
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+                self._async_handle_registry_update,
+                event_filter=_async_entity_disabled_or_removed,
+            )
+        )
+        self.config_entry.async_on_unload(self._async_cancel_reconcile)
+        for vehicle in self.vehicles.values():
+            if isinstance(vehicle, TeslemetryDispatchStreamVehicle):
+                vehicle.async_flush_fields()
+
+    @callback
+    def _async_handle_registry_update(
+        self, _: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Reconcile the vehicle fields once the registry changes settle."""
+        self._async_cancel_reconcile()
+        self._reconcile_handle = self.hass.loop.call_later(
+            FIELD_RECONCILE_DELAY, self._async_reconcile_fields
+        )
+
+    @callback
+    def _async_reconcile_fields(self) -> None:
+        """Drop the fields no listener uses from every vehicle."""
+        self._reconcile_handle = None
+        for vehicle in self.vehicles.values():
+            if isinstance(vehicle, TeslemetryDispatchStreamVehicle):
+                vehicle.async_reconcile_fields()
+
+    @callback
+    def _async_cancel_reconcile(self) -> None:
+        """Cancel a pending field reconcile."""
+        if self._reconcile_handle is not None:
+            self._reconcile_handle.cancel()
+            self._reconcile_handle = None
+
+
+@callback
+def _async_entity_disabled_or_removed(
+    event_data: er.EventEntityRegistryUpdatedData,
+) -> bool:
+    """Return if a registry update disabled, enabled or removed an entity."""
+    if event_data["action"] == "remove":
+        return True
+    return event_data["action"] == "update" and "disabled_by" in event_data["changes"]
@@ -1,6 +1,6 @@
 """Switch platform for Teslemetry integration."""
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 from typing import Any, override
 
@@ -25,9 +25,10 @@ from .entity import (
     TeslemetryRootEntity,
     TeslemetryVehiclePollingEntity,
     TeslemetryVehicleStreamEntity,
+    async_add_product_entities,
 )
-from .helpers import handle_command, handle_vehicle_command
-from .models import TeslemetryEnergyData, TeslemetryVehicleData
+from .helpers import handle_command
+from .models import TeslemetryEnergyData, TeslemetryProducts, TeslemetryVehicleData
 
 PARALLEL_UPDATES = 0
 
@@ -159,48 +160,53 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Teslemetry Switch platform from a config entry."""
 
-    entities: list[SwitchEntity] = []
-
-    for vehicle in entry.runtime_data.vehicles:
-        for description in VEHICLE_DESCRIPTIONS:
-            if vehicle.poll or not firmware_at_least(
-                vehicle.firmware, description.streaming_firmware
-            ):
-                if description.polling:
+    def _product_entities(products: TeslemetryProducts) -> Iterable[SwitchEntity]:
+        """Return the entities of the products."""
+        entities: list[SwitchEntity] = []
+
+        for vehicle in products.vehicles:
+            for description in VEHICLE_DESCRIPTIONS:
+                if vehicle.poll or not firmware_at_least(
+                    vehicle.firmware, description.streaming_firmware
+                ):
+                    if description.polling:
+                        entities.append(
+                            TeslemetryVehiclePollingVehicleSwitchEntity(
+                                vehicle, description, products.scopes
+                            )
+                        )
+                else:
                     entities.append(
-                        TeslemetryVehiclePollingVehicleSwitchEntity(
-                            vehicle, description, entry.runtime_data.scopes
+                        TeslemetryStreamingVehicleSwitchEntity(
+                            vehicle, description, products.scopes
                         )
                     )
-            else:
-                entities.append(
-                    TeslemetryStreamingVehicleSwitchEntity(
-                        vehicle, description, entry.runtime_data.scopes
-                    )
-                )
 
-    entities.extend(
-        TeslemetryChargeFromGridSwitchEntity(
-            energysite,
-            entry.runtime_data.scopes,
+        entities.extend(
+            TeslemetryChargeFromGridSwitchEntity(
+                energysite,
+                products.scopes,
+            )
+            for energysite in products.energysites
+            if energysite.info_coordinator.data.get("components_battery")
+            and energysite.info_coordinator.data.get("components_solar")
         )
-        for energysite in entry.runtime_data.energysites
-        if energysite.info_coordinator.data.get("components_battery")
-        and energysite.info_coordinator.data.get("components_solar")
-    )
-    entities.extend(
-        TeslemetryStormModeSwitchEntity(energysite, entry.runtime_data.scopes)
-        for energysite in entry.runtime_data.energysites
-        if energysite.info_coordinator.data.get("components_storm_mode_capable")
-    )
+        entities.extend(
+            TeslemetryStormModeSwitchEntity(energysite, products.scopes)
+            for energysite in products.energysites
+            if energysite.info_coordinator.data.get("components_storm_mode_capable")
+        )
+
+        return entities
 
-    async_add_entities(entities)
+    async_add_product_entities(entry, async_add_entities, _product_entities)
 
 
 class TeslemetryVehicleSwitchEntity(TeslemetryRootEntity, SwitchEntity):
     """Base class for all Teslemetry switch entities."""
 
     api: Vehicle
+    vehicle: TeslemetryVehicleData
     _attr_device_class = SwitchDeviceClass.SWITCH
     entity_description: TeslemetrySwitchEntityDescription
 
@@ -208,7 +214,9 @@ class TeslemetryVehicleSwitchEntity(TeslemetryRootEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the Switch."""
         self.raise_for_scope(self.entity_description.scopes[0])
-        await handle_vehicle_command(self.entity_description.on_func(self.api))
+        await self.vehicle.executor.async_execute(
+            self.entity_description.on_func(self.api)
+        )
         self._attr_is_on = True
         self.async_write_ha_state()
 
@@ -216,7 +224,9 @@ class TeslemetryVehicleSwitchEntity(TeslemetryRootEntity, SwitchEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the Switch."""
         self.raise_for_scope(self.entity_description.scopes[0])
-        await handle_vehicle_command(self.entity_description.off_func(self.api))
+        await self.vehicle.executor.async_execute(
+            self.entity_description.off_func(self.api)
+        )
         self._attr_is_on = False
         self.async_write_ha_state()
 
@@ -290,7 +300,7 @@ class TeslemetryStreamingVehicleSwitchEntity(
     def _value_callback(self, value: bool | None) -> None:
         """Update the value of the entity."""
         self._attr_is_on = value
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
 
 class TeslemetryChargeFromGridSwitchEntity(TeslemetryEnergyInfoEntity, SwitchEntity):
@@ -323,7 +333,8 @@ class TeslemetryChargeFromGridSwitchEntity(TeslemetryEnergyInfoEntity, SwitchEnt
         await handle_command(
             self.api.grid_import_export(
                 disallow_charge_from_grid_with_solar_installed=False
-            )
+            ),
+            self.coordinator.governor,
         )
         self._attr_is_on = True
         self.async_write_ha_state()
@@ -335,7 +346,8 @@ class TeslemetryChargeFromGridSwitchEntity(TeslemetryEnergyInfoEntity, SwitchEnt
         await handle_command(
             self.api.grid_import_export(
                 disallow_charge_from_grid_with_solar_installed=True
-            )
+            ),
+            self.coordinator.governor,
         )
         self._attr_is_on = False
         self.async_write_ha_state()
@@ -365,7 +377,9 @@ class TeslemetryStormModeSwitchEntity(TeslemetryEnergyInfoEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the Switch."""
         self.raise_for_scope(Scope.ENERGY_CMDS)
-        await handle_command(self.api.storm_mode(enabled=True))
+        await handle_command(
+            self.api.storm_mode(enabled=True), self.coordinator.governor
+        )
         self._attr_is_on = True
         self.async_write_ha_state()
 
@@ -373,6 +387,8 @@ class TeslemetryStormModeSwitchEntity(TeslemetryEnergyInfoEntity, SwitchEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the Switch."""
         self.raise_for_scope(Scope.ENERGY_CMDS)
-        await handle_command(self.api.storm_mode(enabled=False))
+        await handle_command(
+            self.api.storm_mode(enabled=False), self.coordinator.governor
+        )
         self._attr_is_on = False
         self.async_write_ha_state()
@@ -0,0 +1,426 @@
+"""Tariff schedule index for the Teslemetry integration."""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from .coordinator import TeslemetryEnergySiteInfoCoordinator
+
+# Energy site info key prefixes of the buy and sell tariffs
+TARIFF_BUY = "tariff_content_v2"
+TARIFF_SELL = "tariff_content_v2_sell_tariff"
+
+# Days of tariff intervals compiled before and after the current day
+TARIFF_LOOKBACK = timedelta(days=7)
+TARIFF_HORIZON = timedelta(days=380)
+# Days after which the rolling horizon is moved forward
+TARIFF_REBUILD = timedelta(days=14)
+# Longest a tariff interval can last, allowing for a daylight saving change
+MAX_INTERVAL = timedelta(hours=25)
+
+
+@dataclass(frozen=True, slots=True)
+class TariffInterval:
+    """A tariff period between two points in time."""
+
+    start: datetime
+    end: datetime
+    season: str
+    period: str
+    price: float | None
+
+
+def _is_day_in_range(day_of_week: int, from_day: int, to_day: int) -> bool:
+    """Check if a day of week falls within a range, handling week crossing."""
+    if from_day <= to_day:
+        return from_day <= day_of_week <= to_day
+    # Week crossing (e.g., Fri=4 to Mon=0)
+    return day_of_week >= from_day or day_of_week <= to_day
+
+
+def _parse_period_times(
+    period_def: dict[str, Any],
+    base_day: datetime,
+) -> tuple[datetime, datetime] | None:
+    """Parse a TOU period definition into start and end times.
+
+    Returns None if the base_day's weekday doesn't match the period's day range.
+    For periods crossing midnight, end_time will be on the following day.
+    """
+    # DaysOfWeek are from 0-6 (Monday-Sunday)
+    from_day = period_def.get("fromDayOfWeek", 0)
+    to_day = period_def.get("toDayOfWeek", 6)
+
+    if not _is_day_in_range(base_day.weekday(), from_day, to_day):
+        return None
+
+    # Hours are from 0-23, so 24 hours is 0-0
+    from_hour = period_def.get("fromHour", 0)
+    to_hour = period_def.get("toHour", 0)
+
+    # Minutes are from 0-59, so 60 minutes is 0-0
+    from_minute = period_def.get("fromMinute", 0)
+    to_minute = period_def.get("toMinute", 0)
+
+    start_time = base_day.replace(
+        hour=from_hour, minute=from_minute, second=0, microsecond=0
+    )
+    end_time = base_day.replace(hour=to_hour, minute=to_minute, second=0, microsecond=0)
+
+    if end_time <= start_time:
+        end_time += timedelta(days=1)
+
+    return start_time, end_time
+
+
+def _get_season(seasons: dict[str, dict[str, Any]], date: datetime) -> str | None:
+    """Determine the active season for a given date."""
+    local_date = dt_util.as_local(date)
+    year = local_date.year
+
+    for season_name, season_data in seasons.items():
+        if not season_data:
+            continue
+
+        try:
+            from_month = season_data["fromMonth"]
+            from_day = season_data["fromDay"]
+            to_month = season_data["toMonth"]
+            to_day = season_data["toDay"]
+
+            # Handle seasons that cross year boundaries
+            start_year = year
+            end_year = year
+
+            # Season crosses year boundary (e.g., Oct-Mar)
+            if from_month > to_month or (from_month == to_month and from_day > to_day):
+                if local_date.month > from_month or (
+                    local_date.month == from_month and local_date.day >= from_day
+                ):
+                    end_year = year + 1
+                else:
+                    start_year = year - 1
+
+            season_start = local_date.replace(
+                year=start_year,
+                month=from_month,
+                day=from_day,
+                hour=0,
+                minute=0,
+                second=0,
+                microsecond=0,
+            )
+            season_end = local_date.replace(
+                year=end_year,
+                month=to_month,
+                day=to_day,
+                hour=0,
+                minute=0,
+                second=0,
+                microsecond=0,
+            ) + timedelta(days=1)
+
+            if season_start <= local_date < season_end:
+                return season_name
+        except KeyError, ValueError:
+            continue
+
+    return None
+
+
+def _get_price(
+    charges: dict[str, dict[str, Any]], season_name: str, period_name: str
+) -> float | None:
+    """Get the price for a specific season and period name."""
+    try:
+        season_charges = charges.get(season_name, charges.get("ALL", {}))
+        rates = season_charges.get("rates", {})
+        price = rates.get(period_name, rates.get("ALL"))
+        return float(price) if price is not None else None
+    except KeyError, ValueError, TypeError:
+        return None
+
+
+def _compile_intervals(
+    seasons: dict[str, dict[str, Any]],
+    charges: dict[str, dict[str, Any]],
+    first_day: datetime,
+    last_day: datetime,
+) -> list[TariffInterval]:
+    """Expand the tariff into the intervals starting on local days in a range.
+
+    Periods that cross midnight into a different season end at the season
+    change, and the new season's overnight periods carry on from midnight.
+    Intervals are sorted by start time, keeping the tariff's period order for
+    intervals that start together.
+    """
+    intervals: list[TariffInterval] = []
+    prices: dict[tuple[str, str], float | None] = {}
+    day = timedelta(days=1)
+
+    def add(season_name: str, base_day: datetime, current_day: datetime) -> None:
+        """Add the intervals of a season's periods on a day to the index."""
+        next_day = current_day + day
+        next_season = _get_season(seasons, next_day)
+        # Time of use (TOU) periods define the tariff schedule within a season
+        tou_periods = seasons[season_name].get("tou_periods", {})
+        for period_name, period_group in tou_periods.items():
+            for period_def in period_group.get("periods", []):
+                if (result := _parse_period_times(period_def, base_day)) is None:
+                    continue
+                start_time, end_time = result
+                if base_day < current_day:
+                    # Carry in the overnight part from the day before
+                    if end_time <= current_day:
+                        continue
+                    start_time = current_day
+                elif end_time > next_day and next_season != season_name:
+                    end_time = next_day
+                key = (season_name, period_name)
+                if key not in prices:
+                    prices[key] = _get_price(charges, season_name, period_name)
+                intervals.append(
+                    TariffInterval(
+                        start_time, end_time, season_name, period_name, prices[key]
+                    )
+                )
+
+    previous_season = _get_season(seasons, first_day - day)
+    current_day = first_day
+    while current_day < last_day:
+        season_name = _get_season(seasons, current_day)
+        if season_name and seasons.get(season_name):
+            if season_name != previous_season:
+                add(season_name, current_day - day, current_day)
+            add(season_name, current_day, current_day)
+        previous_season = season_name
+        current_day += day
+
+    intervals.sort(key=lambda interval: interval.start)
+    return intervals
+
+
+class TeslemetryTariffIndex:
+    """Sorted index of tariff intervals over a rolling horizon.
+
+    The seasons and time of use periods are expanded once into intervals
+    covering a week back and a year ahead of the current day, so the current
+    period and range queries are answered by bisecting the start times.
+    """
+
+    def __init__(
+        self,
+        seasons: dict[str, dict[str, Any]],
+        charges: dict[str, dict[str, Any]],
+    ) -> None:
+        """Initialize the index."""
+        self.seasons = seasons
+        self.charges = charges
+        self.first_day: datetime | None = None
+        self.last_day: datetime | None = None
+        self.intervals: list[TariffInterval] = []
+        self._starts: list[datetime] = []
+
+    def _ensure(self, now: datetime) -> None:
+        """Compile the index again when the current day leaves its horizon."""
+        today = dt_util.start_of_local_day(now)
+        if (
+            self.first_day is not None
+            and self.first_day < today < self.first_day + TARIFF_REBUILD
+        ):
+            return
+        self.first_day = today - TARIFF_LOOKBACK
+        self.last_day = today + TARIFF_HORIZON
+        self.intervals = _compile_intervals(
+            self.seasons, self.charges, self.first_day, self.last_day
+        )
+        self._starts = [interval.start for interval in self.intervals]
+
+    def interval_at(self, now: datetime) -> TariffInterval | None:
+        """Return the interval in effect at a point in time.
+
+        When intervals overlap, such as across a season change, the one that
+        started last wins.
+        """
+        now = dt_util.as_local(now)
+        self._ensure(now)
+        return self._interval_at(now)
+
+    def _interval_at(self, now: datetime) -> TariffInterval | None:
+        """Return the interval in effect at a point in time within the index."""
+        lo = bisect_left(self._starts, now - MAX_INTERVAL)
+        hi = bisect_right(self._starts, now)
+        for index in range(hi - 1, lo - 1, -1):
+            if self.intervals[index].end > now:
+                return self.intervals[index]
+        return None
+
+    def next_boundary(self, now: datetime) -> datetime | None:
+        """Return when the interval in effect next changes."""
+        now = dt_util.as_local(now)
+        self._ensure(now)
+        index = bisect_right(self._starts, now)
+        next_start = self._starts[index] if index < len(self._starts) else None
+        if (current := self._interval_at(now)) is None:
+            return next_start
+        if next_start is None:
+            return current.end
+        return min(current.end, next_start)
+
+    def next_change(
+        self, now: datetime
+    ) -> tuple[datetime, TariffInterval | None] | None:
+        """Return when the price next changes, and the interval it changes to.
+
+        Consecutive intervals with the same price, such as the same period on
+        the next day, are skipped over. The interval is None when no tariff
+        period follows.
+        """
+        now = dt_util.as_local(now)
+        self._ensure(now)
+        if (current := self._interval_at(now)) is None:
+            index = bisect_right(self._starts, now)
+            if index == len(self.intervals):
+                return None
+            return self.intervals[index].start, self.intervals[index]
+
+        boundary = current.end
+        while (interval := self._interval_at(boundary)) is not None:
+            if interval.price != current.price:
+                return boundary, interval
+            boundary = interval.end
+        if boundary > self._starts[-1]:
+            # The price does not change within the horizon
+            return None
+        return boundary, None
+
+    def intervals_between(self, start: datetime, end: datetime) -> list[TariffInterval]:
+        """Return the intervals that overlap a range, sorted by start time."""
+        start = dt_util.as_local(start)
+        end = dt_util.as_local(end)
+        self._ensure(dt_util.now())
+
+        # Periods that cross midnight start on the local day before the range
+        first_day = dt_util.start_of_local_day(start) - timedelta(days=1)
+        assert self.first_day is not None and self.last_day is not None
+        if first_day >= self.first_day and end <= self.last_day:
+            intervals = self.intervals
+            starts = self._starts
+        else:
+            # Outside the rolling horizon, expand just the requested days
+            intervals = _compile_intervals(self.seasons, self.charges, first_day, end)
+            starts = [interval.start for interval in intervals]
+
+        lo = bisect_left(starts, start - MAX_INTERVAL)
+        hi = bisect_left(starts, end)
+        return [interval for interval in intervals[lo:hi] if interval.end > start]
+
+
+@dataclass(frozen=True, slots=True)
+class TariffPrices:
+    """Current and next prices of an energy site's tariffs."""
+
+    buy: TariffInterval | None
+    sell: TariffInterval | None
+    next_change: datetime | None
+    next_buy: TariffInterval | None
+
+
+class TeslemetryTariffTracker:
+    """Track the prices of an energy site's tariffs with one boundary timer.
+
+    Prices are computed from the tariff indexes when read and kept until the
+    tariff changes or the next period boundary of either tariff, where a
+    single timer notifies every listener.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: TeslemetryEnergySiteInfoCoordinator,
+    ) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self._listeners: set[CALLBACK_TYPE] = set()
+        self._prices: TariffPrices | None = None
+        self._indexes: tuple[TeslemetryTariffIndex, TeslemetryTariffIndex] | None = None
+        self._boundary: datetime | None = None
+        self._unsub_boundary: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_prices(self) -> TariffPrices:
+        """Return the current prices."""
+        buy = self.coordinator.tariff_index(TARIFF_BUY)
+        sell = self.coordinator.tariff_index(TARIFF_SELL)
+        now = dt_util.now()
+        if (
+            self._prices is not None
+            and self._indexes == (buy, sell)
+            and (self._boundary is None or now < self._boundary)
+        ):
+            return self._prices
+
+        change = buy.next_change(now)
+        self._prices = TariffPrices(
+            buy=buy.interval_at(now),
+            sell=sell.interval_at(now),
+            next_change=change[0] if change else None,
+            next_buy=change[1] if change else None,
+        )
+        self._indexes = (buy, sell)
+        self._boundary = min(
+            (
+                boundary
+                for boundary in (buy.next_boundary(now), sell.next_boundary(now))
+                if boundary is not None
+            ),
+            default=None,
+        )
+        self._async_schedule()
+        return self._prices
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for the prices changing at a period boundary."""
+        self._listeners.add(update_callback)
+        self._async_schedule()
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener and stop the timer after the last one."""
+            self._listeners.discard(update_callback)
+            if not self._listeners:
+                self._async_cancel()
+
+        return remove_listener
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Schedule the timer for the next period boundary."""
+        self._async_cancel()
+        if self._listeners and self._boundary is not None:
+            self._unsub_boundary = async_track_point_in_time(
+                self.hass, self._async_handle_boundary, self._boundary
+            )
+
+    @callback
+    def _async_cancel(self) -> None:
+        """Cancel the boundary timer."""
+        if self._unsub_boundary is not None:
+            self._unsub_boundary()
+            self._unsub_boundary = None
+
+    @callback
+    def _async_handle_boundary(self, _: datetime) -> None:
+        """Notify the listeners that a period boundary has passed."""
+        self._unsub_boundary = None
+        self._prices = None
+        for update_callback in list(self._listeners):
+            update_callback()
@@ -1,5 +1,6 @@
 """Update platform for Teslemetry integration."""
 
+from collections.abc import Iterable
 from typing import Any, override
 
 from tesla_fleet_api import firmware_at_least
@@ -20,9 +21,9 @@ from .entity import (
     TeslemetryRootEntity,
     TeslemetryVehiclePollingEntity,
     TeslemetryVehicleStreamEntity,
+    async_add_product_entities,
 )
-from .helpers import handle_vehicle_command
-from .models import TeslemetryVehicleData
+from .models import TeslemetryProducts, TeslemetryVehicleData
 
 AVAILABLE = "available"
 DOWNLOADING = "downloading"
@@ -40,18 +41,23 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Teslemetry update platform from a config entry."""
 
-    async_add_entities(
-        TeslemetryVehiclePollingUpdateEntity(vehicle, entry.runtime_data.scopes)
-        if vehicle.poll or not firmware_at_least(vehicle.firmware, "2024.44.25")
-        else TeslemetryStreamingUpdateEntity(vehicle, entry.runtime_data.scopes)
-        for vehicle in entry.runtime_data.vehicles
-    )
+    def _product_entities(products: TeslemetryProducts) -> Iterable[UpdateEntity]:
+        """Return the entities of the products."""
+        return (
+            TeslemetryVehiclePollingUpdateEntity(vehicle, products.scopes)
+            if vehicle.poll or not firmware_at_least(vehicle.firmware, "2024.44.25")
+            else TeslemetryStreamingUpdateEntity(vehicle, products.scopes)
+            for vehicle in products.vehicles
+        )
+
+    async_add_product_entities(entry, async_add_entities, _product_entities)
 
 
 class TeslemetryUpdateEntity(TeslemetryRootEntity, UpdateEntity):
     """Teslemetry Updates entity."""
 
     api: Vehicle
+    vehicle: TeslemetryVehicleData
     _attr_supported_features = UpdateEntityFeature.PROGRESS
 
     @override
@@ -61,7 +67,9 @@ class TeslemetryUpdateEntity(TeslemetryRootEntity, UpdateEntity):
         """Install an update."""
         self.raise_for_scope(Scope.VEHICLE_CMDS)
 
-        await handle_vehicle_command(self.api.schedule_software_update(offset_sec=0))
+        await self.vehicle.executor.async_execute(
+            self.api.schedule_software_update(offset_sec=0)
+        )
         self._attr_in_progress = True
         self.async_write_ha_state()
 
@@ -113,9 +121,9 @@ class TeslemetryVehiclePollingUpdateEntity(
             DOWNLOADING,
             WIFI_WAIT,
         ):
-            self._attr_latest_version = self.coordinator.data[
+            self._attr_latest_version = self.get(
                 "vehicle_state_software_update_version"
-            ]
+            )
         else:
             self._attr_latest_version = self._attr_installed_version
 
@@ -218,7 +226,7 @@ class TeslemetryStreamingUpdateEntity(
         else:
             self._attr_supported_features = UpdateEntityFeature.PROGRESS
         self._async_update_progress()
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_software_update_installation_percent_complete(
         self, value: float | None
@@ -227,7 +235,7 @@ class TeslemetryStreamingUpdateEntity(
 
         self._install_percentage = round(value) if value is not None else 0
         self._async_update_progress()
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_software_update_scheduled_start_time(
         self, value: int | None
@@ -236,7 +244,7 @@ class TeslemetryStreamingUpdateEntity(
 
         self._scheduled = value is not None
         self._async_update_progress()
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_software_update_version(self, value: str | None) -> None:
         """Handle software update version."""
@@ -244,7 +252,7 @@ class TeslemetryStreamingUpdateEntity(
         self._attr_latest_version = (
             value if value and value != " " else self._attr_installed_version
         )
-        self.async_write_ha_state()
+        self.async_write_stream_state()
 
     def _async_handle_version(self, value: str | None) -> None:
         """Handle version."""
@@ -254,7 +262,7 @@ class TeslemetryStreamingUpdateEntity(
             # A new installed version can be the only signal that an offline
             # install finished, so re-evaluate any lingering scheduled flag.
             self._async_update_progress()
-            self.async_write_ha_state()
+            self.async_write_stream_state()
 
     @property
     def _up_to_date(self) -> bool:
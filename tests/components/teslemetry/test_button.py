@@ -1,6 +1,8 @@
 """Test the Teslemetry button platform."""
 
-from unittest.mock import patch
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from syrupy.assertion import SnapshotAssertion
@@ -8,6 +10,7 @@ from syrupy.assertion import SnapshotAssertion
 from homeassistant.components.button import DOMAIN as BUTTON_DOMAIN, SERVICE_PRESS
 from homeassistant.const import ATTR_ENTITY_ID, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
 
 from . import assert_entities, setup_platform
@@ -52,3 +55,126 @@ async def test_press(hass: HomeAssistant, name: str, func: str) -> None:
             blocking=True,
         )
         command.assert_called_once()
+
+
+async def test_press_while_asleep_wakes_once(
+    hass: HomeAssistant,
+    mock_add_listener: AsyncMock,
+    mock_wake_up: AsyncMock,
+) -> None:
+    """Test concurrent commands to a sleeping vehicle share one wake up."""
+    entry = await setup_platform(hass, [Platform.BUTTON])
+    vehicle = entry.runtime_data.vehicles[0]
+    mock_add_listener.send(
+        {"vin": vehicle.vin, "state": "asleep", "createdAt": "2024-10-04T10:45:17.537Z"}
+    )
+    await hass.async_block_till_done()
+
+    with (
+        patch(
+            "tesla_fleet_api.teslemetry.Vehicle.flash_lights",
+            return_value=COMMAND_OK,
+        ) as flash_lights,
+        patch(
+            "tesla_fleet_api.teslemetry.Vehicle.honk_horn",
+            return_value=COMMAND_OK,
+        ) as honk_horn,
+    ):
+        await asyncio.gather(
+            *(
+                hass.services.async_call(
+                    BUTTON_DOMAIN,
+                    SERVICE_PRESS,
+                    {ATTR_ENTITY_ID: [f"button.test_{name}"]},
+                    blocking=True,
+                )
+                for name in ("flash_lights", "honk_horn")
+            )
+        )
+        flash_lights.assert_called_once()
+        honk_horn.assert_called_once()
+
+    mock_wake_up.assert_called_once()
+    assert vehicle.coordinator.data["state"] == "online"
+    metrics = vehicle.executor.async_diagnostics()
+    assert metrics["queue_depth"] == 0
+    assert metrics["wakes"] == 1
+    assert metrics["commands"] == 2
+    assert metrics["commands_per_wake"] == 2
+
+
+async def test_press_while_asleep_wakes_once_without_online(
+    hass: HomeAssistant,
+    mock_add_listener: AsyncMock,
+    mock_wake_up: AsyncMock,
+) -> None:
+    """Test queued commands share a wake up the vehicle never confirmed."""
+    entry = await setup_platform(hass, [Platform.BUTTON])
+    vehicle = entry.runtime_data.vehicles[0]
+    mock_add_listener.send(
+        {"vin": vehicle.vin, "state": "asleep", "createdAt": "2024-10-04T10:45:17.537Z"}
+    )
+    await hass.async_block_till_done()
+
+    async def wake_up() -> dict:
+        # Keep the vehicle asleep until both commands are queued
+        while vehicle.executor.queue_depth < 2:
+            await asyncio.sleep(0)
+        return {"response": {"state": "asleep"}, "error": None}
+
+    mock_wake_up.side_effect = wake_up
+
+    with (
+        patch("homeassistant.components.teslemetry.executor.WAKE_TIMEOUT", timedelta()),
+        patch(
+            "tesla_fleet_api.teslemetry.Vehicle.flash_lights",
+            return_value=COMMAND_OK,
+        ) as flash_lights,
+        patch(
+            "tesla_fleet_api.teslemetry.Vehicle.honk_horn",
+            return_value=COMMAND_OK,
+        ) as honk_horn,
+    ):
+        await asyncio.gather(
+            *(
+                hass.services.async_call(
+                    BUTTON_DOMAIN,
+                    SERVICE_PRESS,
+                    {ATTR_ENTITY_ID: [f"button.test_{name}"]},
+                    blocking=True,
+                )
+                for name in ("flash_lights", "honk_horn")
+            )
+        )
+        flash_lights.assert_called_once()
+        honk_horn.assert_called_once()
+
+    mock_wake_up.assert_called_once()
+    assert vehicle.coordinator.data["state"] == "asleep"
+    assert vehicle.executor.async_diagnostics()["queue_depth"] == 0
+    # Once the queue drained, the next command wakes the vehicle again
+    assert not vehicle.executor.woken
+    assert vehicle.executor.asleep
+
+
+async def test_press_refused_without_credits(hass: HomeAssistant) -> None:
+    """Test commands are not sent while the credits are exhausted."""
+    entry = await setup_platform(hass, [Platform.BUTTON])
+    governor = entry.runtime_data.governor
+    governor.async_set_exhausted()
+
+    with (
+        patch(
+            "tesla_fleet_api.teslemetry.Vehicle.flash_lights",
+            return_value=COMMAND_OK,
+        ) as command,
+        pytest.raises(HomeAssistantError),
+    ):
+        await hass.services.async_call(
+            BUTTON_DOMAIN,
+            SERVICE_PRESS,
+            {ATTR_ENTITY_ID: ["button.test_flash_lights"]},
+            blocking=True,
+        )
+    command.assert_not_awaited()
+    assert governor.decisions[-1]["action"] == "refuse"
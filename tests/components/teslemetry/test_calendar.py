@@ -2,7 +2,7 @@
 
 from collections.abc import Generator
 from copy import deepcopy
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch
 
 from freezegun.api import FrozenDateTimeFactory
@@ -15,6 +15,7 @@ from homeassistant.components.calendar import (
     EVENT_START_DATETIME,
     SERVICE_GET_EVENTS,
 )
+from homeassistant.components.calendar.const import DATA_COMPONENT
 from homeassistant.const import ATTR_ENTITY_ID, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
@@ -399,3 +400,112 @@ async def test_calendar_invalid_price(
     assert state
     assert state.state == "on"
     assert "Unknown Price" in state.attributes["message"]
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_calendar_index_multi_season_oracle(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_legacy: AsyncMock,
+    mock_site_info_multi_season: AsyncMock,
+) -> None:
+    """Test the current period matches the multi-season tariff every hour."""
+    tz = dt_util.get_default_time_zone()
+    freezer.move_to(datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz))
+
+    await setup_platform(hass, [Platform.CALENDAR])
+    entity = hass.data[DATA_COMPONENT].get_entity(ENTITY_BUY)
+    assert entity
+
+    # Summer is Apr-Sep with PEAK 16-21, Winter is Oct-Mar with PEAK 17-20,
+    # and OFF_PEAK runs from the end of PEAK to the start of the next one,
+    # except that a new season starts at midnight.
+    def season_of(day: datetime) -> tuple[str, int, int]:
+        return ("Summer", 16, 21) if 4 <= day.month <= 9 else ("Winter", 17, 20)
+
+    def expected(time: datetime) -> tuple[str, str, datetime]:
+        day = datetime(time.year, time.month, time.day, tzinfo=tz)
+        name, peak_start, peak_end = season_of(day)
+        if peak_start <= time.hour < peak_end:
+            return name, "Peak", day.replace(hour=peak_start)
+        if time.hour >= peak_end:
+            return name, "Off peak", day.replace(hour=peak_end)
+        yesterday = day - timedelta(days=1)
+        if season_of(yesterday)[0] != name:
+            return name, "Off peak", day
+        return name, "Off peak", yesterday.replace(hour=peak_end)
+
+    time = datetime(2024, 1, 1, 0, 30, 0, tzinfo=tz)
+    while time.year == 2024:
+        freezer.move_to(time)
+        season, period, start = expected(time)
+        event = entity.event
+        assert event is not None, time
+        assert event.summary.startswith(period), time
+        assert f"Season: {season}" in event.description, time
+        assert event.start == start, time
+        time += timedelta(hours=1)
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_calendar_index_week_crossing_oracle(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_legacy: AsyncMock,
+    mock_site_info_week_crossing: AsyncMock,
+) -> None:
+    """Test the current period matches the week-crossing tariff every hour."""
+    tz = dt_util.get_default_time_zone()
+    freezer.move_to(datetime(2024, 1, 1, 0, 0, 0, tzinfo=tz))
+
+    await setup_platform(hass, [Platform.CALENDAR])
+    entity = hass.data[DATA_COMPONENT].get_entity(ENTITY_BUY)
+    assert entity
+
+    time = datetime(2024, 1, 1, 0, 30, 0, tzinfo=tz)
+    while time < datetime(2024, 3, 1, tzinfo=tz):
+        freezer.move_to(time)
+        event = entity.event
+        # The whole day from Friday to Monday is the WEEKEND period
+        assert (event is not None) == (time.weekday() in (4, 5, 6, 0)), time
+        time += timedelta(hours=1)
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_calendar_index_year_query(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_legacy: AsyncMock,
+    mock_site_info_multi_season: AsyncMock,
+) -> None:
+    """Test year long queries are answered from the index without expanding."""
+    tz = dt_util.get_default_time_zone()
+    freezer.move_to(datetime(2024, 1, 1, 10, 0, 0, tzinfo=tz))
+
+    await setup_platform(hass, [Platform.CALENDAR])
+
+    with patch(
+        "homeassistant.components.teslemetry.tariff._compile_intervals"
+    ) as mock_compile:
+        for _ in range(10):
+            result = await hass.services.async_call(
+                CALENDAR_DOMAIN,
+                SERVICE_GET_EVENTS,
+                {
+                    ATTR_ENTITY_ID: [ENTITY_BUY],
+                    EVENT_START_DATETIME: datetime(2024, 1, 1, tzinfo=tz),
+                    EVENT_END_DATETIME: datetime(2025, 1, 1, tzinfo=tz),
+                },
+                blocking=True,
+                return_response=True,
+            )
+    mock_compile.assert_not_called()
+
+    events = result[ENTITY_BUY]["events"]
+    # Two periods on each day of the leap year, the overnight OFF_PEAK period
+    # that started on New Year's Eve, and the overnight OFF_PEAK periods split
+    # at the two season changes
+    assert len(events) == 366 * 2 + 1 + 2
+    starts = [dt_util.parse_datetime(event["start"]) for event in events]
+    assert starts == sorted(starts)
+    assert starts[0] == datetime(2023, 12, 31, 20, 0, 0, tzinfo=tz)
@@ -1,5 +1,6 @@
 """Test the Teslemetry climate platform."""
 
+from collections import Counter
 from copy import deepcopy
 from unittest.mock import AsyncMock, patch
 
@@ -24,6 +25,7 @@ from homeassistant.const import ATTR_ENTITY_ID, STATE_UNKNOWN, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
 
 from . import assert_entities, reload_platform, setup_platform
 from .const import (
@@ -370,3 +372,40 @@ async def test_select_streaming(
         "climate.test_cabin_overheat_protection",
     ):
         assert hass.states.get(entity_id) == snapshot(name=entity_id)
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_climate_streaming_coalesces_writes(
+    hass: HomeAssistant,
+    mock_add_listener: AsyncMock,
+) -> None:
+    """Test a stream frame with several climate fields writes state once."""
+
+    await setup_platform(hass, [Platform.CLIMATE])
+
+    with patch.object(Entity, "async_write_ha_state", autospec=True) as mock_write:
+        mock_add_listener.send(
+            {
+                "vin": VEHICLE_DATA_ALT["response"]["vin"],
+                "data": {
+                    Signal.INSIDE_TEMP: 26,
+                    Signal.HVAC_POWER: "HvacPowerStateOn",
+                    Signal.CLIMATE_KEEPER_MODE: "ClimateKeeperModeOn",
+                    Signal.HVAC_LEFT_TEMPERATURE_REQUEST: 22,
+                    Signal.CABIN_OVERHEAT_PROTECTION_MODE: (
+                        "CabinOverheatProtectionModeStateOn"
+                    ),
+                    Signal.CABIN_OVERHEAT_PROTECTION_TEMPERATURE_LIMIT: 35,
+                },
+                "createdAt": "2024-10-04T10:45:17.537Z",
+            }
+        )
+        # Nothing is written until the coalesced flush
+        assert mock_write.call_count == 0
+        await hass.async_block_till_done()
+
+    writes = Counter(call.args[0].entity_id for call in mock_write.call_args_list)
+    assert writes == {
+        "climate.test_climate": 1,
+        "climate.test_cabin_overheat_protection": 1,
+    }
@@ -1,10 +1,13 @@
 """Test the Teslemetry init."""
 
+import asyncio
 from copy import deepcopy
+from datetime import UTC, datetime, timedelta
 import time
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from aiohttp import ClientResponseError
+from aiohttp import ClientError, ClientResponseError
 from freezegun.api import FrozenDateTimeFactory
 import pytest
 from syrupy.assertion import SnapshotAssertion
@@ -19,30 +22,56 @@ from tesla_fleet_api.exceptions import (
     TeslaFleetError,
 )
 
-from homeassistant.components.teslemetry import _get_access_token
-from homeassistant.components.teslemetry.const import CLIENT_ID, DOMAIN
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.components.teslemetry import ENERGY_SITE_SETUP_CONCURRENCY
+from homeassistant.components.teslemetry.const import CLIENT_ID, DOMAIN, TeslemetryState
 
 # Coordinator constants
 from homeassistant.components.teslemetry.coordinator import (
     ENERGY_HISTORY_INTERVAL,
     ENERGY_INFO_INTERVAL,
     ENERGY_LIVE_INTERVAL,
+    FRESHNESS_WINDOW,
     INSUFFICIENT_CREDITS_RETRY_AFTER,
     METADATA_INTERVAL,
+    STATISTICS_BACKFILL,
+    STATISTICS_CHUNK,
+    VEHICLE_ACTIVE_INTERVAL,
+    VEHICLE_FAILOVER_INTERVAL,
     VEHICLE_INTERVAL,
+    VEHICLE_WAIT,
 )
+from homeassistant.components.teslemetry.failover import STREAM_DOWN
+from homeassistant.components.teslemetry.governor import MAX_STRETCH
 from homeassistant.components.teslemetry.logship import CONF_SHIP_LOGS_TO_CLICKSTACK
 from homeassistant.components.teslemetry.models import TeslemetryData
-from homeassistant.components.teslemetry.oauth import TeslemetryImplementation
-from homeassistant.config_entries import ConfigEntryState
+from homeassistant.components.teslemetry.oauth import (
+    TOKEN_REFRESH_BEFORE,
+    TOKEN_REFRESH_RETRY,
+    TeslemetryAccessToken,
+    TeslemetryImplementation,
+)
+from homeassistant.components.teslemetry.services import (
+    ATTR_TOU_SETTINGS,
+    SERVICE_TIME_OF_USE,
+)
+from homeassistant.components.teslemetry.stream import (
+    CONF_STREAM_INTERVAL,
+    FIELD_RECONCILE_DELAY,
+    STREAMING_SLOW_INTERVAL,
+)
+from homeassistant.components.teslemetry.tariff import TARIFF_BUY
+from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntryState
 from homeassistant.const import (
+    CONF_DEVICE_ID,
     STATE_OFF,
     STATE_ON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     Platform,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryNotReady,
@@ -55,11 +84,13 @@ from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from . import mock_config_entry, setup_platform
 from .const import (
+    COMMAND_OK,
     CONFIG_V1,
     ENERGY_HISTORY,
     LIVE_STATUS,
     METADATA,
     METADATA_NOSCOPE,
+    PRODUCTS,
     PRODUCTS_MODERN,
     SITE_INFO,
     UNIQUE_ID,
@@ -69,6 +100,7 @@ from .const import (
 )
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.components.recorder.common import async_wait_recording_done
 
 ERRORS = [
     (InvalidToken, ConfigEntryState.SETUP_ERROR),
@@ -77,9 +109,17 @@ ERRORS = [
     (TeslaFleetError, ConfigEntryState.SETUP_RETRY),
 ]
 
-VEHICLE_ERRORS = [
-    *ERRORS,
-    (InsufficientCredits, ConfigEntryState.SETUP_RETRY),
+# Errors of a first refresh after setup, and whether they start a reauth
+REFRESH_ERRORS = [
+    (InvalidToken, True),
+    (LoginRequired, True),
+    (SubscriptionRequired, True),
+    (TeslaFleetError, False),
+]
+
+VEHICLE_REFRESH_ERRORS = [
+    *REFRESH_ERRORS,
+    (InsufficientCredits, False),
 ]
 
 
@@ -121,18 +161,20 @@ async def test_devices(
         assert device == snapshot(name=f"{device.identifiers}")
 
 
-@pytest.mark.parametrize(("side_effect", "state"), VEHICLE_ERRORS)
+@pytest.mark.parametrize(("side_effect", "reauth"), VEHICLE_REFRESH_ERRORS)
 async def test_vehicle_refresh_error(
     hass: HomeAssistant,
     mock_vehicle_data: AsyncMock,
     side_effect: TeslaFleetError,
-    state: ConfigEntryState,
+    reauth: bool,
     mock_legacy: AsyncMock,
 ) -> None:
-    """Test coordinator refresh with an error."""
+    """Test a vehicle whose first refresh fails is not added."""
     mock_vehicle_data.side_effect = side_effect
     entry = await setup_platform(hass)
-    assert entry.state is state
+    assert entry.state is ConfigEntryState.LOADED
+    assert not entry.runtime_data.vehicles
+    assert bool(entry.async_get_active_flows(hass, {SOURCE_REAUTH})) is reauth
 
 
 # Test Energy Live Coordinator
@@ -150,17 +192,56 @@ async def test_energy_live_refresh_error(
 
 
 # Test Energy Site Coordinator
-@pytest.mark.parametrize(("side_effect", "state"), ERRORS)
+@pytest.mark.parametrize(("side_effect", "reauth"), REFRESH_ERRORS)
 async def test_energy_site_refresh_error(
     hass: HomeAssistant,
     mock_site_info: AsyncMock,
     side_effect: TeslaFleetError,
-    state: ConfigEntryState,
+    reauth: bool,
 ) -> None:
-    """Test coordinator refresh with an error."""
+    """Test an energy site whose first refresh fails is not added."""
     mock_site_info.side_effect = side_effect
     entry = await setup_platform(hass)
-    assert entry.state is state
+    assert entry.state is ConfigEntryState.LOADED
+    assert not entry.runtime_data.energysites
+    assert bool(entry.async_get_active_flows(hass, {SOURCE_REAUTH})) is reauth
+
+
+async def test_products_added_after_first_refresh(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_vehicle_data: AsyncMock,
+    mock_site_info: AsyncMock,
+    mock_legacy: AsyncMock,
+) -> None:
+    """Test platforms are forwarded before each product's first refresh."""
+    answer = asyncio.Event()
+
+    async def vehicle_data(**kwargs: Any) -> dict[str, Any]:
+        await answer.wait()
+        return VEHICLE_DATA
+
+    mock_vehicle_data.side_effect = vehicle_data
+    mock_site_info.side_effect = TeslaFleetError
+    entry = mock_config_entry()
+    entry.add_to_hass(hass)
+    with patch("homeassistant.components.teslemetry.PLATFORMS", [Platform.SENSOR]):
+        await hass.config_entries.async_setup(entry.entry_id)
+        assert entry.state is ConfigEntryState.LOADED
+        assert hass.states.get("sensor.test_battery_level") is None
+
+        # The vehicle is added once its own refresh is done
+        answer.set()
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.test_battery_level").state == "77"
+        assert hass.states.get("sensor.energy_site_vpp_backup_reserve") is None
+
+        # The energy site is added once its refresh is retried and succeeds
+        mock_site_info.side_effect = lambda: deepcopy(SITE_INFO)
+        freezer.tick(ENERGY_INFO_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.energy_site_vpp_backup_reserve").state == "0"
 
 
 @pytest.mark.usefixtures("entity_registry_enabled_by_default")
@@ -568,8 +649,8 @@ async def test_site_info_retry_exceptions(
     """Test UpdateFailed with retry_after for site info coordinator."""
     mock_site_info.side_effect = exception
     entry = await setup_platform(hass)
-    # Retry exceptions during first refresh cause setup retry
-    assert entry.state is ConfigEntryState.SETUP_RETRY
+    # The site waits for a later refresh rather than failing setup
+    assert entry.state is ConfigEntryState.LOADED
     # API should only be called once (no manual retries)
     assert mock_site_info.call_count == 1
 
@@ -585,8 +666,8 @@ async def test_vehicle_data_retry_exceptions(
     """Test UpdateFailed with retry_after for vehicle data coordinator."""
     mock_vehicle_data.side_effect = exception
     entry = await setup_platform(hass)
-    # Retry exceptions during first refresh cause setup retry
-    assert entry.state is ConfigEntryState.SETUP_RETRY
+    # The vehicle waits for a later refresh rather than failing setup
+    assert entry.state is ConfigEntryState.LOADED
     # API should only be called once (no manual retries)
     assert mock_vehicle_data.call_count == 1
 
@@ -664,6 +745,136 @@ async def test_energy_history_coordinator_retry_exceptions(
     assert entry.state is ConfigEntryState.LOADED
 
 
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_energy_history_running_totals(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_energy_history: AsyncMock,
+) -> None:
+    """Test energy history only adds new and changed buckets to the totals."""
+
+    await setup_platform(hass, [Platform.SENSOR])
+    entity_id = "sensor.energy_site_battery_exported"
+
+    freezer.tick(ENERGY_HISTORY_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "0.036"
+
+    # The latest bucket is still being filled
+    history = deepcopy(ENERGY_HISTORY)
+    history["response"]["time_series"][-1]["battery_energy_exported"] = 100
+    mock_energy_history.return_value = history
+    freezer.tick(ENERGY_HISTORY_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "0.136"
+
+    # A new bucket starts
+    history = deepcopy(history)
+    history["response"]["time_series"].append(
+        {"timestamp": "2024-09-18T09:00:00+10:00", "battery_energy_exported": 50}
+    )
+    mock_energy_history.return_value = history
+    freezer.tick(ENERGY_HISTORY_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "0.186"
+
+    # A new day starts the totals again
+    mock_energy_history.return_value = {
+        "response": {
+            "time_series": [
+                {"timestamp": "2024-09-19T00:00:00+10:00", "battery_energy_exported": 5}
+            ]
+        }
+    }
+    freezer.tick(ENERGY_HISTORY_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "0.005"
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_energy_history_running_totals_dst_fold(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_energy_history: AsyncMock,
+) -> None:
+    """Test a bucket repeating a local time in the DST fold is added."""
+
+    series = [
+        {"timestamp": "2024-04-07T00:00:00+11:00", "battery_energy_exported": 10},
+        {"timestamp": "2024-04-07T02:00:00+11:00", "battery_energy_exported": 20},
+    ]
+    mock_energy_history.return_value = {"response": {"time_series": series}}
+    await setup_platform(hass, [Platform.SENSOR])
+    entity_id = "sensor.energy_site_battery_exported"
+
+    freezer.tick(ENERGY_HISTORY_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "0.03"
+
+    # The clocks go back, so the next bucket sorts before the last as a string
+    series = [
+        *series,
+        {"timestamp": "2024-04-07T02:00:00+10:00", "battery_energy_exported": 5},
+    ]
+    mock_energy_history.return_value = {"response": {"time_series": series}}
+    freezer.tick(ENERGY_HISTORY_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "0.035"
+
+
+async def test_energy_history_statistics(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_energy_history: AsyncMock,
+) -> None:
+    """Test energy history is backfilled and imported into statistics."""
+
+    await setup_platform(hass, [Platform.SENSOR])
+
+    # One chunk of the past is backfilled per update, oldest first
+    chunks = STATISTICS_BACKFILL // STATISTICS_CHUNK
+    for _ in range(chunks):
+        freezer.tick(ENERGY_HISTORY_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    backfill = [
+        call.kwargs["start_date"]
+        for call in mock_energy_history.call_args_list
+        if "start_date" in call.kwargs
+    ]
+    assert len(backfill) == chunks
+    assert backfill[0] == "2024-09-10T14:00:00+00:00"
+
+    # The completed hours of the current day are imported once caught up
+    freezer.tick(ENERGY_HISTORY_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    statistic_id = f"{DOMAIN}:123456_battery_energy_exported"
+    statistics = await hass.async_add_executor_job(
+        statistics_during_period,
+        hass,
+        datetime(2024, 9, 10, tzinfo=UTC),
+        None,
+        {statistic_id},
+        "hour",
+        None,
+        {"state", "sum"},
+    )
+    assert [(row["state"], row["sum"]) for row in statistics[statistic_id]] == [
+        (36, 36)
+    ]
+
+
 async def test_live_status_auth_error(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
@@ -944,6 +1155,155 @@ async def test_energy_site_version_update(
     assert device.sw_version == "24.1.0 abc123"
 
 
+async def test_energy_site_info_tiers(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    mock_site_info: AsyncMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test each section of site info is only merged again when it changes."""
+    entry = await setup_platform(hass)
+    coordinator = entry.runtime_data.energysites[0].info_coordinator
+    assert coordinator.data["tariff_content_v2_name"] == "Battery Maximiser"
+
+    updated_site_info = deepcopy(SITE_INFO)
+    updated_site_info["response"]["backup_reserve_percent"] = 50
+    updated_site_info["response"]["tariff_content_v2"]["name"] = "Updated"
+    mock_site_info.side_effect = lambda: updated_site_info
+
+    freezer.tick(ENERGY_INFO_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.data["backup_reserve_percent"] == 50
+    assert coordinator.data["tariff_content_v2_name"] == "Updated"
+    assert coordinator.changed_keys == {
+        "backup_reserve_percent",
+        "tariff_content_v2_name",
+    }
+
+    # An unchanged payload is not flattened or dispatched again
+    index = coordinator.tariff_index(TARIFF_BUY)
+    freezer.tick(ENERGY_INFO_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.changed_keys == set()
+    assert coordinator.tariff_index(TARIFF_BUY) is index
+
+    # Only the changed tier is merged again
+    updated_site_info = deepcopy(updated_site_info)
+    updated_site_info["response"]["tariff_content_v2"]["name"] = "Tariff"
+    freezer.tick(ENERGY_INFO_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.data["tariff_content_v2_name"] == "Tariff"
+    assert coordinator.changed_keys == {"tariff_content_v2_name"}
+    # A tariff change compiles the tariff index again
+    assert coordinator.tariff_index(TARIFF_BUY) is not index
+
+    # Setting the time of use settings refreshes the tariff
+    updated_site_info = deepcopy(updated_site_info)
+    updated_site_info["response"]["tariff_content_v2"]["name"] = "Changed"
+    device = device_registry.async_get_device(identifiers={(DOMAIN, "123456")})
+    assert device is not None
+    with patch(
+        "tesla_fleet_api.teslemetry.EnergySite.time_of_use_settings",
+        return_value=COMMAND_OK,
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_TIME_OF_USE,
+            {CONF_DEVICE_ID: device.id, ATTR_TOU_SETTINGS: {"utility": "test"}},
+            blocking=True,
+        )
+    freezer.tick(ENERGY_INFO_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.data["tariff_content_v2_name"] == "Changed"
+
+
+async def test_warm_start_from_cache(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_products: AsyncMock,
+    mock_site_info: AsyncMock,
+    mock_live_status: AsyncMock,
+) -> None:
+    """Test a setup while Home Assistant starts uses the cached setup data."""
+    entry = await setup_platform(hass, [Platform.SENSOR])
+    assert entry.state is ConfigEntryState.LOADED
+
+    cache = hass_storage[f"{DOMAIN}.{entry.entry_id}.setup"]["data"]
+    assert cache["metadata"] == METADATA
+    assert cache["energy_sites"]["123456"]["site_info"] == SITE_INFO["response"]
+    assert all("tokens" not in product for product in cache["products"])
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    # The API is down while Home Assistant starts
+    hass.set_state(CoreState.starting)
+    mock_products.reset_mock()
+    mock_products.side_effect = TeslaFleetError
+    mock_site_info.reset_mock()
+    mock_live_status.reset_mock()
+    with patch("homeassistant.components.teslemetry.PLATFORMS", [Platform.SENSOR]):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert hass.states.get("sensor.energy_site_vpp_backup_reserve").state == "0"
+    # The cached sources were fetched again in the background
+    mock_products.assert_called_once()
+    mock_site_info.assert_called_once()
+    mock_live_status.assert_called_once()
+
+
+async def test_warm_start_vehicle_from_cache(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_metadata: AsyncMock,
+    mock_vehicle_data: AsyncMock,
+) -> None:
+    """Test a warm start seeds polled vehicles from the cache."""
+    metadata = deepcopy(METADATA)
+    metadata["vehicles"]["LRW3F7EK4NC700000"]["polling"] = True
+    mock_metadata.return_value = metadata
+    entry = await setup_platform(hass, [Platform.SENSOR])
+    assert entry.state is ConfigEntryState.LOADED
+
+    cache = hass_storage[f"{DOMAIN}.{entry.entry_id}.setup"]["data"]
+    vehicle = cache["vehicles"]["LRW3F7EK4NC700000"]
+    assert vehicle["charge_state_battery_level"] == 77
+    assert "tokens" not in vehicle
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    # The vehicle data only answers once the setup has finished
+    answer = asyncio.Event()
+    data = deepcopy(VEHICLE_DATA)
+    data["response"]["charge_state"]["battery_level"] = 50
+
+    async def vehicle_data(**kwargs: Any) -> dict[str, Any]:
+        await answer.wait()
+        return data
+
+    hass.set_state(CoreState.starting)
+    mock_vehicle_data.side_effect = vehicle_data
+    with patch("homeassistant.components.teslemetry.PLATFORMS", [Platform.SENSOR]):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert entry.state is ConfigEntryState.LOADED
+        assert hass.states.get("sensor.test_battery_level").state == "77"
+
+        # The vehicle data is fetched again in the background
+        answer.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert hass.states.get("sensor.test_battery_level").state == "50"
+
+
 # Exception translation tests
 
 
@@ -957,6 +1317,51 @@ async def test_live_status_auth_failed_forbidden(
     assert entry.state is ConfigEntryState.SETUP_ERROR
 
 
+async def test_energy_site_live_status_fetched_concurrently(
+    hass: HomeAssistant,
+    mock_products: AsyncMock,
+    mock_metadata: AsyncMock,
+    mock_live_status: AsyncMock,
+) -> None:
+    """Test setup fetches energy site live status concurrently, bounded."""
+    products = deepcopy(PRODUCTS)
+    metadata = deepcopy(METADATA)
+    site = next(
+        product
+        for product in products["response"]
+        if product.get("energy_site_id") == 123456
+    )
+    for site_id in range(200001, 200005):
+        products["response"].append({**deepcopy(site), "energy_site_id": site_id})
+        metadata["energy_sites"][str(site_id)] = {"access": True, "name": "Site"}
+    mock_products.return_value = products
+    mock_metadata.return_value = metadata
+
+    # Each site answers after a different delay, the first ones slowest
+    delays = iter((0.05, 0.04, 0.03, 0.02, 0.01))
+    in_flight = 0
+    max_in_flight = 0
+
+    async def live_status() -> dict:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(next(delays))
+        in_flight -= 1
+        return deepcopy(LIVE_STATUS)
+
+    mock_live_status.side_effect = live_status
+
+    entry = await setup_platform(hass, [])
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert len(entry.runtime_data.energysites) == 5
+    assert mock_live_status.call_count == 5
+    # Sequential fetching never has more than one request in flight
+    assert max_in_flight > 1
+    assert max_in_flight == ENERGY_SITE_SETUP_CONCURRENCY
+
+
 @pytest.mark.parametrize(
     "side_effect",
     [[deepcopy(LIVE_STATUS), TeslaFleetError]],
@@ -1007,37 +1412,123 @@ async def test_energy_history_coordinator_refresh_errors(
     assert entry.state is ConfigEntryState.LOADED
 
 
-async def test_dynamic_device_discovery_triggers_reload(
+async def test_dynamic_device_discovery_adds_vehicle(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
+    device_registry: dr.DeviceRegistry,
 ) -> None:
-    """Test that metadata coordinator triggers reload when new vehicle is added."""
-    entry = await setup_platform(hass)
+    """Test a newly subscribed vehicle is added without a reload."""
+    entry = await setup_platform(hass, [Platform.SENSOR])
     assert entry.state is ConfigEntryState.LOADED
+    vehicle = entry.runtime_data.vehicles[0]
 
     # Update metadata to include a new vehicle with access
+    new_vin = "5YJ3E1EA1NF000001"
     new_metadata = deepcopy(METADATA)
-    new_metadata["vehicles"]["5YJ3E1EA1NF000001"] = {
+    new_metadata["vehicles"][new_vin] = {
         "proxy": True,
         "access": True,
         "polling": False,
         "firmware": "2026.0.0",
     }
+    new_products = deepcopy(PRODUCTS)
+    new_product = deepcopy(new_products["response"][0])
+    new_product.update(vin=new_vin, id=2, vehicle_id=2, display_name="Second")
+    new_products["response"].append(new_product)
 
     with (
         patch(
             "tesla_fleet_api.teslemetry.Teslemetry.metadata",
             return_value=new_metadata,
         ),
+        patch(
+            "tesla_fleet_api.teslemetry.Teslemetry.products",
+            return_value=new_products,
+        ),
         patch.object(hass.config_entries, "async_schedule_reload") as mock_reload,
     ):
         # Advance time to trigger metadata coordinator refresh
         freezer.tick(METADATA_INTERVAL)
         async_fire_time_changed(hass)
-        await hass.async_block_till_done()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    mock_reload.assert_not_called()
+    assert [v.vin for v in entry.runtime_data.vehicles] == [vehicle.vin, new_vin]
+    assert entry.runtime_data.vehicles[0] is vehicle
+    assert device_registry.async_get_device(identifiers={(DOMAIN, new_vin)})
+    assert hass.states.get("sensor.second_battery_level") is not None
+    assert hass.states.get("sensor.test_battery_level") is not None
 
-    # Verify reload was triggered due to new vehicle
-    mock_reload.assert_called_once_with(entry.entry_id)
+
+async def test_dynamic_device_discovery_removes_vehicle(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    device_registry: dr.DeviceRegistry,
+    mock_add_listener: AsyncMock,
+) -> None:
+    """Test a vehicle that lost its subscription is removed without a reload."""
+    entry = await setup_platform(hass, [Platform.SENSOR])
+    vin = entry.runtime_data.vehicles[0].vin
+    assert hass.states.get("sensor.test_battery_level") is not None
+    assert hass.states.get("sensor.energy_site_battery_power") is not None
+
+    new_metadata = deepcopy(METADATA)
+    new_metadata["vehicles"][vin]["access"] = False
+    with (
+        patch(
+            "tesla_fleet_api.teslemetry.Teslemetry.metadata",
+            return_value=new_metadata,
+        ),
+        patch.object(hass.config_entries, "async_schedule_reload") as mock_reload,
+    ):
+        freezer.tick(METADATA_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    mock_reload.assert_not_called()
+    assert entry.runtime_data.vehicles == []
+    assert device_registry.async_get_device(identifiers={(DOMAIN, vin)}) is None
+    assert hass.states.get("sensor.test_battery_level") is None
+    assert hass.states.get("sensor.energy_site_battery_power") is not None
+
+    # Frames of the removed vehicle are no longer handled
+    mock_add_listener.send(
+        {
+            "vin": vin,
+            "data": {"BatteryLevel": 42},
+            "createdAt": "2024-10-04T10:45:17.537Z",
+        }
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.test_battery_level") is None
+
+
+async def test_dynamic_device_discovery_keeps_products_on_fetch_error(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test products stay in place when the changed products cannot be fetched."""
+    entry = await setup_platform(hass, [Platform.SENSOR])
+    vin = entry.runtime_data.vehicles[0].vin
+
+    new_metadata = deepcopy(METADATA)
+    new_metadata["vehicles"][vin]["access"] = False
+    with (
+        patch(
+            "tesla_fleet_api.teslemetry.Teslemetry.metadata",
+            return_value=new_metadata,
+        ),
+        patch(
+            "tesla_fleet_api.teslemetry.Teslemetry.products",
+            side_effect=InvalidResponse,
+        ),
+    ):
+        freezer.tick(METADATA_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert [vehicle.vin for vehicle in entry.runtime_data.vehicles] == [vin]
+    assert hass.states.get("sensor.test_battery_level") is not None
 
 
 async def test_dynamic_device_discovery_no_reload_for_scope_only_change(
@@ -1119,14 +1610,101 @@ async def test_insufficient_credits_backs_off_polling(
     coordinator = entry.runtime_data.vehicles[0].coordinator
     assert isinstance(coordinator.last_exception, UpdateFailed)
     assert coordinator.last_exception.retry_after == INSUFFICIENT_CREDITS_RETRY_AFTER
+    assert entry.runtime_data.governor.exhausted
+
+
+async def test_insufficient_credits_expire_without_stream_event(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test exhausted credits are probed again once the retry delay passed."""
+    entry = await setup_platform(hass)
+    governor = entry.runtime_data.governor
+    coordinator = entry.runtime_data.metadata_coordinator
+    governor.async_set_exhausted()
+
+    with patch(
+        "tesla_fleet_api.teslemetry.Teslemetry.metadata",
+        return_value=deepcopy(METADATA),
+    ) as mock_metadata:
+        await coordinator.async_refresh()
+        mock_metadata.assert_not_called()
+        assert governor.async_refuse_command()
+
+        # Once the retry delay passed, the next request probes the credits
+        freezer.tick(timedelta(seconds=INSUFFICIENT_CREDITS_RETRY_AFTER))
+        assert not governor.exhausted
+        await coordinator.async_refresh()
+        mock_metadata.assert_called_once()
+
+    assert governor.decisions[-1]["action"] == "probe"
+    assert not governor.exhausted
+    assert not governor.async_refuse_command()
+
+
+async def test_vehicle_poll_only_updates_changed_entities(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_vehicle_data: AsyncMock,
+    mock_legacy: AsyncMock,
+) -> None:
+    """Test a poll only writes state for entities whose keys changed."""
+    entry = await setup_platform(hass, [Platform.SENSOR])
+    coordinator = entry.runtime_data.vehicles[0].coordinator
+    data = coordinator.data
+
+    # An identical payload changes nothing
+    freezer.tick(VEHICLE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.changed_keys == set()
+    assert coordinator.data is data
+
+    changed = deepcopy(VEHICLE_DATA)
+    changed["response"]["charge_state"]["battery_level"] = 12
+    mock_vehicle_data.return_value = changed
+    with patch(
+        "homeassistant.helpers.entity.Entity.async_write_ha_state"
+    ) as mock_write:
+        freezer.tick(VEHICLE_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    assert coordinator.changed_keys == {"charge_state_battery_level"}
+    assert coordinator.data["charge_state_battery_level"] == 12
+    assert mock_write.call_count == 1
+
+
+async def test_energy_live_poll_only_updates_changed_entities(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_live_status: AsyncMock,
+) -> None:
+    """Test the energy live coordinator dispatches only to changed keys."""
+    entry = await setup_platform(hass, [Platform.SENSOR])
+    coordinator = entry.runtime_data.energysites[0].live_coordinator
+    assert coordinator is not None
+
+    changed = deepcopy(LIVE_STATUS)
+    changed["response"]["solar_power"] = 2000
+    mock_live_status.side_effect = lambda: deepcopy(changed)
+    with patch(
+        "homeassistant.helpers.entity.Entity.async_write_ha_state"
+    ) as mock_write:
+        freezer.tick(ENERGY_LIVE_INTERVAL)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    assert coordinator.changed_keys == {"solar_power"}
+    assert mock_write.call_count == 1
 
 
 def _oauth_session(hass: HomeAssistant, entry: MockConfigEntry) -> OAuth2Session:
-    """Build an OAuth2Session for directly exercising _get_access_token."""
+    """Build an OAuth2Session for directly exercising the token refresh."""
     return OAuth2Session(hass, entry, TeslemetryImplementation(hass, DOMAIN, CLIENT_ID))
 
 
-async def test_get_access_token_dead_token_during_setup_triggers_auth_failed(
+async def test_access_token_refresh_dead_token_during_setup_triggers_auth_failed(
     hass: HomeAssistant,
 ) -> None:
     """A dead/revoked refresh token during setup must raise ConfigEntryAuthFailed.
@@ -1143,18 +1721,18 @@ async def test_get_access_token_dead_token_during_setup_triggers_auth_failed(
 
     with (
         patch.object(
-            OAuth2Session,
-            "async_ensure_token_valid",
+            TeslemetryImplementation,
+            "async_refresh_token",
             side_effect=OAuth2TokenRequestReauthError(
                 request_info=MagicMock(), status=400, domain=DOMAIN
             ),
         ),
         pytest.raises(ConfigEntryAuthFailed),
     ):
-        await _get_access_token(session)
+        await TeslemetryAccessToken(hass, session).async_refresh()
 
 
-async def test_get_access_token_rate_limited_during_setup_is_not_fatal(
+async def test_access_token_refresh_rate_limited_during_setup_is_not_fatal(
     hass: HomeAssistant,
 ) -> None:
     """A 429 from the token endpoint during setup should back off, not be fatal."""
@@ -1165,18 +1743,18 @@ async def test_get_access_token_rate_limited_during_setup_is_not_fatal(
 
     with (
         patch.object(
-            OAuth2Session,
-            "async_ensure_token_valid",
+            TeslemetryImplementation,
+            "async_refresh_token",
             side_effect=OAuth2TokenRequestTransientError(
                 request_info=MagicMock(), status=429, domain=DOMAIN
             ),
         ),
         pytest.raises(ConfigEntryNotReady),
     ):
-        await _get_access_token(session)
+        await TeslemetryAccessToken(hass, session).async_refresh()
 
 
-async def test_get_access_token_dead_token_after_setup_starts_reauth(
+async def test_access_token_refresh_dead_token_after_setup_starts_reauth(
     hass: HomeAssistant,
 ) -> None:
     """Test a token dying after setup (re)starts reauth without tearing down.
@@ -1190,15 +1768,15 @@ async def test_get_access_token_dead_token_after_setup_starts_reauth(
 
     with (
         patch.object(
-            OAuth2Session,
-            "async_ensure_token_valid",
+            TeslemetryImplementation,
+            "async_refresh_token",
             side_effect=OAuth2TokenRequestReauthError(
                 request_info=MagicMock(), status=400, domain=DOMAIN
             ),
         ),
         pytest.raises(OAuth2TokenRequestReauthError),
     ):
-        await _get_access_token(session)
+        await TeslemetryAccessToken(hass, session).async_refresh()
     await hass.async_block_till_done()
 
     flows = hass.config_entries.flow.async_progress()
@@ -1208,7 +1786,7 @@ async def test_get_access_token_dead_token_after_setup_starts_reauth(
     )
 
 
-async def test_get_access_token_rate_limited_after_setup_is_not_fatal(
+async def test_access_token_refresh_rate_limited_after_setup_is_not_fatal(
     hass: HomeAssistant,
 ) -> None:
     """A transient token-refresh error after setup must not force reauth."""
@@ -1219,20 +1797,64 @@ async def test_get_access_token_rate_limited_after_setup_is_not_fatal(
 
     with (
         patch.object(
-            OAuth2Session,
-            "async_ensure_token_valid",
+            TeslemetryImplementation,
+            "async_refresh_token",
             side_effect=OAuth2TokenRequestTransientError(
                 request_info=MagicMock(), status=429, domain=DOMAIN
             ),
         ),
         pytest.raises(OAuth2TokenRequestTransientError),
     ):
-        await _get_access_token(session)
+        await TeslemetryAccessToken(hass, session).async_refresh()
     await hass.async_block_till_done()
 
     assert not hass.config_entries.flow.async_progress()
 
 
+async def test_access_token_cached_with_shared_refresh(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the access token is cached and refreshed once for every caller."""
+    mock_entry = mock_config_entry()
+    mock_entry.add_to_hass(hass)
+    access_token = TeslemetryAccessToken(hass, _oauth_session(hass, mock_entry))
+    unsub = access_token.async_start()
+
+    with patch.object(
+        TeslemetryImplementation,
+        "async_refresh_token",
+        return_value={"access_token": "refreshed", "expires_at": time.time() + 3600},
+    ) as refresh:
+        assert await access_token() == mock_entry.data["token"]["access_token"]
+        refresh.assert_not_called()
+
+        # A rejected token is refreshed once, however many callers are waiting
+        access_token.async_invalidate()
+        assert not access_token.valid
+        assert (
+            await asyncio.gather(access_token(), access_token(), access_token())
+            == ["refreshed"] * 3
+        )
+        assert refresh.await_count == 1
+        assert mock_entry.data["token"]["access_token"] == "refreshed"
+
+        # The token is refreshed in the background shortly before it expires
+        refresh.side_effect = TimeoutError
+        freezer.tick(timedelta(seconds=3600 - TOKEN_REFRESH_BEFORE))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert refresh.await_count == 2
+
+        # A refresh that times out is retried
+        refresh.side_effect = None
+        freezer.tick(timedelta(seconds=TOKEN_REFRESH_RETRY))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert refresh.await_count == 3
+
+    unsub()
+
+
 async def test_unrelated_entry_update_does_not_reload(hass: HomeAssistant) -> None:
     """An entry update that leaves the shipping option unchanged does not reload."""
     entry = await setup_platform(hass, [])
@@ -1262,3 +1884,504 @@ async def test_shipping_option_change_reloads(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
 
     mock_reload.assert_called_once_with(entry.entry_id)
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_vehicle_stream_dispatcher(
+    hass: HomeAssistant,
+    mock_add_listener: AsyncMock,
+    mock_stream_update_config: AsyncMock,
+) -> None:
+    """Test streaming entities share one listener and one field update per vehicle."""
+    entry = await setup_platform(hass, [Platform.SENSOR, Platform.COVER])
+    vehicle = entry.runtime_data.vehicles[0]
+
+    filters = [filters for _, filters in mock_add_listener.listeners]
+    assert filters.count({"vin": vehicle.vin, "data": None}) == 1
+    assert not [f for f in filters if f is not None and isinstance(f.get("data"), dict)]
+
+    field_updates = [
+        call.args[0]["fields"]
+        for call in mock_stream_update_config.call_args_list
+        if "fields" in call.args[0]
+    ]
+    assert len(field_updates) == 1
+    assert field_updates[0]["BatteryLevel"] is None
+    assert field_updates[0]["FdWindow"] is None
+    # Slow fields are configured from their descriptions
+    assert field_updates[0]["Odometer"] == {
+        "interval_seconds": 60,
+        "minimum_delta": 0.1,
+    }
+    assert field_updates[0]["LifetimeEnergyUsed"] == {
+        "interval_seconds": STREAMING_SLOW_INTERVAL,
+        "minimum_delta": 0.1,
+    }
+
+    # Every frame is routed to the entities of the fields it contains
+    mock_add_listener.send(
+        {
+            "vin": vehicle.vin,
+            "data": {"BatteryLevel": 42, "FdWindow": "WindowStateClosed"},
+            "createdAt": "2024-10-04T10:45:17.537Z",
+        }
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.test_battery_level").state == "42"
+
+
+async def test_slow_stream_config_does_not_hold_up_setup(
+    hass: HomeAssistant,
+    mock_stream_get_config: AsyncMock,
+    mock_stream_update_config: AsyncMock,
+) -> None:
+    """Test entities are created while a stream config is still loading."""
+    loaded = asyncio.Event()
+
+    async def _get_config() -> None:
+        await loaded.wait()
+
+    mock_stream_get_config.side_effect = _get_config
+    entry = mock_config_entry()
+    entry.add_to_hass(hass)
+    with patch("homeassistant.components.teslemetry.PLATFORMS", [Platform.SENSOR]):
+        await hass.config_entries.async_setup(entry.entry_id)
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert hass.states.get("sensor.test_battery_level") is not None
+    assert not [
+        call
+        for call in mock_stream_update_config.call_args_list
+        if "fields" in call.args[0]
+    ]
+
+    # The queued fields are enabled together once the config has loaded
+    loaded.set()
+    await hass.async_block_till_done()
+    field_updates = [
+        call.args[0]["fields"]
+        for call in mock_stream_update_config.call_args_list
+        if "fields" in call.args[0]
+    ]
+    assert len(field_updates) == 1
+    assert "BatteryLevel" in field_updates[0]
+
+
+async def test_vehicle_stream_failover(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_products: AsyncMock,
+    mock_vehicle_data: AsyncMock,
+    mock_add_listener: AsyncMock,
+) -> None:
+    """Test a disconnected stream falls back to polling until frames resume."""
+    mock_products.return_value = PRODUCTS_MODERN
+    entry = await setup_platform(hass, [Platform.SENSOR])
+    vehicle = entry.runtime_data.vehicles[0]
+    stream = entry.runtime_data.stream
+    coordinator = vehicle.coordinator
+    assert coordinator.update_interval is None
+
+    mock_add_listener.send(
+        {
+            "vin": vehicle.vin,
+            "state": "online",
+            "createdAt": "2024-10-04T10:45:17.537Z",
+        }
+    )
+    await hass.async_block_till_done()
+
+    # An online vehicle that is idle sends no frames, which is not a failure
+    freezer.tick(STREAM_DOWN)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    mock_vehicle_data.assert_not_called()
+    assert not vehicle.failover.active
+
+    # A stream that stays disconnected is replaced by polling
+    stream._update_connection_listeners(False)
+    freezer.tick(STREAM_DOWN)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    mock_vehicle_data.assert_called_once()
+    assert vehicle.failover.active
+    assert coordinator.update_interval == VEHICLE_FAILOVER_INTERVAL
+
+    # The next frame stops the polling again
+    mock_add_listener.send(
+        {
+            "vin": vehicle.vin,
+            "state": "asleep",
+            "createdAt": "2024-10-04T10:50:17.537Z",
+        }
+    )
+    await hass.async_block_till_done()
+    assert not vehicle.failover.active
+    assert coordinator.update_interval is None
+
+    mock_vehicle_data.reset_mock()
+    freezer.tick(VEHICLE_FAILOVER_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    mock_vehicle_data.assert_not_called()
+
+    diagnostics = vehicle.failover.async_diagnostics()
+    assert [
+        (transition["polling"], transition["reason"])
+        for transition in diagnostics["transitions"]
+    ] == [(True, "stream disconnected"), (False, "frames resumed")]
+
+
+async def test_vehicle_poll_interval_follows_state(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_vehicle_data: AsyncMock,
+    mock_add_listener: AsyncMock,
+    mock_legacy: AsyncMock,
+) -> None:
+    """Test the vehicle poll interval adapts to driving, parking and sleep."""
+    entry = await setup_platform(hass, [Platform.SENSOR])
+    coordinator = entry.runtime_data.vehicles[0].coordinator
+    vin = coordinator.vin
+    assert coordinator.update_interval == VEHICLE_INTERVAL
+
+    # Driving polls at the active interval
+    driving = deepcopy(VEHICLE_DATA)
+    driving["response"]["drive_state"]["shift_state"] = "D"
+    mock_vehicle_data.return_value = driving
+    freezer.tick(VEHICLE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.update_interval == VEHICLE_ACTIVE_INTERVAL
+
+    mock_vehicle_data.reset_mock()
+    freezer.tick(VEHICLE_ACTIVE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    mock_vehicle_data.assert_called_once()
+
+    # Asleep waits for the stream to report the vehicle online
+    mock_add_listener.send(
+        {"vin": vin, "state": "asleep", "createdAt": "2024-10-04T10:45:17.537Z"}
+    )
+    await hass.async_block_till_done()
+    assert coordinator.update_interval == VEHICLE_WAIT
+
+    mock_vehicle_data.reset_mock()
+    freezer.tick(VEHICLE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    mock_vehicle_data.assert_not_called()
+
+    # A disconnected stream no longer reports the state, so it is probed again
+    stream = entry.runtime_data.stream
+    stream._update_connection_listeners(False)
+    assert not coordinator.stream_state
+    assert coordinator.update_interval == VEHICLE_INTERVAL
+    stream._update_connection_listeners(True)
+
+    mock_vehicle_data.return_value = VEHICLE_DATA
+    mock_add_listener.send(
+        {"vin": vin, "state": "online", "createdAt": "2024-10-04T10:46:17.537Z"}
+    )
+    await hass.async_block_till_done()
+    freezer.tick(VEHICLE_ACTIVE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    mock_vehicle_data.assert_called_once()
+
+    # Parked polls at the default interval
+    assert coordinator.update_interval == VEHICLE_INTERVAL
+
+
+async def test_vehicle_poll_skipped_while_asleep(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_vehicle: AsyncMock,
+    mock_vehicle_data: AsyncMock,
+    mock_add_listener: AsyncMock,
+    mock_legacy: AsyncMock,
+) -> None:
+    """Test vehicle data is only polled while the vehicle is online."""
+    entry = await setup_platform(hass, [Platform.SENSOR])
+    coordinator = entry.runtime_data.vehicles[0].coordinator
+    billed = coordinator.polls_billed
+    assert billed
+
+    # The free probe finds the vehicle asleep, so the billed poll is skipped
+    mock_vehicle.return_value = {
+        "response": {"state": TeslemetryState.ASLEEP},
+        "error": None,
+    }
+    mock_vehicle_data.reset_mock()
+    freezer.tick(VEHICLE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    mock_vehicle_data.assert_not_called()
+    assert coordinator.data["state"] == TeslemetryState.ASLEEP
+    # Without the stream state the vehicle keeps being probed
+    assert coordinator.update_interval == VEHICLE_INTERVAL
+    assert coordinator.async_diagnostics() == {"billed": billed, "skipped": 1}
+
+    # The state from the stream is used instead of the probe
+    mock_add_listener.send(
+        {
+            "vin": coordinator.vin,
+            "state": "online",
+            "createdAt": "2024-10-04T10:45:17.537Z",
+        }
+    )
+    await hass.async_block_till_done()
+    mock_vehicle.reset_mock()
+    freezer.tick(VEHICLE_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    mock_vehicle.assert_not_called()
+    mock_vehicle_data.assert_called_once()
+    assert coordinator.async_diagnostics() == {"billed": billed + 1, "skipped": 1}
+
+
+async def test_credit_governor_throttles_polling(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_add_listener: AsyncMock,
+    mock_energy_history: AsyncMock,
+    mock_legacy: AsyncMock,
+) -> None:
+    """Test spending faster than the credits allow stretches and defers polling."""
+    freezer.move_to("2024-01-01 00:00:00+00:00")
+    entry = await setup_platform(hass)
+    governor = entry.runtime_data.governor
+    vehicle_coordinator = entry.runtime_data.vehicles[0].coordinator
+    assert governor.pressure == 0
+
+    mock_add_listener.send(
+        {
+            "credits": {
+                "type": "command",
+                "cost": 50,
+                "balance": 100,
+                "quota": {
+                    "used": 1000,
+                    "fraction": 1.0,
+                    "reset_at": "2024-01-31T00:00:00.000Z",
+                },
+            },
+            "createdAt": "2024-01-01T00:00:00.000Z",
+        }
+    )
+    await hass.async_block_till_done()
+    assert governor.pressure > 1
+
+    # Non-essential refreshes are skipped
+    mock_energy_history.reset_mock()
+    freezer.tick(ENERGY_HISTORY_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    mock_energy_history.assert_not_called()
+
+    # Vehicle polling is stretched
+    assert vehicle_coordinator.update_interval == VEHICLE_INTERVAL * MAX_STRETCH
+
+    decisions = governor.async_diagnostics()["decisions"]
+    assert {decision["action"] for decision in decisions} == {"defer", "stretch"}
+
+
+async def test_credit_governor_energy_only_account(
+    hass: HomeAssistant,
+    mock_products: AsyncMock,
+    mock_add_listener: AsyncMock,
+) -> None:
+    """Test an account without vehicles still feeds the governor from the stream."""
+    products = deepcopy(PRODUCTS)
+    products["response"] = [
+        product for product in products["response"] if "vin" not in product
+    ]
+    mock_products.return_value = products
+    entry = await setup_platform(hass, [])
+    assert entry.runtime_data.stream is None
+
+    mock_add_listener.send(
+        {
+            "credits": {"type": "command", "cost": 10, "balance": 100},
+            "createdAt": "2024-01-01T00:00:00.000Z",
+        }
+    )
+    await hass.async_block_till_done()
+    assert entry.runtime_data.governor.balance == 100
+
+
+async def test_concurrent_refreshes_share_fetch(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_vehicle_data: AsyncMock,
+    mock_legacy: AsyncMock,
+) -> None:
+    """Test concurrent and back to back refreshes share a single fetch."""
+    entry = await setup_platform(hass, [Platform.SENSOR])
+    coordinator = entry.runtime_data.vehicles[0].coordinator
+    freezer.tick(FRESHNESS_WINDOW)
+
+    release = asyncio.Event()
+
+    async def vehicle_data(*args, **kwargs):
+        await release.wait()
+        return VEHICLE_DATA
+
+    mock_vehicle_data.reset_mock()
+    mock_vehicle_data.side_effect = vehicle_data
+    refreshes = asyncio.gather(*(coordinator.async_refresh() for _ in range(5)))
+    await asyncio.sleep(0)
+    release.set()
+    await refreshes
+    mock_vehicle_data.assert_called_once()
+    assert coordinator.last_update_success
+
+    # A refresh inside the freshness window reuses the result
+    await coordinator.async_refresh()
+    mock_vehicle_data.assert_called_once()
+
+    freezer.tick(FRESHNESS_WINDOW)
+    await coordinator.async_refresh()
+    assert mock_vehicle_data.call_count == 2
+
+
+async def test_disabled_entity_fields_removed(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    entity_registry: er.EntityRegistry,
+    mock_stream_get_config: AsyncMock,
+    mock_stream_update_config: AsyncMock,
+) -> None:
+    """Test fields only used by a disabled entity are removed from the config."""
+    entry = await setup_platform(hass, [Platform.SENSOR])
+    stream_vehicle = entry.runtime_data.vehicles[0].stream_vehicle
+    fields = {
+        field: {"interval_seconds": None}
+        for call in mock_stream_update_config.call_args_list
+        for field in call.args[0].get("fields", {})
+    }
+    assert "BatteryLevel" in fields
+    stream_vehicle.fields = {**fields, "LocatedAtHome": {"interval_seconds": 60}}
+
+    async def get_config() -> None:
+        # Another client enabled a field since setup
+        stream_vehicle.fields = {
+            **stream_vehicle.fields,
+            "Odometer": {"interval_seconds": 60},
+        }
+
+    mock_stream_get_config.side_effect = get_config
+
+    with patch(
+        "teslemetry_stream.TeslemetryStreamVehicle.post_config",
+        return_value={"response": None},
+    ) as mock_post_config:
+        entity_registry.async_update_entity(
+            "sensor.test_battery_level",
+            disabled_by=er.RegistryEntryDisabler.USER,
+        )
+        await hass.async_block_till_done()
+        mock_post_config.assert_not_called()
+
+        freezer.tick(FIELD_RECONCILE_DELAY)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    mock_post_config.assert_called_once()
+    posted = mock_post_config.call_args.args[0]["fields"]
+    assert "BatteryLevel" not in posted
+    # Fields other clients enabled are kept, even since setup
+    assert "LocatedAtHome" in posted
+    assert "Odometer" in posted
+    assert stream_vehicle.fields == posted
+
+
+async def test_fields_kept_without_stream_config(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    entity_registry: er.EntityRegistry,
+    mock_stream_get_config: AsyncMock,
+) -> None:
+    """Test no fields are removed when the stream config could not load."""
+    mock_stream_get_config.side_effect = ClientError
+    entry = await setup_platform(hass, [Platform.SENSOR])
+    stream_vehicle = entry.runtime_data.vehicles[0].stream_vehicle
+    assert stream_vehicle.config_loaded
+    assert not stream_vehicle.config_known
+    # Only what this integration enabled is known, not what else is enabled
+    stream_vehicle.fields = {"BatteryLevel": {"interval_seconds": None}}
+
+    with patch(
+        "teslemetry_stream.TeslemetryStreamVehicle.post_config",
+        return_value={"response": None},
+    ) as mock_post_config:
+        entity_registry.async_update_entity(
+            "sensor.test_battery_level",
+            disabled_by=er.RegistryEntryDisabler.USER,
+        )
+        freezer.tick(FIELD_RECONCILE_DELAY)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    mock_post_config.assert_not_called()
+
+
+async def test_stream_field_options(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    mock_stream_update_config: AsyncMock,
+) -> None:
+    """Test entity options override the stream config of their fields."""
+    entry = await setup_platform(hass, [Platform.SENSOR])
+    stream_vehicle = entry.runtime_data.vehicles[0].stream_vehicle
+    stream_vehicle.fields = {
+        field: value or {}
+        for call in mock_stream_update_config.call_args_list
+        for field, value in call.args[0].get("fields", {}).items()
+    }
+    mock_stream_update_config.reset_mock()
+
+    entity_registry.async_update_entity_options(
+        "sensor.test_battery_level", DOMAIN, {CONF_STREAM_INTERVAL: 30}
+    )
+    await hass.async_block_till_done()
+    mock_stream_update_config.assert_called_once_with(
+        {"fields": {"BatteryLevel": {"interval_seconds": 30}}}
+    )
+    stream_vehicle.fields["BatteryLevel"] = {"interval_seconds": 30}
+    mock_stream_update_config.reset_mock()
+
+    # Unrelated registry changes leave the config alone
+    entity_registry.async_update_entity("sensor.test_battery_level", name="Battery")
+    await hass.async_block_till_done()
+    mock_stream_update_config.assert_not_called()
+
+    # Without the option the field returns to the default
+    entity_registry.async_update_entity_options("sensor.test_battery_level", DOMAIN, {})
+    await hass.async_block_till_done()
+    mock_stream_update_config.assert_called_once_with(
+        {"fields": {"BatteryLevel": None}}
+    )
+    stream_vehicle.fields["BatteryLevel"] = {}
+    mock_stream_update_config.reset_mock()
+
+    # Options are coerced to the types the stream config expects
+    entity_registry.async_update_entity_options(
+        "sensor.test_battery_level", DOMAIN, {CONF_STREAM_INTERVAL: "30"}
+    )
+    await hass.async_block_till_done()
+    mock_stream_update_config.assert_called_once_with(
+        {"fields": {"BatteryLevel": {"interval_seconds": 30}}}
+    )
+    stream_vehicle.fields["BatteryLevel"] = {"interval_seconds": 30}
+    mock_stream_update_config.reset_mock()
+
+    # Invalid options are ignored
+    entity_registry.async_update_entity_options(
+        "sensor.test_battery_level", DOMAIN, {CONF_STREAM_INTERVAL: 0}
+    )
+    await hass.async_block_till_done()
+    mock_stream_update_config.assert_called_once_with(
+        {"fields": {"BatteryLevel": None}}
+    )
@@ -1,6 +1,8 @@
 """Test the opt-in ClickStack log shipping (HACS-only)."""
 
 from collections.abc import AsyncGenerator
+import gzip
+import json
 import logging
 from unittest.mock import patch
 
@@ -14,6 +16,7 @@ from homeassistant.components.teslemetry.logship import (
     TeslemetryLogShipper,
     _severity_number,
     build_payload,
+    compact_record,
     get_logship,
 )
 from homeassistant.config_entries import ConfigEntryState
@@ -90,8 +93,9 @@ async def test_bounded_buffer_drops_oldest(
                 component_logger.debug("message %s", i)
 
             assert len(log_shipper._buffer) == 5
-            messages = [record.getMessage() for record in log_shipper._buffer]
+            messages = [entry.body for entry in log_shipper._buffer]
             assert messages == [f"message {i}" for i in range(3, 8)]
+            assert log_shipper.dropped == 3
         finally:
             log_shipper.async_release(force=True)
 
@@ -147,7 +151,7 @@ def test_build_payload_shape() -> None:
         "service.name": "hacs-teslemetry",
         "user.id": UNIQUE_ID,
     }
-    payload = build_payload([record], resource_attrs)
+    payload = build_payload([compact_record(record)], resource_attrs)
 
     resource_logs = payload["resourceLogs"][0]
     attrs = {a["key"]: a["value"] for a in resource_logs["resource"]["attributes"]}
@@ -182,9 +186,11 @@ async def test_flush_posts_correct_request(
     await shipper._async_flush()
 
     assert aioclient_mock.call_count == 1
-    _method, url, data, headers = aioclient_mock.mock_calls[0]
+    _method, url, body, headers = aioclient_mock.mock_calls[0]
     assert str(url) == OTLP_ENDPOINT
     assert headers["authorization"] == INGEST_KEY
+    assert headers["content-encoding"] == "gzip"
+    data = json.loads(gzip.decompress(body))
 
     log_record = data["resourceLogs"][0]["scopeLogs"][0]["logRecords"][0]
     assert log_record["body"]["stringValue"] == "shipped message"
@@ -193,6 +199,36 @@ async def test_flush_posts_correct_request(
     }
     assert resource_attrs["user.id"] == {"stringValue": UNIQUE_ID}
     assert len(shipper._buffer) == 0
+    assert shipper.sent == 1
+
+
+async def test_flush_batches_by_size(
+    hass: HomeAssistant,
+    shipper: TeslemetryLogShipper,
+    caplog: pytest.LogCaptureFixture,
+    aioclient_mock: AiohttpClientMocker,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A flush ships as many records as fit the batch size in bytes."""
+    aioclient_mock.post(OTLP_ENDPOINT, json={})
+    caplog.set_level(logging.DEBUG, logger=COMPONENT_LOGGER)
+    component_logger = logging.getLogger(COMPONENT_LOGGER)
+    component_logger.debug("short")
+    component_logger.debug("short")
+    component_logger.debug("x" * 1000)
+    # Room for the two short records, but not the long one as well
+    monkeypatch.setattr(
+        "homeassistant.components.teslemetry.logship.MAX_BATCH_BYTES", 1000
+    )
+
+    await shipper._async_flush()
+    assert shipper.sent == 2
+    assert len(shipper._buffer) == 1
+
+    # A record larger than the batch size still ships on its own
+    await shipper._async_flush()
+    assert shipper.sent == 3
+    assert len(shipper._buffer) == 0
 
 
 async def test_flush_fails_silently_on_connection_error(
@@ -209,6 +245,8 @@ async def test_flush_fails_silently_on_connection_error(
     await shipper._async_flush()  # must not raise
 
     assert len(shipper._buffer) == 0
+    assert shipper.failed == 1
+    assert shipper.sent == 0
 
 
 async def test_attach_detach_refcounting(hass: HomeAssistant) -> None:
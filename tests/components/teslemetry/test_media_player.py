@@ -2,6 +2,7 @@
 
 from unittest.mock import AsyncMock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 from syrupy.assertion import SnapshotAssertion
 from tesla_fleet_api.exceptions import InvalidCommand
@@ -15,12 +16,15 @@ from homeassistant.components.media_player import (
     SERVICE_MEDIA_PLAY,
     SERVICE_MEDIA_PREVIOUS_TRACK,
     SERVICE_VOLUME_SET,
+    MediaPlayerEntityStateAttribute,
     MediaPlayerState,
 )
 from homeassistant.const import ATTR_ENTITY_ID, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.util import dt as dt_util
 
 from . import assert_entities, assert_entities_alt, reload_platform, setup_platform
 from .const import COMMAND_ERRORS, COMMAND_OK, METADATA_NOSCOPE, VEHICLE_DATA_ALT
@@ -199,11 +203,13 @@ async def test_media_player_command_exception(hass: HomeAssistant) -> None:
 async def test_update_streaming(
     hass: HomeAssistant,
     snapshot: SnapshotAssertion,
+    freezer: FrozenDateTimeFactory,
     mock_vehicle_data: AsyncMock,
     mock_add_listener: AsyncMock,
 ) -> None:
     """Tests that the media player entities with streaming are correct."""
 
+    freezer.move_to("2024-10-04 10:55:17+00:00")
     entry = await setup_platform(hass, [Platform.MEDIA_PLAYER])
 
     # Stream update
@@ -252,3 +258,72 @@ async def test_update_streaming(
     # Ensure the restored state is the same as the previous state
     state = hass.states.get("media_player.test_media_player")
     assert state == snapshot(name="on")
+
+
+async def test_streaming_media_position_extrapolated(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_add_listener: AsyncMock,
+) -> None:
+    """Test ten minutes of playback only writes state when playback changes."""
+
+    await setup_platform(hass, [Platform.MEDIA_PLAYER])
+    entity_id = "media_player.test_media_player"
+    vin = VEHICLE_DATA_ALT["response"]["vin"]
+
+    def send(data: dict) -> None:
+        mock_add_listener.send(
+            {"vin": vin, "data": data, "createdAt": "2024-10-04T10:45:17.537Z"}
+        )
+
+    send(
+        {
+            Signal.MEDIA_PLAYBACK_STATUS: "Playing",
+            Signal.MEDIA_NOW_PLAYING_DURATION: 900000,
+            Signal.MEDIA_NOW_PLAYING_ELAPSED: 0,
+        }
+    )
+    await hass.async_block_till_done()
+    started = hass.states.get(entity_id)
+    assert started.attributes[MediaPlayerEntityStateAttribute.MEDIA_POSITION] == 0
+
+    elapsed = 0
+    playing = True
+    with patch.object(
+        Entity,
+        "async_write_ha_state",
+        autospec=True,
+        side_effect=Entity.async_write_ha_state,
+    ) as mock_write:
+        for second in range(1, 601):
+            freezer.tick()
+            if second == 400:
+                send({Signal.MEDIA_PLAYBACK_STATUS: "Paused"})
+                playing = False
+            elif second == 420:
+                send({Signal.MEDIA_PLAYBACK_STATUS: "Playing"})
+                playing = True
+            if playing:
+                elapsed += 1
+            if second == 200:
+                # Seek forward a minute
+                elapsed += 60
+            send({Signal.MEDIA_NOW_PLAYING_ELAPSED: elapsed * 1000})
+            await hass.async_block_till_done()
+
+    writes = [
+        call
+        for call in mock_write.call_args_list
+        if call.args[0].entity_id == entity_id
+    ]
+    # One write each for the seek, the pause and the resume
+    assert len(writes) == 3
+    state = hass.states.get(entity_id)
+    assert state.state == MediaPlayerState.PLAYING
+
+    # The frontend extrapolates to the position the vehicle reports
+    position = state.attributes[MediaPlayerEntityStateAttribute.MEDIA_POSITION]
+    updated_at = state.attributes[
+        MediaPlayerEntityStateAttribute.MEDIA_POSITION_UPDATED_AT
+    ]
+    assert position + (dt_util.utcnow() - updated_at).total_seconds() == elapsed
@@ -1,5 +1,8 @@
 """Test the Teslemetry sensor platform."""
 
+from copy import deepcopy
+from datetime import timedelta
+import logging
 from unittest.mock import AsyncMock
 
 from freezegun.api import FrozenDateTimeFactory
@@ -9,8 +12,10 @@ from teslemetry_stream import Signal
 
 from homeassistant.components.teslemetry.const import DOMAIN
 from homeassistant.components.teslemetry.coordinator import VEHICLE_INTERVAL
+from homeassistant.components.teslemetry.health import HEALTH_INTERVAL, RATE_WINDOW
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import (
+    ATTR_UNIT_OF_MEASUREMENT,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     Platform,
@@ -18,10 +23,12 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_component import async_update_entity
+from homeassistant.util import dt as dt_util
 from homeassistant.util.unit_conversion import PressureConverter
 
 from . import assert_entities, assert_entities_alt, setup_platform
-from .const import ENERGY_HISTORY_EMPTY, VEHICLE_DATA_ALT
+from .const import ENERGY_HISTORY_EMPTY, SITE_INFO, VEHICLE_DATA_ALT
 
 from tests.common import async_fire_time_changed
 
@@ -270,6 +277,82 @@ async def test_streaming_enum_none_clears_state(
     assert hass.states.get(entity_id).state == STATE_UNKNOWN
 
 
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_streaming_filtered_sensor(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    freezer: FrozenDateTimeFactory,
+    mock_vehicle_data: AsyncMock,
+    mock_add_listener: AsyncMock,
+) -> None:
+    """Test high rate streaming sensors honour their interval and deadband."""
+    await setup_platform(hass, [Platform.SENSOR])
+    vin = VEHICLE_DATA_ALT["response"]["vin"]
+    entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{vin}-pack_current"
+    )
+    assert entity_id is not None
+
+    def send(value: float | None) -> None:
+        mock_add_listener.send(
+            {
+                "vin": vin,
+                "data": {Signal.PACK_CURRENT: value},
+                "createdAt": "2024-10-04T10:45:17.537Z",
+            }
+        )
+
+    send(100)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "100"
+
+    # Within the deadband, held back
+    freezer.tick(timedelta(seconds=10))
+    send(102)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "100"
+
+    # A write for another reason does not leak the held back value
+    await async_update_entity(hass, entity_id)
+    assert hass.states.get(entity_id).state == "100"
+
+    # Outside the deadband, written immediately
+    send(120)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "120"
+
+    # Outside the deadband but too soon, written once the interval has passed
+    send(150)
+    send(160)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "120"
+    freezer.tick(timedelta(seconds=5))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "160"
+
+    # Within the deadband, written once the last value is too old
+    freezer.tick(timedelta(minutes=5))
+    send(161)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "161"
+
+    # A held back value is written once the last value is too old, even
+    # when no further values arrive
+    send(162)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "161"
+    freezer.tick(timedelta(minutes=5))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "162"
+
+    # None is always written immediately
+    send(None)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_UNKNOWN
+
+
 async def test_energy_history_no_time_series(
     hass: HomeAssistant,
     freezer: FrozenDateTimeFactory,
@@ -293,3 +376,127 @@ async def test_energy_history_no_time_series(
 
     state = hass.states.get(entity_id)
     assert state.state == STATE_UNAVAILABLE
+
+
+async def test_tariff_sensors_period_boundary(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the tariff sensors move to the next period at its boundary."""
+
+    freezer.move_to("2024-01-01 00:00:00+00:00")
+    await setup_platform(hass, [Platform.SENSOR])
+
+    assert hass.states.get("sensor.energy_site_buy_price").state == "0.22"
+    assert hass.states.get("sensor.energy_site_sell_price").state == "0.16"
+    assert (
+        hass.states.get("sensor.energy_site_next_price_change").state
+        == "2024-01-01T05:00:00+00:00"
+    )
+    assert hass.states.get("sensor.energy_site_next_buy_price").state == "0.198"
+
+    # Nothing changes before the boundary
+    freezer.move_to("2024-01-01 04:59:00+00:00")
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.energy_site_buy_price").state == "0.22"
+
+    freezer.move_to("2024-01-01 05:00:00+00:00")
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.energy_site_buy_price").state == "0.198"
+    assert hass.states.get("sensor.energy_site_sell_price").state == "0.08"
+    assert (
+        hass.states.get("sensor.energy_site_next_price_change").state
+        == "2024-01-02T00:00:00+00:00"
+    )
+    assert hass.states.get("sensor.energy_site_next_buy_price").state == "0.22"
+
+
+async def test_tariff_sensors_currency(
+    hass: HomeAssistant,
+    mock_site_info: AsyncMock,
+) -> None:
+    """Test the tariff price sensors use the tariff currency."""
+
+    site_info = deepcopy(SITE_INFO)
+    site_info["response"]["tariff_content_v2"]["currency"] = "AUD"
+    mock_site_info.side_effect = lambda: deepcopy(site_info)
+    await setup_platform(hass, [Platform.SENSOR])
+
+    for entity_id in (
+        "sensor.energy_site_buy_price",
+        "sensor.energy_site_sell_price",
+        "sensor.energy_site_next_buy_price",
+    ):
+        state = hass.states.get(entity_id)
+        assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == "AUD/kWh"
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_stream_health_sensors(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_add_listener: AsyncMock,
+) -> None:
+    """Test the stream health sensors follow frames, connects and errors."""
+
+    freezer.move_to("2024-01-01 00:00:00+00:00")
+    entry = await setup_platform(hass, [Platform.SENSOR])
+    vehicle = entry.runtime_data.vehicles[0]
+    stream = entry.runtime_data.stream
+
+    # Frames created one and three seconds before they are received
+    now = int(dt_util.utcnow().timestamp() * 1000)
+    for lag, data in (
+        (1000, {"BatteryLevel": 42, "FdWindow": "WindowStateClosed"}),
+        (3000, {"BatteryLevel": 43}),
+    ):
+        mock_add_listener.send(
+            {
+                "vin": vehicle.vin,
+                "data": data,
+                "createdAt": "2024-01-01T00:00:00.000Z",
+                "timestamp": now - lag,
+            }
+        )
+
+    async def _listen() -> None:
+        # The library logs and closes the stream from its listen task on errors
+        stream.health.async_set_listening()
+        stream._update_connection_listeners(True)
+        logging.getLogger("teslemetry_stream").warning("Client error: %s", "timeout")
+        stream._update_connection_listeners(False)
+        stream._update_connection_listeners(True)
+
+    await hass.async_create_task(_listen())
+    # Records from elsewhere, such as config updates, are not the stream's
+    logging.getLogger("teslemetry_stream").warning("Config update failed")
+
+    freezer.tick(HEALTH_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    window = RATE_WINDOW.total_seconds()
+    assert float(hass.states.get("sensor.test_stream_frame_rate").state) == (
+        pytest.approx(2 / window)
+    )
+    assert float(hass.states.get("sensor.test_stream_field_rate").state) == (
+        pytest.approx(3 / window)
+    )
+    assert hass.states.get("sensor.test_stream_lag").state == "1.0"
+    assert hass.states.get("sensor.test_stream_lag_95th_percentile").state == "3.0"
+    assert hass.states.get("sensor.teslemetry_stream_reconnects").state == "1"
+    assert (
+        hass.states.get("sensor.teslemetry_stream_last_error").state
+        == "Client error: timeout"
+    )
+    assert stream.health.errors == 1
+
+    # Frames leave the rates once they are older than the window
+    freezer.tick(RATE_WINDOW)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.test_stream_frame_rate").state == "0.0"
+    assert hass.states.get("sensor.test_stream_lag").state == STATE_UNKNOWN